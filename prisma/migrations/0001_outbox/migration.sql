@@ -0,0 +1,16 @@
+-- CreateEnum
+CREATE TYPE "outbox_operation" AS ENUM('upsert', 'delete');
+
+-- CreateTable
+CREATE TABLE "outbox" (
+  "id" BIGSERIAL NOT NULL,
+  "event_id" UUID NOT NULL,
+  "operation" "outbox_operation" NOT NULL,
+  "payload" TEXT,
+  "attempts" INTEGER NOT NULL DEFAULT 0,
+  "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  CONSTRAINT "outbox_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "outbox_event_id_id_idx" ON "outbox" ("event_id", "id");
@@ -0,0 +1,26 @@
+-- CreateTable
+CREATE TABLE "occurrences" (
+  "event_id" UUID NOT NULL,
+  "local_start" TIMESTAMP NOT NULL,
+  "start_utc" TIMESTAMPTZ NOT NULL,
+  "end_utc" TIMESTAMPTZ NOT NULL,
+  CONSTRAINT "occurrences_pkey" PRIMARY KEY ("event_id", "local_start")
+);
+
+-- CreateTable
+CREATE TABLE "occurrence_horizons" (
+  "id" INTEGER NOT NULL,
+  "start_utc" TIMESTAMPTZ NOT NULL,
+  "end_utc" TIMESTAMPTZ NOT NULL,
+  CONSTRAINT "occurrence_horizons_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "occurrences_start_utc_end_utc_idx" ON "occurrences" ("start_utc", "end_utc");
+
+-- CreateIndex
+CREATE INDEX "occurrences_local_start_event_id_idx" ON "occurrences" ("local_start", "event_id");
+
+-- AddForeignKey
+ALTER TABLE "occurrences"
+ADD CONSTRAINT "occurrences_event_id_fkey" FOREIGN KEY ("event_id") REFERENCES "events" ("id") ON DELETE CASCADE ON UPDATE CASCADE;
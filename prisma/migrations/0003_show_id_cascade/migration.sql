@@ -0,0 +1,7 @@
+-- DropForeignKey
+ALTER TABLE "events"
+DROP CONSTRAINT "show_id_fkey";
+
+-- AddForeignKey
+ALTER TABLE "events"
+ADD CONSTRAINT "show_id_fkey" FOREIGN KEY ("show_id") REFERENCES "shows" ("id") ON DELETE NO ACTION ON UPDATE CASCADE;
@@ -0,0 +1,18 @@
+-- CreateExtension
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
+-- AlterTable
+ALTER TABLE "shows"
+ADD COLUMN "search" TSVECTOR GENERATED ALWAYS AS (
+  setweight(to_tsvector('simple', coalesce("title", '')), 'A') ||
+  setweight(to_tsvector('simple', coalesce("description", '')), 'B')
+) STORED;
+
+-- CreateIndex
+CREATE INDEX "shows_search_idx" ON "shows" USING GIN ("search");
+
+-- CreateIndex
+CREATE INDEX "shows_title_trgm_idx" ON "shows" USING GIN ("title" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "shows_description_trgm_idx" ON "shows" USING GIN ("description" gin_trgm_ops);
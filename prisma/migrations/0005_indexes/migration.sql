@@ -0,0 +1,5 @@
+-- CreateIndex
+CREATE INDEX "events_show_id_idx" ON "events" ("show_id");
+
+-- CreateIndex
+CREATE INDEX "events_type_id_idx" ON "events" ("type", "id");
@@ -0,0 +1,2 @@
+-- AlterTable
+ALTER TABLE "outbox" ADD COLUMN "next_attempt_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP;
@@ -8,17 +8,30 @@ from litestar.openapi import OpenAPIConfig
 from litestar.plugins import PluginProtocol
 
 from beaver.api.lifespans import (
-    SapphireLifespan,
+    ConflictsLifespan,
+    OccurrencesLifespan,
+    OutboxLifespan,
+    ReadinessLifespan,
+    ReplicasLifespan,
     SuppressHTTPXLoggingLifespan,
     TestLifespan,
+    TimelineLifespan,
 )
 from beaver.api.openapi import OpenAPIConfigBuilder
 from beaver.api.plugins.pydantic import PydanticPlugin
 from beaver.api.routes.router import router
 from beaver.config.models import Config
+from beaver.services.conflicts.service import ConflictsService
 from beaver.services.data.howlite.service import HowliteService
 from beaver.services.data.sapphire.service import SapphireService
+from beaver.services.metrics.service import MetricsService
+from beaver.services.occurrences.service import OccurrencesService
+from beaver.services.outbox.service import OutboxService
+from beaver.services.readiness.service import ReadinessService
+from beaver.services.replicas.service import ReplicasService
+from beaver.services.timeline.service import TimelineService
 from beaver.state import State
+from beaver.utils.singleflight import SingleFlight
 
 
 class AppBuilder:
@@ -38,7 +51,12 @@ class AppBuilder:
         return [
             TestLifespan,
             SuppressHTTPXLoggingLifespan,
-            SapphireLifespan,
+            ReadinessLifespan,
+            ReplicasLifespan,
+            OutboxLifespan,
+            OccurrencesLifespan,
+            ConflictsLifespan,
+            TimelineLifespan,
         ]
 
     def _build_openapi_config(self) -> OpenAPIConfig:
@@ -51,12 +69,40 @@ class AppBuilder:
         ]
 
     def _build_initial_state(self) -> State:
+        howlite = HowliteService(config=self._config.howlite)
+        sapphire = SapphireService(
+            datasource={"url": self._config.sapphire.sql.url},
+            connect_timeout=self._config.sapphire.sql.engine_timeout,
+        )
+        outbox = OutboxService(
+            config=self._config.howlite.outbox, howlite=howlite, sapphire=sapphire
+        )
+
         return State(
             {
                 "config": self._config,
-                "howlite": HowliteService(config=self._config.howlite),
-                "sapphire": SapphireService(
-                    datasource={"url": self._config.sapphire.sql.url}
+                "conflicts": ConflictsService(
+                    config=self._config.conflicts, howlite=howlite, outbox=outbox
+                ),
+                "flights": SingleFlight(),
+                "howlite": howlite,
+                "metrics": MetricsService(sapphire=sapphire),
+                "occurrences": OccurrencesService(
+                    config=self._config.sapphire.occurrences,
+                    howlite=howlite,
+                    outbox=outbox,
+                    sapphire=sapphire,
+                ),
+                "outbox": outbox,
+                "readiness": ReadinessService(howlite=howlite, sapphire=sapphire),
+                "replicas": ReplicasService(
+                    config=self._config.sapphire.replicas,
+                    sql=self._config.sapphire.sql,
+                    primary=sapphire,
+                ),
+                "sapphire": sapphire,
+                "timeline": TimelineService(
+                    config=self._config.timeline, howlite=howlite, outbox=outbox
                 ),
             }
         )
@@ -0,0 +1,19 @@
+def etag(tag: str) -> str:
+    """Format a tag as a strong entity tag for the ETag header."""
+    return f'"{tag}"'
+
+
+def matching_tags(if_none_match: str | None) -> set[str]:
+    """Parse tags from the If-None-Match header, ignoring whether they are weak."""
+    if if_none_match is None:
+        return set()
+
+    tags = set()
+
+    for item in if_none_match.split(","):
+        tag = item.strip().removeprefix("W/").strip('"')
+
+        if tag:
+            tags.add(tag)
+
+    return tags
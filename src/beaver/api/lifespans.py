@@ -1,10 +1,23 @@
+import asyncio
 import logging
-from contextlib import AbstractAsyncContextManager
+from contextlib import AbstractAsyncContextManager, suppress
 from types import TracebackType
 from typing import cast, override
 
 from litestar import Litestar
 
+from beaver.services.conflicts import errors as cfe
+from beaver.services.conflicts import models as cfm
+from beaver.services.occurrences import errors as oce
+from beaver.services.occurrences import models as ocm
+from beaver.services.outbox import errors as oe
+from beaver.services.outbox import models as om
+from beaver.services.readiness import errors as rde
+from beaver.services.readiness import models as rdm
+from beaver.services.replicas import errors as rpe
+from beaver.services.replicas import models as rpm
+from beaver.services.timeline import errors as tle
+from beaver.services.timeline import models as tlm
 from beaver.state import State
 
 
@@ -60,12 +73,69 @@ class SuppressHTTPXLoggingLifespan(Lifespan):
         self.logger.disabled = self.previously_disabled
 
 
-class SapphireLifespan(Lifespan):
-    """Lifespan for Sapphire service."""
+class ReadinessLifespan(Lifespan):
+    """Lifespan that connects to databases, in the background if startup is lazy."""
+
+    async def _connect(self) -> None:
+        config = self.state.config.startup
+
+        while True:
+            request = rdm.ConnectRequest()
+
+            # Connecting again also checks howlite, so readiness follows its state
+            with suppress(rde.ServiceError):
+                await self.state.readiness.connect(request)
+
+            await asyncio.sleep(config.interval)
+
+    @override
+    async def __aenter__(self) -> None:
+        self.task = None
+
+        if not self.state.config.startup.lazy:
+            # Only sapphire is needed to start, howlite is reached in the background
+            await self.state.readiness.connect(rdm.ConnectRequest())
+
+        self.task = asyncio.create_task(self._connect())
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self.task
+
+        await self.state.readiness.disconnect(rdm.DisconnectRequest())
+
+
+class ReplicasLifespan(Lifespan):
+    """Lifespan that keeps track of replicas that can be read from."""
+
+    async def _check(self) -> None:
+        config = self.state.config.sapphire.replicas
+
+        while True:
+            request = rpm.CheckRequest()
+
+            # Until replicas are checked, reads go to the primary
+            with suppress(rpe.ServiceError):
+                await self.state.replicas.check(request)
+
+            await asyncio.sleep(config.interval)
 
     @override
     async def __aenter__(self) -> None:
-        await self.state.sapphire.__aenter__()
+        self.task = None
+
+        if self.state.replicas.enabled:
+            await self.state.replicas.connect(rpm.ConnectRequest())
+            self.task = asyncio.create_task(self._check())
 
     @override
     async def __aexit__(
@@ -74,8 +144,167 @@ class SapphireLifespan(Lifespan):
         exception: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
-        await self.state.sapphire.__aexit__(
-            exception_type,
-            exception,
-            traceback,
-        )
+        if self.task is None:
+            return
+
+        self.task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.task
+
+        await self.state.replicas.disconnect(rpm.DisconnectRequest())
+
+
+class OutboxLifespan(Lifespan):
+    """Lifespan that drains the outbox of pending writes to howlite."""
+
+    async def _drain(self) -> None:
+        config = self.state.config.howlite.outbox
+
+        while True:
+            request = om.DrainRequest(limit=config.batch)
+
+            try:
+                response = await self.state.outbox.drain(request)
+            except oe.ServiceError:
+                response = None
+
+            # Keep going while there is work, but back off when idle or failing
+            if response is None or response.failed > 0 or response.applied == 0:
+                await asyncio.sleep(config.interval)
+
+    @override
+    async def __aenter__(self) -> None:
+        self.task = None
+
+        if self.state.outbox.enabled:
+            self.task = asyncio.create_task(self._drain())
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.task
+
+
+class OccurrencesLifespan(Lifespan):
+    """Lifespan that keeps precomputed instances of events ahead of time."""
+
+    async def _extend(self) -> None:
+        config = self.state.config.sapphire.occurrences
+
+        while True:
+            request = ocm.ExtendRequest()
+
+            # Failures are retried on the next round, until then instances are expanded
+            with suppress(oce.ServiceError):
+                await self.state.occurrences.extend(request)
+
+            await asyncio.sleep(config.interval)
+
+    @override
+    async def __aenter__(self) -> None:
+        self.task = None
+
+        if self.state.occurrences.enabled:
+            self.task = asyncio.create_task(self._extend())
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.task
+
+
+class ConflictsLifespan(Lifespan):
+    """Lifespan that keeps the index of instances used to detect conflicts."""
+
+    async def _rebuild(self) -> None:
+        config = self.state.config.conflicts
+
+        while True:
+            request = cfm.RebuildRequest()
+
+            # Until the index is built, instances are expanded on the fly
+            with suppress(cfe.ServiceError):
+                await self.state.conflicts.rebuild(request)
+
+            await asyncio.sleep(config.interval)
+
+    @override
+    async def __aenter__(self) -> None:
+        self.task = None
+
+        if self.state.conflicts.enabled:
+            self.task = asyncio.create_task(self._rebuild())
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.task
+
+
+class TimelineLifespan(Lifespan):
+    """Lifespan that keeps the timeline of upcoming instances."""
+
+    async def _rebuild(self) -> None:
+        config = self.state.config.timeline
+
+        while True:
+            request = tlm.RebuildRequest()
+
+            # Until the timeline is built, instances are expanded on the fly
+            with suppress(tle.ServiceError):
+                await self.state.timeline.rebuild(request)
+
+            await asyncio.sleep(config.interval)
+
+    @override
+    async def __aenter__(self) -> None:
+        self.task = None
+
+        if self.state.timeline.enabled:
+            self.task = asyncio.create_task(self._rebuild())
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self.task
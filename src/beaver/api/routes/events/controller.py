@@ -6,6 +6,7 @@ from litestar import handlers
 from litestar.di import Provide
 from litestar.params import Body, Parameter
 from litestar.response import Response
+from litestar.status_codes import HTTP_200_OK
 
 from beaver.api.exceptions import (
     BadRequestException,
@@ -15,6 +16,7 @@ from beaver.api.exceptions import (
 from beaver.api.routes.events import errors as e
 from beaver.api.routes.events import models as m
 from beaver.api.routes.events.service import Service
+from beaver.api.streams import accepts_ndjson, ndjson
 from beaver.models.base import Jsonable, Serializable
 from beaver.services.entities.events.service import EventsService
 from beaver.services.icalendar.service import ICalendarService
@@ -27,9 +29,18 @@ class DependenciesBuilder:
     async def _build_service(self, state: State) -> Service:
         return Service(
             events=EventsService(
+                config=state.config.events,
+                conflicts=state.conflicts,
+                flights=state.flights,
                 howlite=state.howlite,
                 icalendar=ICalendarService(),
+                metrics=state.metrics,
+                occurrences=state.occurrences,
+                outbox=state.outbox,
+                raw=state.config.sapphire.raw,
+                replicas=state.replicas,
                 sapphire=state.sapphire,
+                timeline=state.timeline,
             )
         )
 
@@ -64,6 +75,12 @@ class Controller(BaseController):
                 description="Number of events to skip.",
             ),
         ] = None,
+        cursor: Annotated[
+            Jsonable[m.ListRequestCursor] | None,
+            Parameter(
+                description="Cursor of the event to continue listing after.",
+            ),
+        ] = None,
         where: Annotated[
             Jsonable[m.ListRequestWhere] | None,
             Parameter(
@@ -89,15 +106,56 @@ class Controller(BaseController):
                 description="Order to apply to the results.",
             ),
         ] = None,
+        fields: Annotated[
+            Jsonable[m.ListRequestFields] | None,
+            Parameter(
+                description="Schedule fields of events to return. Default is all.",
+            ),
+        ] = None,
+        count: Annotated[
+            Jsonable[m.ListRequestCount] | None,
+            Parameter(
+                description="Use estimated to estimate the total count faster "
+                "when there is no filter. Default is exact.",
+            ),
+        ] = None,
+        accept: Annotated[
+            str | None,
+            Parameter(
+                header="Accept",
+                description="Use application/x-ndjson to stream all matching events.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.ListResponseResults]]:
         """List events that match the request."""
+        if accepts_ndjson(accept):
+            stream_request = m.StreamRequest(
+                limit=limit.root if limit else None,
+                offset=offset.root if offset else None,
+                where=where.root if where else None,
+                query=q.root if q else None,
+                include=include.root if include else None,
+                order=order.root if order else None,
+                fields=fields.root if fields else None,
+            )
+
+            try:
+                stream_response = await service.stream(stream_request)
+            except e.ValidationError as ex:
+                raise BadRequestException from ex
+
+            return ndjson(stream_response.events)
+
         request = m.ListRequest(
             limit=limit.root if limit else 10,
             offset=offset.root if offset else None,
+            cursor=cursor.root if cursor else None,
             where=where.root if where else None,
             query=q.root if q else None,
             include=include.root if include else None,
             order=order.root if order else None,
+            fields=fields.root if fields else None,
+            count=count.root if count else "exact",
         )
 
         try:
@@ -107,6 +165,101 @@ class Controller(BaseController):
 
         return Response(Serializable(response.results))
 
+    @handlers.post(
+        "/bulk",
+        summary="Create events in bulk",
+        status_code=HTTP_200_OK,
+        raises=[BadRequestException],
+    )
+    async def bulk_create(
+        self,
+        service: Service,
+        data: Annotated[
+            Serializable[m.BulkCreateRequestData],
+            Body(
+                description="Data to create events.",
+            ),
+        ],
+        include: Annotated[
+            Jsonable[m.BulkCreateRequestInclude] | None,
+            Parameter(
+                description="Relations to include in the response.",
+            ),
+        ] = None,
+    ) -> Response[Serializable[m.BulkCreateResponseResults]]:
+        """Create new events in bulk."""
+        request = m.BulkCreateRequest(
+            data=data.root,
+            include=include.root if include else None,
+        )
+
+        try:
+            response = await service.bulk_create(request)
+        except e.ValidationError as ex:
+            raise BadRequestException from ex
+
+        return Response(Serializable(response.results))
+
+    @handlers.patch(
+        "/bulk",
+        summary="Update events in bulk",
+        raises=[BadRequestException],
+    )
+    async def bulk_update(
+        self,
+        service: Service,
+        data: Annotated[
+            Serializable[m.BulkUpdateRequestData],
+            Body(
+                description="Data to update events.",
+            ),
+        ],
+        include: Annotated[
+            Jsonable[m.BulkUpdateRequestInclude] | None,
+            Parameter(
+                description="Relations to include in the response.",
+            ),
+        ] = None,
+    ) -> Response[Serializable[m.BulkUpdateResponseResults]]:
+        """Update events in bulk."""
+        request = m.BulkUpdateRequest(
+            data=data.root,
+            include=include.root if include else None,
+        )
+
+        try:
+            response = await service.bulk_update(request)
+        except e.ValidationError as ex:
+            raise BadRequestException from ex
+
+        return Response(Serializable(response.results))
+
+    @handlers.post(
+        "/bulk/delete",
+        summary="Delete events in bulk",
+        status_code=HTTP_200_OK,
+        raises=[BadRequestException],
+    )
+    async def bulk_delete(
+        self,
+        service: Service,
+        data: Annotated[
+            Serializable[m.BulkDeleteRequestIds],
+            Body(
+                description="Identifiers of the events to delete.",
+            ),
+        ],
+    ) -> Response[Serializable[m.BulkDeleteResponseResults]]:
+        """Delete events in bulk."""
+        request = m.BulkDeleteRequest(ids=data.root)
+
+        try:
+            response = await service.bulk_delete(request)
+        except e.ValidationError as ex:
+            raise BadRequestException from ex
+
+        return Response(Serializable(response.results))
+
     @handlers.get(
         "/{id:str}",
         summary="Get event",
@@ -127,9 +280,19 @@ class Controller(BaseController):
                 description="Relations to include in the response.",
             ),
         ] = None,
+        fields: Annotated[
+            Jsonable[m.GetRequestFields] | None,
+            Parameter(
+                description="Schedule fields of the event to return. Default is all.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.GetResponseEvent]]:
         """Get an event by ID."""
-        request = m.GetRequest(id=id.root, include=include.root if include else None)
+        request = m.GetRequest(
+            id=id.root,
+            include=include.root if include else None,
+            fields=fields.root if fields else None,
+        )
 
         try:
             response = await service.get(request)
@@ -159,11 +322,18 @@ class Controller(BaseController):
                 description="Relations to include in the response.",
             ),
         ] = None,
+        reject_overlaps: Annotated[
+            Jsonable[m.CreateRequestRejectOverlaps] | None,
+            Parameter(
+                description="Whether to fail if the event would overlap other instances.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.CreateResponseEvent]]:
         """Create a new event."""
         request = m.CreateRequest(
             data=data.root,
             include=include.root if include else None,
+            reject_overlaps=reject_overlaps.root if reject_overlaps else False,
         )
 
         try:
@@ -201,12 +371,19 @@ class Controller(BaseController):
                 description="Relations to include in the response.",
             ),
         ] = None,
+        reject_overlaps: Annotated[
+            Jsonable[m.UpdateRequestRejectOverlaps] | None,
+            Parameter(
+                description="Whether to fail if the event would overlap other instances.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.UpdateResponseEvent]]:
         """Update an event by ID."""
         request = m.UpdateRequest(
             data=data.root,
             id=id.root,
             include=include.root if include else None,
+            reject_overlaps=reject_overlaps.root if reject_overlaps else False,
         )
 
         try:
@@ -246,12 +423,19 @@ class Controller(BaseController):
                 description="Relations to include in the response.",
             ),
         ] = None,
+        reject_overlaps: Annotated[
+            Jsonable[m.SplitRequestRejectOverlaps] | None,
+            Parameter(
+                description="Whether to fail if the events would overlap other instances.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.SplitResponseResult]]:
         """Split an event by ID."""
         request = m.SplitRequest(
             data=data.root,
             id=id.root,
             include=include.root if include else None,
+            reject_overlaps=reject_overlaps.root if reject_overlaps else False,
         )
 
         try:
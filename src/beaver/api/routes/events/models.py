@@ -1,11 +1,12 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from collections.abc import Set as AbstractSet
 from typing import Annotated, Literal, NotRequired, Self, TypedDict
 from uuid import UUID
 
 from pydantic import Field, PositiveInt
+from pydantic.experimental.missing_sentinel import MISSING
 
-from beaver.models.base import SerializableModel, datamodel
+from beaver.models.base import CONFIG, SerializableModel, datamodel
 from beaver.services.entities.events import models as em
 from beaver.utils.time import NaiveDatetime, Timedelta, Timezone, UTCDatetime
 
@@ -226,17 +227,19 @@ class Show(SerializableModel):
     description: str | None
     """Description of the show."""
 
-    events: Sequence["Event"] | None
+    events: Sequence["Event | PartialEvent"] | None
     """Events the show belongs to."""
 
     @classmethod
-    def map(cls, show: em.Show) -> Self:
+    def map(
+        cls, show: em.Show, fields: AbstractSet[em.EventField] | None = None
+    ) -> Self:
         """Map from internal representation."""
         return cls(
             id=show.id,
             title=show.title,
             description=show.description,
-            events=[Event.map(event) for event in show.events]
+            events=[map_event(event, fields) for event in show.events]
             if show.events is not None
             else None,
         )
@@ -298,6 +301,86 @@ class Event(SerializableModel):
         )
 
 
+class PartialEvent(SerializableModel):
+    """Event data with only the selected schedule fields."""
+
+    model_config = CONFIG | {"json_schema_serialization_defaults_required": False}
+
+    id: UUID
+    """Identifier of the event."""
+
+    type: em.EventType
+    """Type of the event."""
+
+    show_id: UUID | None
+    """Identifier of the show the event belongs to."""
+
+    show: Show | None
+    """Show the event belongs to."""
+
+    start: NaiveDatetime | MISSING = MISSING
+    """Start datetime of the event in event timezone, if selected."""
+
+    duration: Timedelta | MISSING = MISSING
+    """Duration of the event, if selected."""
+
+    timezone: Timezone | MISSING = MISSING
+    """Timezone of the event, if selected."""
+
+    recurrence: Recurrence | MISSING | None = MISSING
+    """Recurrence rule of the event, if selected."""
+
+    include: AbstractSet[Inclusion] | MISSING | None = MISSING
+    """Included instances of the event, if selected."""
+
+    exclude: AbstractSet[Exclusion] | MISSING | None = MISSING
+    """Excluded instances of the event, if selected."""
+
+    @classmethod
+    def map(
+        cls, event: em.Event | em.EventMetadata, fields: AbstractSet[em.EventField]
+    ) -> Self:
+        """Map from internal representation."""
+        show = Show.map(event.show, fields) if event.show is not None else None
+
+        # Fields that were not selected are left out of the response entirely
+        schedule = {}
+        if isinstance(event, em.Event):
+            schedule = {
+                "start": event.start,
+                "duration": event.duration,
+                "timezone": event.timezone,
+                "recurrence": Recurrence.imap(event.recurrence)
+                if event.recurrence is not None
+                else None,
+                "include": {Inclusion.imap(i) for i in event.include}  # pyright: ignore[reportUnhashable]
+                if event.include is not None
+                else None,
+                "exclude": {Exclusion.imap(e) for e in event.exclude}  # pyright: ignore[reportUnhashable]
+                if event.exclude is not None
+                else None,
+            }
+
+        return cls(
+            id=UUID(event.id),
+            type=event.type,
+            show_id=UUID(event.show_id) if event.show_id is not None else None,
+            show=show,
+            **{key: value for key, value in schedule.items() if key in fields},
+        )
+
+
+def map_event(
+    event: em.Event | em.EventMetadata,
+    fields: AbstractSet[em.EventField] | None = None,
+) -> Event | PartialEvent:
+    """Map from internal representation, keeping only the selected fields."""
+    if fields is None and isinstance(event, em.Event):
+        return Event.map(event)
+
+    return PartialEvent.map(event, fields or set())
+
+
 class EventList(SerializableModel):
     """List of events."""
 
@@ -310,7 +393,10 @@ class EventList(SerializableModel):
     offset: int | None
     """Number of events skipped."""
 
-    events: Sequence[Event]
+    cursor: str | None
+    """Cursor to fetch the next page of events, if there are more."""
+
+    events: Sequence[Event | PartialEvent]
     """Events that matched the request."""
 
 
@@ -460,10 +546,32 @@ class SplitResult(SerializableModel):
         return cls(before=Event.map(result.before), after=Event.map(result.after))
 
 
+class EventBulkUpdateInput(TypedDict):
+    """Data to update a single event in bulk."""
+
+    id: UUID
+    """Identifier of the event to update."""
+
+    data: EventUpdateInput
+    """Data to update the event."""
+
+
+class BulkResult(SerializableModel):
+    """Result of an operation on a single event in bulk."""
+
+    event: Event | None
+    """Event the operation was applied to, if it succeeded."""
+
+    error: str | None
+    """Reason the operation failed, if it did."""
+
+
 type ListRequestLimit = int | None
 
 type ListRequestOffset = int | None
 
+type ListRequestCursor = str | None
+
 type ListRequestWhere = em.EventWhereInput | None
 
 type ListRequestQuery = Query | None
@@ -472,18 +580,28 @@ type ListRequestInclude = em.EventInclude | None
 
 type ListRequestOrder = em.EventOrderByInput | Sequence[em.EventOrderByInput] | None
 
+type ListRequestFields = AbstractSet[em.EventField] | None
+
+type ListRequestCount = em.CountMode
+
 type ListResponseResults = EventList
 
+type StreamResponseEvents = AsyncIterator[Event | PartialEvent]
+
 type GetRequestId = UUID
 
 type GetRequestInclude = em.EventInclude | None
 
-type GetResponseEvent = Event
+type GetRequestFields = AbstractSet[em.EventField] | None
+
+type GetResponseEvent = Event | PartialEvent
 
 type CreateRequestData = EventCreateInput
 
 type CreateRequestInclude = em.EventInclude | None
 
+type CreateRequestRejectOverlaps = bool
+
 type CreateResponseEvent = Event
 
 type UpdateRequestData = EventUpdateInput
@@ -492,6 +610,8 @@ type UpdateRequestId = UUID
 
 type UpdateRequestInclude = em.EventInclude | None
 
+type UpdateRequestRejectOverlaps = bool
+
 type UpdateResponseEvent = Event
 
 type SplitRequestData = EventSplitInput
@@ -500,10 +620,34 @@ type SplitRequestId = UUID
 
 type SplitRequestInclude = em.EventInclude | None
 
+type SplitRequestRejectOverlaps = bool
+
 type SplitResponseResult = SplitResult
 
 type DeleteRequestId = UUID
 
+type BulkCreateRequestData = Annotated[
+    Sequence[EventCreateInput], Field(min_length=1, max_length=1000)
+]
+
+type BulkCreateRequestInclude = em.EventInclude | None
+
+type BulkCreateResponseResults = Sequence[BulkResult]
+
+type BulkUpdateRequestData = Annotated[
+    Sequence[EventBulkUpdateInput], Field(min_length=1, max_length=1000)
+]
+
+type BulkUpdateRequestInclude = em.EventInclude | None
+
+type BulkUpdateResponseResults = Sequence[BulkResult]
+
+type BulkDeleteRequestIds = Annotated[
+    Sequence[UUID], Field(min_length=1, max_length=1000)
+]
+
+type BulkDeleteResponseResults = Sequence[BulkResult]
+
 
 @datamodel
 class ListRequest:
@@ -515,6 +659,9 @@ class ListRequest:
     offset: ListRequestOffset
     """Number of events to skip."""
 
+    cursor: ListRequestCursor
+    """Cursor of the event to continue listing after."""
+
     where: ListRequestWhere
     """Filter to apply to find events."""
 
@@ -527,6 +674,12 @@ class ListRequest:
     order: ListRequestOrder
     """Order to apply to the results."""
 
+    fields: ListRequestFields
+    """Schedule fields of events to return."""
+
+    count: ListRequestCount
+    """How to count all events that match the request."""
+
 
 @datamodel
 class ListResponse:
@@ -536,6 +689,40 @@ class ListResponse:
     """List of events."""
 
 
+@datamodel
+class StreamRequest:
+    """Request to stream events."""
+
+    limit: ListRequestLimit
+    """Maximum number of events to return."""
+
+    offset: ListRequestOffset
+    """Number of events to skip."""
+
+    where: ListRequestWhere
+    """Filter to apply to find events."""
+
+    query: ListRequestQuery
+    """Advanced query to apply to find events."""
+
+    include: ListRequestInclude
+    """Relations to include in the response."""
+
+    order: ListRequestOrder
+    """Order to apply to the results."""
+
+    fields: ListRequestFields
+    """Schedule fields of events to return."""
+
+
+@datamodel
+class StreamResponse:
+    """Response for streaming events."""
+
+    events: StreamResponseEvents
+    """Stream of events."""
+
+
 @datamodel
 class GetRequest:
     """Request to get an event."""
@@ -546,6 +733,9 @@ class GetRequest:
     include: GetRequestInclude
     """Relations to include in the response."""
 
+    fields: GetRequestFields
+    """Schedule fields of events to return."""
+
 
 @datamodel
 class GetResponse:
@@ -565,6 +755,9 @@ class CreateRequest:
     include: CreateRequestInclude
     """Relations to include in the response."""
 
+    reject_overlaps: CreateRequestRejectOverlaps
+    """Whether to fail if the event would overlap instances of other events."""
+
 
 @datamodel
 class CreateResponse:
@@ -587,6 +780,9 @@ class UpdateRequest:
     include: UpdateRequestInclude
     """Relations to include in the response."""
 
+    reject_overlaps: UpdateRequestRejectOverlaps
+    """Whether to fail if the event would overlap instances of other events."""
+
 
 @datamodel
 class UpdateResponse:
@@ -609,6 +805,9 @@ class SplitRequest:
     include: SplitRequestInclude
     """Relations to include in the response."""
 
+    reject_overlaps: SplitRequestRejectOverlaps
+    """Whether to fail if the events would overlap instances of other events."""
+
 
 @datamodel
 class SplitResponse:
@@ -629,3 +828,57 @@ class DeleteRequest:
 @datamodel
 class DeleteResponse:
     """Response for deleting an event."""
+
+
+@datamodel
+class BulkCreateRequest:
+    """Request to create events in bulk."""
+
+    data: BulkCreateRequestData
+    """Data to create events."""
+
+    include: BulkCreateRequestInclude
+    """Relations to include in the response."""
+
+
+@datamodel
+class BulkCreateResponse:
+    """Response for creating events in bulk."""
+
+    results: BulkCreateResponseResults
+    """Results of creating each event, in the order of the request."""
+
+
+@datamodel
+class BulkUpdateRequest:
+    """Request to update events in bulk."""
+
+    data: BulkUpdateRequestData
+    """Data to update events."""
+
+    include: BulkUpdateRequestInclude
+    """Relations to include in the response."""
+
+
+@datamodel
+class BulkUpdateResponse:
+    """Response for updating events in bulk."""
+
+    results: BulkUpdateResponseResults
+    """Results of updating each event, in the order of the request."""
+
+
+@datamodel
+class BulkDeleteRequest:
+    """Request to delete events in bulk."""
+
+    ids: BulkDeleteRequestIds
+    """Identifiers of the events to delete."""
+
+
+@datamodel
+class BulkDeleteResponse:
+    """Response for deleting events in bulk."""
+
+    results: BulkDeleteResponseResults
+    """Results of deleting each event, in the order of the request."""
@@ -1,4 +1,5 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
+from collections.abc import Set as AbstractSet
 from contextlib import contextmanager
 
 from beaver.api.routes.events import errors as e
@@ -169,35 +170,72 @@ class Service:
 
         return edata
 
+    def _map_bulk_result(self, result: em.BulkResult) -> m.BulkResult:
+        """Map bulk operation result to external representation."""
+        return m.BulkResult(
+            event=m.Event.map(result.event) if result.event is not None else None,
+            error=(str(result.error) or type(result.error).__name__)
+            if result.error is not None
+            else None,
+        )
+
     async def list(self, request: m.ListRequest) -> m.ListResponse:
         """List events."""
-        count_request = em.CountRequest(
+        page_request = em.PageRequest(
+            limit=request.limit,
+            offset=request.offset,
+            cursor=request.cursor,
             where=request.where,
             query=request.query.map() if request.query is not None else None,
+            include=request.include,
+            order=request.order,
+            # Skip howlite entirely if no schedule fields are requested
+            schedule=request.fields is None or bool(request.fields),
+            count=request.count,
         )
 
         with self._handle_errors():
-            count_response = await self._events.count(count_request)
+            page_response = await self._events.page(page_request)
 
-        list_request = em.ListRequest(
+        return m.ListResponse(
+            results=m.EventList(
+                count=page_response.count,
+                limit=request.limit,
+                offset=request.offset,
+                cursor=page_response.cursor,
+                events=[
+                    m.map_event(event, request.fields) for event in page_response.events
+                ],
+            )
+        )
+
+    async def _stream(
+        self,
+        events: AsyncIterator[em.Event | em.EventMetadata],
+        fields: AbstractSet[em.EventField] | None,
+    ) -> AsyncGenerator[m.Event]:
+        with self._handle_errors():
+            async for event in events:
+                yield m.map_event(event, fields)
+
+    async def stream(self, request: m.StreamRequest) -> m.StreamResponse:
+        """Stream events."""
+        stream_request = em.StreamRequest(
             limit=request.limit,
             offset=request.offset,
             where=request.where,
             query=request.query.map() if request.query is not None else None,
             include=request.include,
             order=request.order,
+            # Skip howlite entirely if no schedule fields are requested
+            schedule=request.fields is None or bool(request.fields),
         )
 
         with self._handle_errors():
-            list_response = await self._events.list(list_request)
+            stream_response = await self._events.stream(stream_request)
 
-        return m.ListResponse(
-            results=m.EventList(
-                count=count_response.count,
-                limit=request.limit,
-                offset=request.offset,
-                events=[m.Event.map(event) for event in list_response.events],
-            )
+        return m.StreamResponse(
+            events=self._stream(stream_response.events, request.fields)
         )
 
     async def get(self, request: m.GetRequest) -> m.GetResponse:
@@ -207,17 +245,23 @@ class Service:
         )
 
         with self._handle_errors():
-            get_response = await self._events.get(get_request)
+            # Skip howlite entirely if no schedule fields are requested
+            if request.fields is not None and not request.fields:
+                get_response = await self._events.get_metadata(get_request)
+            else:
+                get_response = await self._events.get(get_request)
 
         if get_response.event is None:
             raise e.NotFoundError
 
-        return m.GetResponse(event=m.Event.map(get_response.event))
+        return m.GetResponse(event=m.map_event(get_response.event, request.fields))
 
     async def create(self, request: m.CreateRequest) -> m.CreateResponse:
         """Create event."""
         create_request = em.CreateRequest(
-            data=self._map_event_create_input(request.data), include=request.include
+            data=self._map_event_create_input(request.data),
+            include=request.include,
+            reject_overlaps=request.reject_overlaps,
         )
 
         with self._handle_errors():
@@ -231,6 +275,7 @@ class Service:
             data=self._map_event_update_input(request.data),
             where={"id": str(request.id)},
             include=request.include,
+            reject_overlaps=request.reject_overlaps,
         )
 
         with self._handle_errors():
@@ -247,6 +292,7 @@ class Service:
             data=self._map_event_split_input(request.data),
             where={"id": str(request.id)},
             include=request.include,
+            reject_overlaps=request.reject_overlaps,
         )
 
         with self._handle_errors():
@@ -268,3 +314,56 @@ class Service:
             raise e.NotFoundError
 
         return m.DeleteResponse()
+
+    async def bulk_create(self, request: m.BulkCreateRequest) -> m.BulkCreateResponse:
+        """Create events in bulk."""
+        bulk_create_request = em.BulkCreateRequest(
+            data=[self._map_event_create_input(data) for data in request.data],
+            include=request.include,
+        )
+
+        with self._handle_errors():
+            bulk_create_response = await self._events.bulk_create(bulk_create_request)
+
+        return m.BulkCreateResponse(
+            results=[
+                self._map_bulk_result(result) for result in bulk_create_response.results
+            ]
+        )
+
+    async def bulk_update(self, request: m.BulkUpdateRequest) -> m.BulkUpdateResponse:
+        """Update events in bulk."""
+        bulk_update_request = em.BulkUpdateRequest(
+            items=[
+                em.BulkUpdateItem(
+                    data=self._map_event_update_input(item["data"]),
+                    where={"id": str(item["id"])},
+                )
+                for item in request.data
+            ],
+            include=request.include,
+        )
+
+        with self._handle_errors():
+            bulk_update_response = await self._events.bulk_update(bulk_update_request)
+
+        return m.BulkUpdateResponse(
+            results=[
+                self._map_bulk_result(result) for result in bulk_update_response.results
+            ]
+        )
+
+    async def bulk_delete(self, request: m.BulkDeleteRequest) -> m.BulkDeleteResponse:
+        """Delete events in bulk."""
+        bulk_delete_request = em.BulkDeleteRequest(
+            where=[{"id": str(event_id)} for event_id in request.ids], include=None
+        )
+
+        with self._handle_errors():
+            bulk_delete_response = await self._events.bulk_delete(bulk_delete_request)
+
+        return m.BulkDeleteResponse(
+            results=[
+                self._map_bulk_result(result) for result in bulk_delete_response.results
+            ]
+        )
@@ -3,10 +3,13 @@ from typing import Annotated
 
 from litestar import Controller as BaseController
 from litestar import handlers
+from litestar.datastructures import ResponseHeader
 from litestar.di import Provide
 from litestar.params import Body, Parameter
 from litestar.response import Response
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 
+from beaver.api.etags import etag, matching_tags
 from beaver.api.exceptions import (
     BadRequestException,
     ConflictException,
@@ -15,6 +18,7 @@ from beaver.api.exceptions import (
 from beaver.api.routes.instances import errors as e
 from beaver.api.routes.instances import models as m
 from beaver.api.routes.instances.service import Service
+from beaver.api.streams import accepts_ndjson, ndjson
 from beaver.models.base import Jsonable, Serializable
 from beaver.services.entities.events.service import EventsService
 from beaver.services.entities.instances.service import InstancesService
@@ -29,12 +33,25 @@ class DependenciesBuilder:
     async def _build_service(self, state: State) -> Service:
         return Service(
             instances=InstancesService(
+                config=state.config.instances,
+                conflicts=state.conflicts,
                 events=EventsService(
+                    config=state.config.events,
+                    conflicts=state.conflicts,
+                    flights=state.flights,
                     howlite=state.howlite,
                     icalendar=ICalendarService(),
+                    metrics=state.metrics,
+                    occurrences=state.occurrences,
+                    outbox=state.outbox,
+                    raw=state.config.sapphire.raw,
+                    replicas=state.replicas,
                     sapphire=state.sapphire,
+                    timeline=state.timeline,
                 ),
                 icalendar=ICalendarService(),
+                occurrences=state.occurrences,
+                timeline=state.timeline,
             )
         )
 
@@ -69,6 +86,18 @@ class Controller(BaseController):
                 description="End datetime in UTC to filter instances. Default is now.",
             ),
         ] = None,
+        limit: Annotated[
+            Jsonable[m.ListRequestLimit] | None,
+            Parameter(
+                description="Maximum number of instances to return. Default and maximum is 1000.",
+            ),
+        ] = None,
+        cursor: Annotated[
+            Jsonable[m.ListRequestCursor] | None,
+            Parameter(
+                description="Cursor of the instance to continue listing after.",
+            ),
+        ] = None,
         where: Annotated[
             Jsonable[m.ListRequestWhere] | None,
             Parameter(
@@ -87,11 +116,37 @@ class Controller(BaseController):
                 description="Order to apply to the results.",
             ),
         ] = None,
+        accept: Annotated[
+            str | None,
+            Parameter(
+                header="Accept",
+                description="Use application/x-ndjson to stream all matching instances.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.ListResponseResults]]:
         """List instances."""
+        if accepts_ndjson(accept):
+            stream_request = m.StreamRequest(
+                start=start.root if start else awareutcnow(),
+                end=end.root if end else awareutcnow(),
+                limit=limit.root if limit else None,
+                where=where.root if where else None,
+                include=include.root if include else None,
+                order=order.root if order else {"start": "asc"},
+            )
+
+            try:
+                stream_response = await service.stream(stream_request)
+            except e.ValidationError as ex:
+                raise BadRequestException from ex
+
+            return ndjson(stream_response.instances)
+
         request = m.ListRequest(
             start=start.root if start else awareutcnow(),
             end=end.root if end else awareutcnow(),
+            limit=limit.root if limit else None,
+            cursor=cursor.root if cursor else None,
             where=where.root if where else None,
             include=include.root if include else None,
             order=order.root if order else {"start": "asc"},
@@ -104,6 +159,148 @@ class Controller(BaseController):
 
         return Response(Serializable(response.results))
 
+    @handlers.get(
+        path="/conflicts",
+        summary="Find conflicting instances",
+        raises=[BadRequestException],
+    )
+    async def conflicts(
+        self,
+        service: Service,
+        start: Annotated[
+            Jsonable[m.ConflictsRequestStart],
+            Parameter(
+                description="Start datetime in UTC of the time range to check.",
+            ),
+        ],
+        end: Annotated[
+            Jsonable[m.ConflictsRequestEnd],
+            Parameter(
+                description="End datetime in UTC of the time range to check.",
+            ),
+        ],
+        include: Annotated[
+            Jsonable[m.ConflictsRequestInclude] | None,
+            Parameter(
+                description="Relations to include in the response.",
+            ),
+        ] = None,
+    ) -> Response[Serializable[m.ConflictsResponseInstances]]:
+        """Find instances that overlap a time range."""
+        request = m.ConflictsRequest(
+            start=start.root,
+            end=end.root,
+            include=include.root if include else None,
+        )
+
+        try:
+            response = await service.conflicts(request)
+        except e.ValidationError as ex:
+            raise BadRequestException from ex
+
+        return Response(Serializable(response.instances))
+
+    @handlers.get(
+        path="/now",
+        summary="Get current and next instances",
+        raises=[BadRequestException],
+        response_headers=[
+            ResponseHeader(
+                name="Cache-Control",
+                value="no-cache",
+                required=True,
+            ),
+            ResponseHeader(
+                name="ETag",
+                description="Tag identifying the returned instances.",
+                required=True,
+            ),
+        ],
+    )
+    async def now(
+        self,
+        service: Service,
+        at: Annotated[
+            Jsonable[m.NowRequestAt] | None,
+            Parameter(
+                description="Datetime in UTC to look up instances at. Default is now.",
+            ),
+        ] = None,
+        next: Annotated[  # noqa: A002
+            Jsonable[m.NowRequestNext] | None,
+            Parameter(
+                description="Number of upcoming instances to return. Default is 1.",
+            ),
+        ] = None,
+        include: Annotated[
+            Jsonable[m.NowRequestInclude] | None,
+            Parameter(
+                description="Relations to include in the response.",
+            ),
+        ] = None,
+        if_none_match: Annotated[
+            str | None,
+            Parameter(
+                header="If-None-Match",
+                description="Tags of timelines the client already has.",
+            ),
+        ] = None,
+    ) -> Response[Serializable[m.NowResponseTimeline]]:
+        """Get instances that are ongoing at and start after a point in time."""
+        request = m.NowRequest(
+            at=at.root if at else awareutcnow(),
+            next=next.root if next else 1,
+            include=include.root if include else None,
+            tags=matching_tags(if_none_match),
+        )
+
+        try:
+            response = await service.now(request)
+        except e.ValidationError as ex:
+            raise BadRequestException from ex
+
+        headers = {"Cache-Control": "no-cache", "ETag": etag(response.tag)}
+
+        if response.timeline is None:
+            return Response(None, status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(Serializable(response.timeline), headers=headers)
+
+    @handlers.post(
+        path="/lookup",
+        summary="Look up instances",
+        status_code=HTTP_200_OK,
+        raises=[BadRequestException],
+    )
+    async def lookup(
+        self,
+        service: Service,
+        data: Annotated[
+            Serializable[m.LookupRequestKeys],
+            Body(
+                description="Keys of the instances to look up.",
+            ),
+        ],
+        include: Annotated[
+            Jsonable[m.LookupRequestInclude] | None,
+            Parameter(
+                description="Relations to include in the response.",
+            ),
+        ] = None,
+    ) -> Response[Serializable[m.LookupResponseInstances]]:
+        """Look up many instances at once, returning null for missing ones."""
+        request = m.LookupRequest(
+            keys=data.root,
+            include=include.root if include else None,
+        )
+
+        try:
+            response = await service.lookup(request)
+        except e.ValidationError as ex:
+            raise BadRequestException from ex
+
+        return Response(Serializable(response.instances))
+
     @handlers.get(
         path="/{eventId:str}/{start:str}",
         summary="Get instance",
@@ -237,7 +434,7 @@ class Controller(BaseController):
     @handlers.delete(
         path="/{eventId:str}/{start:str}",
         summary="Delete instance",
-        raises=[BadRequestException, NotFoundException],
+        raises=[BadRequestException, NotFoundException, ConflictException],
     )
     async def delete(
         self,
@@ -263,6 +460,8 @@ class Controller(BaseController):
 
         try:
             await service.delete(request)
+        except e.ConflictError as ex:
+            raise ConflictException from ex
         except e.ValidationError as ex:
             raise BadRequestException from ex
         except e.NotFoundError as ex:
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from collections.abc import Set as AbstractSet
 from typing import Annotated, Literal, Self
 from uuid import UUID
@@ -289,10 +289,48 @@ class InstanceList(SerializableModel):
     end: UTCDatetime
     """End datetime in UTC used to filter instances."""
 
+    limit: int | None
+    """Maximum number of returned instances."""
+
+    cursor: str | None
+    """Cursor to fetch the next page of instances, if there are more."""
+
     instances: Sequence[Instance]
     """Instances that matched the request."""
 
 
+class Timeline(SerializableModel):
+    """Instances around a point in time."""
+
+    current: Sequence[Instance]
+    """Instances that are ongoing at the point in time."""
+
+    next: Sequence[Instance]
+    """Instances that start after the point in time."""
+
+    @classmethod
+    def map(cls, timeline: im.Timeline) -> Self:
+        """Map from internal representation."""
+        return cls(
+            current=[Instance.map(instance) for instance in timeline.current],
+            next=[Instance.map(instance) for instance in timeline.next],
+        )
+
+
+class InstanceKey(SerializableModel):
+    """Key identifying an instance."""
+
+    event_id: UUID
+    """Identifier of the event the instance belongs to."""
+
+    start: NaiveDatetime
+    """Start datetime of the instance in event timezone."""
+
+    def map(self) -> im.InstanceWhereUniqueInput:
+        """Map to internal representation."""
+        return {"event_id": str(self.event_id), "start": self.start}
+
+
 class InstanceCreateInput(SerializableModel):
     """Data to create an instance."""
 
@@ -318,6 +356,10 @@ type ListRequestStart = UTCDatetime
 
 type ListRequestEnd = UTCDatetime
 
+type ListRequestLimit = int | None
+
+type ListRequestCursor = str | None
+
 type ListRequestWhere = im.InstanceWhereInput | None
 
 type ListRequestInclude = im.InstanceInclude | None
@@ -328,6 +370,36 @@ type ListRequestOrder = (
 
 type ListResponseResults = InstanceList
 
+type StreamResponseInstances = AsyncIterator[Instance]
+
+type ConflictsRequestStart = UTCDatetime
+
+type ConflictsRequestEnd = UTCDatetime
+
+type ConflictsRequestInclude = im.InstanceInclude | None
+
+type ConflictsResponseInstances = Sequence[Instance]
+
+type NowRequestAt = UTCDatetime
+
+type NowRequestNext = Annotated[int, Field(ge=0, le=100)]
+
+type NowRequestInclude = im.InstanceInclude | None
+
+type NowRequestTags = AbstractSet[str]
+
+type NowResponseTag = str
+
+type NowResponseTimeline = Timeline | None
+
+type LookupRequestKeys = Annotated[
+    Sequence[InstanceKey], Field(min_length=1, max_length=1000)
+]
+
+type LookupRequestInclude = im.InstanceInclude | None
+
+type LookupResponseInstances = Sequence[Instance | None]
+
 type GetRequestEventId = UUID
 
 type GetRequestStart = NaiveDatetime
@@ -367,6 +439,12 @@ class ListRequest:
     end: ListRequestEnd
     """End datetime in UTC to filter instances."""
 
+    limit: ListRequestLimit
+    """Maximum number of instances to return."""
+
+    cursor: ListRequestCursor
+    """Cursor of the instance to continue listing after."""
+
     where: ListRequestWhere
     """Filter to apply to find instances."""
 
@@ -385,6 +463,106 @@ class ListResponse:
     """List of instances."""
 
 
+@datamodel
+class StreamRequest:
+    """Request to stream instances."""
+
+    start: ListRequestStart
+    """Start datetime in UTC to filter instances."""
+
+    end: ListRequestEnd
+    """End datetime in UTC to filter instances."""
+
+    limit: ListRequestLimit
+    """Maximum number of instances to return."""
+
+    where: ListRequestWhere
+    """Filter to apply to find instances."""
+
+    include: ListRequestInclude
+    """Relations to include in the response."""
+
+    order: ListRequestOrder
+    """Order to apply to the results."""
+
+
+@datamodel
+class StreamResponse:
+    """Response for streaming instances."""
+
+    instances: StreamResponseInstances
+    """Stream of instances."""
+
+
+@datamodel
+class ConflictsRequest:
+    """Request to find instances that overlap a time range."""
+
+    start: ConflictsRequestStart
+    """Start datetime in UTC of the time range."""
+
+    end: ConflictsRequestEnd
+    """End datetime in UTC of the time range."""
+
+    include: ConflictsRequestInclude
+    """Relations to include in the response."""
+
+
+@datamodel
+class ConflictsResponse:
+    """Response for finding instances that overlap a time range."""
+
+    instances: ConflictsResponseInstances
+    """Instances that overlap the time range."""
+
+
+@datamodel
+class NowRequest:
+    """Request to get instances around a point in time."""
+
+    at: NowRequestAt
+    """Datetime in UTC to look up instances at."""
+
+    next: NowRequestNext
+    """Number of instances starting after the point in time to return."""
+
+    include: NowRequestInclude
+    """Relations to include in the response."""
+
+    tags: NowRequestTags
+    """Tags of timelines the client already has."""
+
+
+@datamodel
+class NowResponse:
+    """Response for getting instances around a point in time."""
+
+    tag: NowResponseTag
+    """Tag identifying the instances in the timeline."""
+
+    timeline: NowResponseTimeline
+    """Instances around the point in time, unless the client already has them."""
+
+
+@datamodel
+class LookupRequest:
+    """Request to look up many instances at once."""
+
+    keys: LookupRequestKeys
+    """Keys of the instances to look up."""
+
+    include: LookupRequestInclude
+    """Relations to include in the response."""
+
+
+@datamodel
+class LookupResponse:
+    """Response for looking up many instances at once."""
+
+    instances: LookupResponseInstances
+    """Instances in the order of the keys, or nothing if they don't exist."""
+
+
 @datamodel
 class GetRequest:
     """Request to get an instance."""
@@ -1,4 +1,4 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
 from contextlib import contextmanager
 
 from beaver.api.routes.instances import errors as e
@@ -30,6 +30,8 @@ class Service:
         list_request = im.ListRequest(
             start=request.start,
             end=request.end,
+            limit=request.limit,
+            cursor=request.cursor,
             where=request.where,
             include=request.include,
             order=request.order,
@@ -42,12 +44,87 @@ class Service:
             results=m.InstanceList(
                 start=request.start,
                 end=request.end,
+                limit=request.limit,
+                cursor=list_response.cursor,
                 instances=[
                     m.Instance.map(instance) for instance in list_response.instances
                 ],
             )
         )
 
+    async def _stream(
+        self, instances: AsyncIterator[im.Instance]
+    ) -> AsyncGenerator[m.Instance]:
+        with self._handle_errors():
+            async for instance in instances:
+                yield m.Instance.map(instance)
+
+    async def stream(self, request: m.StreamRequest) -> m.StreamResponse:
+        """Stream instances."""
+        stream_request = im.StreamRequest(
+            start=request.start,
+            end=request.end,
+            limit=request.limit,
+            where=request.where,
+            include=request.include,
+            order=request.order,
+        )
+
+        with self._handle_errors():
+            stream_response = await self._instances.stream(stream_request)
+
+        return m.StreamResponse(instances=self._stream(stream_response.instances))
+
+    async def conflicts(self, request: m.ConflictsRequest) -> m.ConflictsResponse:
+        """Find instances that overlap a time range."""
+        conflicts_request = im.ConflictsRequest(
+            start=request.start, end=request.end, include=request.include
+        )
+
+        with self._handle_errors():
+            conflicts_response = await self._instances.conflicts(conflicts_request)
+
+        return m.ConflictsResponse(
+            instances=[
+                m.Instance.map(instance) for instance in conflicts_response.instances
+            ]
+        )
+
+    async def now(self, request: m.NowRequest) -> m.NowResponse:
+        """Get instances around a point in time."""
+        now_request = im.NowRequest(
+            at=request.at,
+            next=request.next,
+            include=request.include,
+            tags=request.tags,
+        )
+
+        with self._handle_errors():
+            now_response = await self._instances.now(now_request)
+
+        timeline = now_response.timeline
+
+        return m.NowResponse(
+            tag=now_response.tag,
+            timeline=m.Timeline.map(timeline) if timeline is not None else None,
+        )
+
+    async def lookup(self, request: m.LookupRequest) -> m.LookupResponse:
+        """Look up many instances at once."""
+        lookup_request = im.LookupRequest(
+            where=[key.map() for key in request.keys], include=request.include
+        )
+
+        with self._handle_errors():
+            lookup_response = await self._instances.lookup(lookup_request)
+
+        return m.LookupResponse(
+            instances=[
+                m.Instance.map(instance) if instance is not None else None
+                for instance in lookup_response.instances
+            ]
+        )
+
     async def get(self, request: m.GetRequest) -> m.GetResponse:
         """Get instance."""
         get_request = im.GetRequest(
@@ -0,0 +1,51 @@
+from collections.abc import Mapping
+
+from litestar import Controller as BaseController
+from litestar import handlers
+from litestar.datastructures import ResponseHeader
+from litestar.di import Provide
+from litestar.response import Response
+
+from beaver.api.routes.metrics import models as m
+from beaver.api.routes.metrics.service import Service
+from beaver.models.base import Serializable
+from beaver.state import State
+
+
+class DependenciesBuilder:
+    """Builder for the dependencies of the controller."""
+
+    async def _build_service(self, state: State) -> Service:
+        return Service(metrics=state.metrics)
+
+    def build(self) -> Mapping[str, Provide]:
+        """Build the dependencies."""
+        return {
+            "service": Provide(self._build_service),
+        }
+
+
+class Controller(BaseController):
+    """Controller for the metrics endpoint."""
+
+    dependencies = DependenciesBuilder().build()
+
+    @handlers.get(
+        summary="Get metrics",
+        response_headers=[
+            ResponseHeader(
+                name="Cache-Control",
+                value="no-store",
+                required=True,
+            ),
+        ],
+    )
+    async def get(
+        self, service: Service
+    ) -> Response[Serializable[m.GetResponseMetrics]]:
+        """Get metrics collected since the service started."""
+        request = m.GetRequest()
+
+        response = await service.get(request)
+
+        return Response(Serializable(response.metrics))
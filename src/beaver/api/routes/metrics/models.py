@@ -0,0 +1,61 @@
+from collections.abc import Mapping
+from typing import Self
+
+from beaver.models.base import SerializableModel, datamodel
+from beaver.services.metrics import models as mm
+
+
+class Summary(SerializableModel):
+    """Summary of observed values of a metric."""
+
+    count: int
+    """Number of observed values."""
+
+    total: float
+    """Sum of observed values."""
+
+    max: float
+    """Largest observed value."""
+
+    p50: float
+    """Median of recently observed values."""
+
+    p99: float
+    """99th percentile of recently observed values."""
+
+    @classmethod
+    def map(cls, summary: mm.Summary) -> Self:
+        """Map from internal representation."""
+        return cls(
+            count=summary.count,
+            total=summary.total,
+            max=summary.max,
+            p50=summary.p50,
+            p99=summary.p99,
+        )
+
+
+class Metrics(SerializableModel):
+    """Metrics of the service."""
+
+    summaries: Mapping[str, Summary]
+    """Summaries of metrics by name."""
+
+    gauges: Mapping[str, float]
+    """Current values of metrics by name."""
+
+
+type GetResponseMetrics = Metrics
+
+
+@datamodel
+class GetRequest:
+    """Request to get metrics."""
+
+
+@datamodel
+class GetResponse:
+    """Response for getting metrics."""
+
+    metrics: GetResponseMetrics
+    """Metrics of the service."""
@@ -0,0 +1,39 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from beaver.api.routes.metrics import errors as e
+from beaver.api.routes.metrics import models as m
+from beaver.services.metrics import errors as me
+from beaver.services.metrics import models as mm
+from beaver.services.metrics.service import MetricsService
+
+
+class Service:
+    """Service for the metrics endpoint."""
+
+    def __init__(self, metrics: MetricsService) -> None:
+        self._metrics = metrics
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except me.ServiceError as ex:
+            raise e.ServiceError from ex
+
+    async def get(self, request: m.GetRequest) -> m.GetResponse:
+        """Get metrics."""
+        get_request = mm.GetRequest()
+
+        with self._handle_errors():
+            get_response = await self._metrics.get(get_request)
+
+        return m.GetResponse(
+            metrics=m.Metrics(
+                summaries={
+                    name: m.Summary.map(summary)
+                    for name, summary in get_response.summaries.items()
+                },
+                gauges=get_response.gauges,
+            )
+        )
@@ -6,16 +6,19 @@ from litestar.datastructures import ResponseHeader
 from litestar.di import Provide
 from litestar.status_codes import HTTP_204_NO_CONTENT
 
+from beaver.api.exceptions import ServiceUnavailableException
+from beaver.api.routes.ping import errors as e
 from beaver.api.routes.ping import models as m
 from beaver.api.routes.ping.service import Service
 from beaver.services.ping.service import PingService
+from beaver.state import State
 
 
 class DependenciesBuilder:
     """Builder for the dependencies of the controller."""
 
-    async def _build_service(self) -> Service:
-        return Service(ping=PingService())
+    async def _build_service(self, state: State) -> Service:
+        return Service(ping=PingService(readiness=state.readiness))
 
     def build(self) -> Mapping[str, Provide]:
         """Build the dependencies."""
@@ -32,6 +35,7 @@ class Controller(BaseController):
     @handlers.get(
         summary="Ping",
         status_code=HTTP_204_NO_CONTENT,
+        raises=[ServiceUnavailableException],
         response_headers=[
             ResponseHeader(
                 name="Cache-Control",
@@ -44,11 +48,15 @@ class Controller(BaseController):
         """Ping."""
         request = m.PingRequest()
 
-        await service.ping(request)
+        try:
+            await service.ping(request)
+        except e.NotReadyError as ex:
+            raise ServiceUnavailableException from ex
 
     @handlers.head(
         summary="Ping headers",
         status_code=HTTP_204_NO_CONTENT,
+        raises=[ServiceUnavailableException],
         response_headers=[
             ResponseHeader(
                 name="Cache-Control",
@@ -61,4 +69,7 @@ class Controller(BaseController):
         """Ping headers."""
         request = m.HeadPingRequest()
 
-        await service.headping(request)
+        try:
+            await service.headping(request)
+        except e.NotReadyError as ex:
+            raise ServiceUnavailableException from ex
@@ -18,6 +18,8 @@ class Service:
     def _handle_errors(self) -> Generator[None]:
         try:
             yield
+        except pe.NotReadyError as ex:
+            raise e.NotReadyError from ex
         except pe.ServiceError as ex:
             raise e.ServiceError from ex
 
@@ -32,4 +34,9 @@ class Service:
 
     async def headping(self, request: m.HeadPingRequest) -> m.HeadPingResponse:
         """Ping headers."""
+        ping_request = pm.PingRequest()
+
+        with self._handle_errors():
+            await self._ping.ping(ping_request)
+
         return m.HeadPingResponse()
@@ -2,6 +2,7 @@ from litestar import Router
 
 from beaver.api.routes.events.router import router as events
 from beaver.api.routes.instances.router import router as instances
+from beaver.api.routes.metrics.router import router as metrics
 from beaver.api.routes.ping.router import router as ping
 from beaver.api.routes.shows.router import router as shows
 from beaver.api.routes.sse.router import router as sse
@@ -12,6 +13,7 @@ router = Router(
     route_handlers=[
         events,
         instances,
+        metrics,
         ping,
         shows,
         sse,
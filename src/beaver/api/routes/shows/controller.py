@@ -25,7 +25,18 @@ class DependenciesBuilder:
 
     async def _build_service(self, state: State) -> Service:
         return Service(
-            shows=ShowsService(howlite=state.howlite, sapphire=state.sapphire)
+            shows=ShowsService(
+                config=state.config.sapphire.raw,
+                conflicts=state.conflicts,
+                flights=state.flights,
+                howlite=state.howlite,
+                metrics=state.metrics,
+                occurrences=state.occurrences,
+                outbox=state.outbox,
+                replicas=state.replicas,
+                sapphire=state.sapphire,
+                timeline=state.timeline,
+            )
         )
 
     def build(self) -> Mapping[str, Provide]:
@@ -59,6 +70,12 @@ class Controller(BaseController):
                 description="Number of shows to skip.",
             ),
         ] = None,
+        cursor: Annotated[
+            Jsonable[m.ListRequestCursor] | None,
+            Parameter(
+                description="Cursor of the show to continue listing after.",
+            ),
+        ] = None,
         where: Annotated[
             Jsonable[m.ListRequestWhere] | None,
             Parameter(
@@ -77,14 +94,31 @@ class Controller(BaseController):
                 description="Order to apply to the results.",
             ),
         ] = None,
+        fields: Annotated[
+            Jsonable[m.ListRequestFields] | None,
+            Parameter(
+                description="Schedule fields of included events to return. "
+                "Default is all.",
+            ),
+        ] = None,
+        count: Annotated[
+            Jsonable[m.ListRequestCount] | None,
+            Parameter(
+                description="Use estimated to estimate the total count faster "
+                "when there is no filter. Default is exact.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.ListResponseResults]]:
         """List shows that match the request."""
         request = m.ListRequest(
             limit=limit.root if limit else 10,
             offset=offset.root if offset else None,
+            cursor=cursor.root if cursor else None,
             where=where.root if where else None,
             include=include.root if include else None,
             order=order.root if order else None,
+            fields=fields.root if fields else None,
+            count=count.root if count else "exact",
         )
 
         try:
@@ -94,6 +128,70 @@ class Controller(BaseController):
 
         return Response(Serializable(response.results))
 
+    @handlers.get(
+        "/search",
+        summary="Search shows",
+        raises=[BadRequestException],
+    )
+    async def search(  # noqa: PLR0913
+        self,
+        service: Service,
+        text: Annotated[
+            Jsonable[m.SearchRequestText],
+            Parameter(
+                description="Text to search for in titles and descriptions.",
+            ),
+        ],
+        limit: Annotated[
+            Jsonable[m.SearchRequestLimit] | None,
+            Parameter(
+                description="Maximum number of shows to return. Default is 10.",
+            ),
+        ] = None,
+        where: Annotated[
+            Jsonable[m.SearchRequestWhere] | None,
+            Parameter(
+                description="Filter to apply to find shows.",
+            ),
+        ] = None,
+        include: Annotated[
+            Jsonable[m.SearchRequestInclude] | None,
+            Parameter(
+                description="Relations to include in the response.",
+            ),
+        ] = None,
+        fields: Annotated[
+            Jsonable[m.SearchRequestFields] | None,
+            Parameter(
+                description="Schedule fields of included events to return. "
+                "Default is all.",
+            ),
+        ] = None,
+        highlight: Annotated[
+            Jsonable[m.SearchRequestHighlight] | None,
+            Parameter(
+                description="Whether to mark matches in the text of shows. "
+                "Default is false.",
+            ),
+        ] = None,
+    ) -> Response[Serializable[m.SearchResponseResults]]:
+        """Search shows by title and description, most relevant first."""
+        request = m.SearchRequest(
+            text=text.root,
+            limit=limit.root if limit else 10,
+            where=where.root if where else None,
+            include=include.root if include else None,
+            fields=fields.root if fields else None,
+            highlight=highlight.root if highlight else False,
+        )
+
+        try:
+            response = await service.search(request)
+        except e.ValidationError as ex:
+            raise BadRequestException from ex
+
+        return Response(Serializable(response.results))
+
     @handlers.get(
         "/{id:str}",
         summary="Get show",
@@ -114,9 +212,20 @@ class Controller(BaseController):
                 description="Relations to include in the response.",
             ),
         ] = None,
+        fields: Annotated[
+            Jsonable[m.GetRequestFields] | None,
+            Parameter(
+                description="Schedule fields of included events to return. "
+                "Default is all.",
+            ),
+        ] = None,
     ) -> Response[Serializable[m.GetResponseShow]]:
         """Get a show by ID."""
-        request = m.GetRequest(id=id.root, include=include.root if include else None)
+        request = m.GetRequest(
+            id=id.root,
+            include=include.root if include else None,
+            fields=fields.root if fields else None,
+        )
 
         try:
             response = await service.get(request)
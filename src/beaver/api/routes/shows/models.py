@@ -4,8 +4,9 @@ from typing import Annotated, Literal, Self
 from uuid import UUID
 
 from pydantic import Field, PositiveInt
+from pydantic.experimental.missing_sentinel import MISSING
 
-from beaver.models.base import SerializableModel, datamodel
+from beaver.models.base import CONFIG, SerializableModel, datamodel
 from beaver.services.entities.shows import models as sm
 from beaver.utils.time import NaiveDatetime, Timedelta, Timezone
 
@@ -226,6 +227,86 @@ class Event(SerializableModel):
         )
 
 
+class PartialEvent(SerializableModel):
+    """Event data with only the selected schedule fields."""
+
+    model_config = CONFIG | {"json_schema_serialization_defaults_required": False}
+
+    id: UUID
+    """Identifier of the event."""
+
+    type: sm.EventType
+    """Type of the event."""
+
+    show_id: UUID | None
+    """Identifier of the show the event belongs to."""
+
+    show: "Show | None"
+    """Show the event belongs to."""
+
+    start: NaiveDatetime | MISSING = MISSING
+    """Start datetime of the event in event timezone, if selected."""
+
+    duration: Timedelta | MISSING = MISSING
+    """Duration of the event, if selected."""
+
+    timezone: Timezone | MISSING = MISSING
+    """Timezone of the event, if selected."""
+
+    recurrence: Recurrence | MISSING | None = MISSING
+    """Recurrence rule of the event, if selected."""
+
+    include: AbstractSet[Inclusion] | MISSING | None = MISSING
+    """Included instances of the event, if selected."""
+
+    exclude: AbstractSet[Exclusion] | MISSING | None = MISSING
+    """Excluded instances of the event, if selected."""
+
+    @classmethod
+    def map(
+        cls, event: sm.Event | sm.EventMetadata, fields: AbstractSet[sm.EventField]
+    ) -> Self:
+        """Map from internal representation."""
+        show = Show.map(event.show, fields) if event.show is not None else None
+
+        # Fields that were not selected are left out of the response entirely
+        schedule = {}
+        if isinstance(event, sm.Event):
+            schedule = {
+                "start": event.start,
+                "duration": event.duration,
+                "timezone": event.timezone,
+                "recurrence": Recurrence.map(event.recurrence)
+                if event.recurrence is not None
+                else None,
+                "include": {Inclusion.map(i) for i in event.include}  # pyright: ignore[reportUnhashable]
+                if event.include is not None
+                else None,
+                "exclude": {Exclusion.map(e) for e in event.exclude}  # pyright: ignore[reportUnhashable]
+                if event.exclude is not None
+                else None,
+            }
+
+        return cls(
+            id=UUID(event.id),
+            type=event.type,
+            show_id=UUID(event.show_id) if event.show_id is not None else None,
+            show=show,
+            **{key: value for key, value in schedule.items() if key in fields},
+        )
+
+
+def map_event(
+    event: sm.Event | sm.EventMetadata,
+    fields: AbstractSet[sm.EventField] | None = None,
+) -> Event | PartialEvent:
+    """Map from internal representation, keeping only the selected fields."""
+    if fields is None and isinstance(event, sm.Event):
+        return Event.map(event)
+
+    return PartialEvent.map(event, fields or set())
+
+
 class Show(SerializableModel):
     """Show data."""
 
@@ -238,17 +319,19 @@ class Show(SerializableModel):
     description: str | None
     """Description of the show."""
 
-    events: Sequence[Event] | None
+    events: Sequence[Event | PartialEvent] | None
     """Events the show belongs to."""
 
     @classmethod
-    def map(cls, show: sm.Show) -> Self:
+    def map(
+        cls, show: sm.Show, fields: AbstractSet[sm.EventField] | None = None
+    ) -> Self:
         """Map from internal representation."""
         return cls(
             id=UUID(show.id),
             title=show.title,
             description=show.description,
-            events=[Event.map(event) for event in show.events]
+            events=[map_event(event, fields) for event in show.events]
             if show.events is not None
             else None,
         )
@@ -266,26 +349,94 @@ class ShowList(SerializableModel):
     offset: int | None
     """Number of shows skipped."""
 
+    cursor: str | None
+    """Cursor to fetch the next page of shows, if there are more."""
+
     shows: Sequence[Show]
     """Shows that matched the request."""
 
 
+class ShowHighlights(SerializableModel):
+    """Text of a show with matches of a search marked."""
+
+    title: str
+    """Title of the show with matches wrapped in <mark> tags."""
+
+    description: str | None
+    """Description of the show with matches wrapped in <mark> tags."""
+
+    @classmethod
+    def map(cls, highlights: sm.ShowHighlights) -> Self:
+        """Map from internal representation."""
+        return cls(title=highlights.title, description=highlights.description)
+
+
+class SearchResult(SerializableModel):
+    """Show found by a search."""
+
+    show: Show
+    """Show that matches the search."""
+
+    rank: float
+    """Relevance of the show to the search, higher is better."""
+
+    highlights: ShowHighlights | None
+    """Text of the show with matches marked, if requested."""
+
+    @classmethod
+    def map(
+        cls,
+        result: sm.SearchResult,
+        fields: AbstractSet[sm.EventField] | None = None,
+    ) -> Self:
+        """Map from internal representation."""
+        return cls(
+            show=Show.map(result.show, fields),
+            rank=result.rank,
+            highlights=ShowHighlights.map(result.highlights)
+            if result.highlights is not None
+            else None,
+        )
+
+
 type ListRequestLimit = int | None
 
 type ListRequestOffset = int | None
 
+type ListRequestCursor = str | None
+
 type ListRequestWhere = sm.ShowWhereInput | None
 
 type ListRequestInclude = sm.ShowInclude | None
 
 type ListRequestOrder = sm.ShowOrderByInput | Sequence[sm.ShowOrderByInput] | None
 
+type ListRequestFields = AbstractSet[sm.EventField] | None
+
+type ListRequestCount = sm.CountMode
+
 type ListResponseResults = ShowList
 
+type SearchRequestText = Annotated[str, Field(min_length=1, max_length=200)]
+
+type SearchRequestLimit = Annotated[int, Field(ge=1, le=100)]
+
+type SearchRequestWhere = sm.ShowWhereInput | None
+
+type SearchRequestInclude = sm.ShowInclude | None
+
+type SearchRequestFields = AbstractSet[sm.EventField] | None
+
+type SearchRequestHighlight = bool
+
+type SearchResponseResults = Sequence[SearchResult]
+
 type GetRequestId = UUID
 
 type GetRequestInclude = sm.ShowInclude | None
 
+type GetRequestFields = AbstractSet[sm.EventField] | None
+
 type GetResponseShow = Show
 
 type CreateRequestData = sm.ShowCreateInput
@@ -315,6 +466,9 @@ class ListRequest:
     offset: ListRequestOffset
     """Number of shows to skip."""
 
+    cursor: ListRequestCursor
+    """Cursor of the show to continue listing after."""
+
     where: ListRequestWhere
     """Filter to apply to find shows."""
 
@@ -324,6 +478,12 @@ class ListRequest:
     order: ListRequestOrder
     """Order to apply to the results."""
 
+    fields: ListRequestFields
+    """Schedule fields of included events to return."""
+
+    count: ListRequestCount
+    """How to count all shows that match the request."""
+
 
 @datamodel
 class ListResponse:
@@ -333,6 +493,37 @@ class ListResponse:
     """List of shows."""
 
 
+@datamodel
+class SearchRequest:
+    """Request to search shows."""
+
+    text: SearchRequestText
+    """Text to search for in titles and descriptions."""
+
+    limit: SearchRequestLimit
+    """Maximum number of shows to return."""
+
+    where: SearchRequestWhere
+    """Filter to apply to find shows."""
+
+    include: SearchRequestInclude
+    """Relations to include in the response."""
+
+    fields: SearchRequestFields
+    """Schedule fields of included events to return."""
+
+    highlight: SearchRequestHighlight
+    """Whether to mark matches in the text of shows."""
+
+
+@datamodel
+class SearchResponse:
+    """Response for searching shows."""
+
+    results: SearchResponseResults
+    """Shows that match the search, most relevant first."""
+
+
 @datamodel
 class GetRequest:
     """Request to get a show."""
@@ -343,6 +534,9 @@ class GetRequest:
     include: GetRequestInclude
     """Relations to include in the response."""
 
+    fields: GetRequestFields
+    """Schedule fields of included events to return."""
+
 
 @datamodel
 class GetResponse:
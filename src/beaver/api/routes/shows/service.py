@@ -27,35 +27,59 @@ class Service:
 
     async def list(self, request: m.ListRequest) -> m.ListResponse:
         """List shows."""
-        count_request = sm.CountRequest(where=request.where)
-
-        with self._handle_errors():
-            count_response = await self._shows.count(count_request)
-
-        list_request = sm.ListRequest(
+        page_request = sm.PageRequest(
             limit=request.limit,
             offset=request.offset,
+            cursor=request.cursor,
             where=request.where,
             include=request.include,
             order=request.order,
+            schedule=request.fields is None or bool(request.fields),
+            count=request.count,
         )
 
         with self._handle_errors():
-            list_response = await self._shows.list(list_request)
+            page_response = await self._shows.page(page_request)
 
         return m.ListResponse(
             results=m.ShowList(
-                count=count_response.count,
+                count=page_response.count,
                 limit=request.limit,
                 offset=request.offset,
-                shows=[m.Show.map(show) for show in list_response.shows],
+                cursor=page_response.cursor,
+                shows=[
+                    m.Show.map(show, request.fields) for show in page_response.shows
+                ],
             )
         )
 
+    async def search(self, request: m.SearchRequest) -> m.SearchResponse:
+        """Search shows."""
+        search_request = sm.SearchRequest(
+            text=request.text,
+            limit=request.limit,
+            where=request.where,
+            include=request.include,
+            schedule=request.fields is None or bool(request.fields),
+            highlight=request.highlight,
+        )
+
+        with self._handle_errors():
+            search_response = await self._shows.search(search_request)
+
+        return m.SearchResponse(
+            results=[
+                m.SearchResult.map(result, request.fields)
+                for result in search_response.results
+            ]
+        )
+
     async def get(self, request: m.GetRequest) -> m.GetResponse:
         """Get show."""
         get_request = sm.GetRequest(
-            where={"id": str(request.id)}, include=request.include
+            where={"id": str(request.id)},
+            include=request.include,
+            schedule=request.fields is None or bool(request.fields),
         )
 
         with self._handle_errors():
@@ -64,7 +88,7 @@ class Service:
         if get_response.show is None:
             raise e.NotFoundError
 
-        return m.GetResponse(show=m.Show.map(get_response.show))
+        return m.GetResponse(show=m.Show.map(get_response.show, request.fields))
 
     async def create(self, request: m.CreateRequest) -> m.CreateResponse:
         """Create show."""
@@ -0,0 +1,23 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from litestar.response import Response, Stream
+
+from beaver.models.base import SerializableModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def accepts_ndjson(accept: str | None) -> bool:
+    """Check if the client asked for newline-delimited JSON."""
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+async def _lines(items: AsyncIterable[SerializableModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+def ndjson(items: AsyncIterable[SerializableModel]) -> Response[Any]:
+    """Stream items as newline-delimited JSON, sending each as soon as it is ready."""
+    return Stream(_lines(items), media_type=NDJSON_MEDIA_TYPE)
@@ -1,10 +1,38 @@
 from collections.abc import Sequence
+from datetime import timedelta
+from urllib.parse import urlencode
 
 from pydantic import BaseModel, Field
 
 from beaver.config.base import BaseConfig
 
 
+class ConflictsConfig(BaseModel):
+    """Configuration for the index of instances used to detect conflicts."""
+
+    enabled: bool = False
+    """Keep instances of events in memory to detect conflicts faster."""
+
+    future: timedelta = Field(default=timedelta(days=365), gt=timedelta(0))
+    """How far into the future instances are kept in memory."""
+
+    interval: float = Field(default=300.0, gt=0)
+    """Seconds to wait between rebuilding the index from the howlite database."""
+
+
+class EventsConfig(BaseModel):
+    """Configuration for managing events."""
+
+    batch: int = Field(default=100, ge=1)
+    """Number of events to fetch at once when streaming."""
+
+    computed: int = Field(default=1000, ge=1)
+    """Maximum number of events to order by start, end or timezone."""
+
+    concurrency: int = Field(default=16, ge=1)
+    """Maximum number of concurrent howlite requests in bulk operations."""
+
+
 class HowliteCalDAVConfig(BaseModel):
     """Configuration for the CalDAV API of the howlite database."""
 
@@ -42,12 +70,89 @@ class HowliteCalDAVConfig(BaseModel):
         return f"{url}/{self.user}/{self.calendar}"
 
 
+class HowliteOutboxConfig(BaseModel):
+    """Configuration for the outbox of pending writes to the howlite database."""
+
+    attempts: int = Field(default=10, ge=1)
+    """Number of failed attempts after which a pending write is parked."""
+
+    backoff: float = Field(default=1.0, gt=0)
+    """Seconds to wait before retrying a failed write, doubled after each attempt."""
+
+    batch: int = Field(default=100, ge=1)
+    """Maximum number of pending writes to process at once."""
+
+    concurrency: int = Field(default=16, ge=1)
+    """Maximum number of concurrent howlite requests when draining."""
+
+    enabled: bool = False
+    """Write to the howlite database in the background through the outbox."""
+
+    interval: float = Field(default=1.0, gt=0)
+    """Seconds to wait before checking the outbox again when it is empty."""
+
+
 class HowliteConfig(BaseModel):
     """Configuration for the howlite database."""
 
     caldav: HowliteCalDAVConfig = HowliteCalDAVConfig()
     """Configuration for the CalDAV API of the howlite database."""
 
+    outbox: HowliteOutboxConfig = HowliteOutboxConfig()
+    """Configuration for the outbox of pending writes to the howlite database."""
+
+
+class InstancesConfig(BaseModel):
+    """Configuration for managing instances."""
+
+    limit: int = Field(default=1000, ge=1)
+    """Maximum number of instances to list at once."""
+
+
+class SapphireOccurrencesConfig(BaseModel):
+    """Configuration for the precomputed occurrences in the sapphire database."""
+
+    enabled: bool = False
+    """Precompute instances of events to list them faster."""
+
+    future: timedelta = Field(default=timedelta(days=730), gt=timedelta(0))
+    """How far into the future instances are precomputed."""
+
+    interval: float = Field(default=60.0, gt=0)
+    """Seconds to wait between extending the precomputed time range."""
+
+    past: timedelta = Field(default=timedelta(days=365), ge=timedelta(0))
+    """How far into the past precomputed instances are kept."""
+
+    timeout: timedelta = Field(default=timedelta(minutes=5), gt=timedelta(0))
+    """How long writing precomputed instances can take."""
+
+
+class SapphireRawConfig(BaseModel):
+    """Configuration for the hand-written queries to the sapphire database."""
+
+    events_by_ids: bool = True
+    """Whether to list events by identifiers with a hand-written query."""
+
+    events_by_show: bool = True
+    """Whether to list events of a show with a hand-written query."""
+
+    shows_page: bool = True
+    """Whether to list pages of all shows with a hand-written query."""
+
+
+class SapphireReplicasConfig(BaseModel):
+    """Configuration for the read replicas of the sapphire database."""
+
+    interval: float = Field(default=5.0, gt=0)
+    """Seconds to wait between checking how far behind the replicas are."""
+
+    lag: timedelta = Field(default=timedelta(seconds=5), ge=timedelta(0))
+    """How far behind the primary a replica can be to still be read from."""
+
+    urls: Sequence[str] = []
+    """URLs of the SQL API of replicas to read from."""
+
 
 class SapphireSQLConfig(BaseModel):
     """Configuration for the SQL API of the datatshows database."""
@@ -61,15 +166,56 @@ class SapphireSQLConfig(BaseModel):
     port: int = Field(default=10510, ge=1, le=65535)
     """Port of the SQL API."""
 
+    connection_limit: int | None = Field(default=None, ge=1)
+    """Maximum number of connections in the pool, if not chosen automatically."""
+
+    pool_timeout: int = Field(default=10, ge=0)
+    """Seconds to wait for a free connection in the pool, or 0 to wait forever."""
+
+    connect_timeout: int = Field(default=5, ge=0)
+    """Seconds to wait for a new connection, or 0 to wait forever."""
+
+    statement_cache_size: int = Field(default=100, ge=0)
+    """Number of prepared statements cached per connection, or 0 to disable."""
+
+    engine_timeout: timedelta = Field(default=timedelta(seconds=10), gt=timedelta(0))
+    """How long to wait for the query engine to start."""
+
+    @property
+    def parameters(self) -> dict[str, int]:
+        """Connection parameters added to URLs of the SQL API."""
+        parameters = {
+            "pool_timeout": self.pool_timeout,
+            "connect_timeout": self.connect_timeout,
+            "statement_cache_size": self.statement_cache_size,
+        }
+
+        if self.connection_limit is not None:
+            parameters["connection_limit"] = self.connection_limit
+
+        return parameters
+
     @property
     def url(self) -> str:
         """URL of the SQL API."""
-        return f"postgres://user:{self.password}@{self.host}:{self.port}/database"
+        return (
+            f"postgres://user:{self.password}@{self.host}:{self.port}/database"
+            f"?{urlencode(self.parameters)}"
+        )
 
 
 class SapphireConfig(BaseModel):
     """Configuration for the sapphire database."""
 
+    occurrences: SapphireOccurrencesConfig = SapphireOccurrencesConfig()
+    """Configuration for the precomputed occurrences in the sapphire database."""
+
+    raw: SapphireRawConfig = SapphireRawConfig()
+    """Configuration for the hand-written queries to the sapphire database."""
+
+    replicas: SapphireReplicasConfig = SapphireReplicasConfig()
+    """Configuration for the read replicas of the sapphire database."""
+
     sql: SapphireSQLConfig = SapphireSQLConfig()
     """Configuration for the SQL API of the sapphire database."""
 
@@ -87,17 +233,55 @@ class ServerConfig(BaseModel):
     """Trusted IP addresses."""
 
 
+class StartupConfig(BaseModel):
+    """Configuration for the startup of the service."""
+
+    interval: float = Field(default=1.0, gt=0)
+    """Seconds to wait between background attempts to connect to and check databases."""
+
+    lazy: bool = False
+    """Accept requests while connecting to databases in the background."""
+
+
+class TimelineConfig(BaseModel):
+    """Configuration for the timeline of upcoming instances."""
+
+    enabled: bool = False
+    """Keep upcoming instances of events in memory to answer lookups faster."""
+
+    future: timedelta = Field(default=timedelta(hours=24), gt=timedelta(0))
+    """How far into the future instances are kept in memory."""
+
+    interval: float = Field(default=60.0, gt=0)
+    """Seconds to wait between rebuilding the timeline from the howlite database."""
+
+
 class Config(BaseConfig):
     """Configuration for the service."""
 
     debug: bool = True
     """Enable debug mode."""
 
+    conflicts: ConflictsConfig = ConflictsConfig()
+    """Configuration for the index of instances used to detect conflicts."""
+
+    events: EventsConfig = EventsConfig()
+    """Configuration for managing events."""
+
     howlite: HowliteConfig = HowliteConfig()
     """Configuration for the howlite database."""
 
+    instances: InstancesConfig = InstancesConfig()
+    """Configuration for managing instances."""
+
     sapphire: SapphireConfig = SapphireConfig()
     """Configuration for the sapphire database."""
 
     server: ServerConfig = ServerConfig()
     """Configuration for the server."""
+
+    startup: StartupConfig = StartupConfig()
+    """Configuration for the startup of the service."""
+
+    timeline: TimelineConfig = TimelineConfig()
+    """Configuration for the timeline of upcoming instances."""
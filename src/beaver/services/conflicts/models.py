@@ -0,0 +1,103 @@
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from datetime import datetime, timedelta
+
+from beaver.models.base import datamodel
+from beaver.services.data.howlite import models as hm
+
+
+@datamodel
+class Conflict:
+    """Instance of an event that overlaps a time range."""
+
+    event_id: str
+    """Identifier of the event the instance belongs to."""
+
+    start: datetime
+    """Start datetime of the instance in event timezone."""
+
+    duration: timedelta
+    """Duration of the instance."""
+
+
+@datamodel
+class RebuildRequest:
+    """Request to rebuild the index from howlite."""
+
+
+@datamodel
+class RebuildResponse:
+    """Response for rebuilding the index from howlite."""
+
+    start: datetime
+    """Start datetime in UTC of the indexed time range."""
+
+    end: datetime
+    """End datetime in UTC of the indexed time range."""
+
+
+@datamodel
+class RefreshRequest:
+    """Request to refresh instances of events after they were written."""
+
+    ids: AbstractSet[str]
+    """Identifiers of the events."""
+
+
+@datamodel
+class RefreshResponse:
+    """Response for refreshing instances of events."""
+
+
+@datamodel
+class RemoveRequest:
+    """Request to remove instances of events after they were deleted."""
+
+    ids: AbstractSet[str]
+    """Identifiers of the events."""
+
+
+@datamodel
+class RemoveResponse:
+    """Response for removing instances of events."""
+
+
+@datamodel
+class FindRequest:
+    """Request to find instances that overlap a time range."""
+
+    start: datetime
+    """Start datetime in UTC of the time range."""
+
+    end: datetime
+    """End datetime in UTC of the time range."""
+
+    exclude: AbstractSet[str]
+    """Identifiers of events to ignore."""
+
+
+@datamodel
+class FindResponse:
+    """Response for finding instances that overlap a time range."""
+
+    conflicts: Sequence[Conflict]
+    """Instances that overlap the time range."""
+
+
+@datamodel
+class CheckRequest:
+    """Request to check if events would overlap any other instances."""
+
+    events: Sequence[hm.Event]
+    """Events to check, as they would be written."""
+
+    exclude: AbstractSet[str]
+    """Identifiers of events to ignore, besides the checked ones."""
+
+
+@datamodel
+class CheckResponse:
+    """Response for checking if events would overlap any other instances."""
+
+    conflicts: Sequence[Conflict]
+    """Instances that the events would overlap."""
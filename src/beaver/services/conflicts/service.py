@@ -0,0 +1,195 @@
+import asyncio
+from collections.abc import Generator, Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from uuid import UUID
+
+from beaver.config.models import ConflictsConfig
+from beaver.services.conflicts import errors as e
+from beaver.services.conflicts import models as m
+from beaver.services.data.howlite import errors as he
+from beaver.services.data.howlite import models as hm
+from beaver.services.data.howlite.service import HowliteService
+from beaver.services.icalendar import errors as ie
+from beaver.services.icalendar.service import ICalendarService
+from beaver.services.outbox import errors as oe
+from beaver.services.outbox import models as om
+from beaver.services.outbox.service import OutboxService
+from beaver.utils.intervals import IntervalIndex
+
+type Interval = tuple[datetime, datetime, m.Conflict]
+
+
+class ConflictsService:
+    """Service to detect instances of events that overlap each other."""
+
+    def __init__(
+        self, config: ConflictsConfig, howlite: HowliteService, outbox: OutboxService
+    ) -> None:
+        self._config = config
+        self._howlite = howlite
+        self._outbox = outbox
+        self._icalendar = ICalendarService()
+        self._index: IntervalIndex[str, m.Conflict] = IntervalIndex()
+        self._range: tuple[datetime, datetime] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether instances of events are kept in memory."""
+        return self._config.enabled
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except (he.ServiceError, ie.ServiceError, oe.ServiceError) as ex:
+            raise e.ServiceError from ex
+
+    def _window(self) -> tuple[datetime, datetime]:
+        now = datetime.now(UTC)
+        return now, now + self._config.future
+
+    def _expand(
+        self, event: hm.Event, start: datetime, end: datetime
+    ) -> Iterator[Interval]:
+        for instance in self._icalendar.expander.iterate(event, start, end):
+            utcstart = instance.start.replace(tzinfo=event.timezone).astimezone(UTC)
+
+            yield (
+                utcstart,
+                utcstart + instance.duration,
+                m.Conflict(
+                    event_id=str(event.id),
+                    start=instance.start,
+                    duration=instance.duration,
+                ),
+            )
+
+    def _add(
+        self, index: IntervalIndex[str, m.Conflict], intervals: Sequence[Interval]
+    ) -> None:
+        for start, end, conflict in intervals:
+            index.add(conflict.event_id, start, end, conflict)
+
+    async def _load(self, ids: AbstractSet[str]) -> Mapping[str, hm.Event | None]:
+        request = om.CurrentRequest(ids=[UUID(event_id) for event_id in ids])
+
+        with self._handle_errors():
+            response = await self._outbox.current(request)
+
+        return {str(event_id): event for event_id, event in response.events.items()}
+
+    async def _build(
+        self, start: datetime, end: datetime
+    ) -> IntervalIndex[str, m.Conflict]:
+        request = hm.QueryEventsRequest(query=hm.TimeRangeQuery(start=start, end=end))
+
+        with self._handle_errors():
+            response = await self._howlite.query_events(request)
+
+        index: IntervalIndex[str, m.Conflict] = IntervalIndex()
+
+        with self._handle_errors():
+            for event in response.events:
+                self._add(index, list(self._expand(event, start, end)))
+
+        return index
+
+    async def _lookup(
+        self, start: datetime, end: datetime
+    ) -> IntervalIndex[str, m.Conflict]:
+        if (
+            self.enabled
+            and self._range is not None
+            and self._range[0] <= start
+            and end <= self._range[1]
+        ):
+            return self._index
+
+        # Outside of the indexed time range, instances are expanded on the fly
+        return await self._build(start, end)
+
+    async def rebuild(self, request: m.RebuildRequest) -> m.RebuildResponse:
+        """Rebuild the index from howlite, moving its time range forward."""
+        start, end = self._window()
+
+        async with self._lock:
+            self._index = await self._build(start, end)
+            self._range = (start, end)
+
+        return m.RebuildResponse(start=start, end=end)
+
+    async def refresh(self, request: m.RefreshRequest) -> m.RefreshResponse:
+        """Replace instances of events in the index after they were written."""
+        if not self.enabled:
+            return m.RefreshResponse()
+
+        async with self._lock:
+            if self._range is None:
+                return m.RefreshResponse()
+
+            start, end = self._range
+
+            try:
+                # Concurrent writes can refresh in any order, so read their latest state
+                events = await self._load(request.ids)
+
+                with self._handle_errors():
+                    intervals = {
+                        event_id: list(self._expand(event, start, end))
+                        if event is not None
+                        else []
+                        for event_id, event in events.items()
+                    }
+            except e.ServiceError:
+                # The index would be missing instances, so stop using it until rebuilt
+                self._range = None
+                raise
+
+            for event_id, items in intervals.items():
+                self._index.discard(event_id)
+                self._add(self._index, items)
+
+        return m.RefreshResponse()
+
+    async def remove(self, request: m.RemoveRequest) -> m.RemoveResponse:
+        """Remove instances of events from the index after they were deleted."""
+        async with self._lock:
+            for event_id in request.ids:
+                self._index.discard(event_id)
+
+        return m.RemoveResponse()
+
+    async def find(self, request: m.FindRequest) -> m.FindResponse:
+        """Find instances that overlap a time range."""
+        index = await self._lookup(request.start, request.end)
+
+        conflicts = [
+            conflict
+            for conflict in index.overlapping(request.start, request.end)
+            if conflict.event_id not in request.exclude
+        ]
+
+        return m.FindResponse(conflicts=conflicts)
+
+    async def check(self, request: m.CheckRequest) -> m.CheckResponse:
+        """Check if events would overlap instances of other events."""
+        if self.enabled and self._range is not None:
+            start, end = self._range
+        else:
+            start, end = self._window()
+
+        index = await self._lookup(start, end)
+        exclude = {str(event.id) for event in request.events} | request.exclude
+        conflicts: dict[tuple[str, datetime], m.Conflict] = {}
+
+        with self._handle_errors():
+            for event in request.events:
+                for istart, iend, _ in self._expand(event, start, end):
+                    for conflict in index.overlapping(istart, iend):
+                        if conflict.event_id not in exclude:
+                            conflicts[(conflict.event_id, conflict.start)] = conflict
+
+        return m.CheckResponse(conflicts=list(conflicts.values()))
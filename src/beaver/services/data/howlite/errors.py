@@ -1,5 +1,11 @@
 from gracy.exceptions import GracyException as ServiceError
 
+
+class EventChangedError(ServiceError):
+    """Raised when an event was changed since it was read."""
+
+
 __all__ = [
+    "EventChangedError",
     "ServiceError",
 ]
@@ -53,6 +53,16 @@ class RecurringQuery(Query):
     """Whether to search for recurring or non-recurring events."""
 
 
+@datamodel
+class PingRequest:
+    """Request to ping."""
+
+
+@datamodel
+class PingResponse:
+    """Response for ping."""
+
+
 @datamodel
 class GetCalendarRequest:
     """Request to get a calendar."""
@@ -81,6 +91,28 @@ class GetEventResponse:
     event: Event
     """Event data."""
 
+    etag: str | None
+    """Entity tag of the event."""
+
+
+@datamodel
+class FindEventRequest:
+    """Request to find an event."""
+
+    id: UUID
+    """Identifier of the event."""
+
+
+@datamodel
+class FindEventResponse:
+    """Response for finding an event."""
+
+    event: Event | None
+    """Event data, if the event exists."""
+
+    etag: str | None
+    """Entity tag of the event, if the event exists."""
+
 
 @datamodel
 class QueryEventsRequest:
@@ -114,6 +146,25 @@ class UpsertEventResponse:
     """Event data."""
 
 
+@datamodel
+class PutEventRequest:
+    """Request to put an event."""
+
+    event: Event
+    """Event data."""
+
+    etag: str | None
+    """Entity tag the stored event must match for the put to succeed."""
+
+
+@datamodel
+class PutEventResponse:
+    """Response for putting an event."""
+
+    etag: str | None
+    """Entity tag of the stored event."""
+
+
 @datamodel
 class DeleteEventRequest:
     """Request to delete an event."""
@@ -121,6 +172,9 @@ class DeleteEventRequest:
     id: UUID
     """Identifier of the event."""
 
+    etag: str | None
+    """Entity tag the stored event must match for the delete to succeed."""
+
 
 @datamodel
 class DeleteEventResponse:
@@ -1,14 +1,19 @@
 from collections.abc import Mapping, Sequence
+from functools import partial
+from http import HTTPStatus
 from typing import Any, cast
+from uuid import UUID
 from xml.etree import ElementTree as ET
 
-from gracy import BaseEndpoint, GracefulRetry, Gracy, GracyConfig
+from gracy import BaseEndpoint, GracefulRetry, Gracy, GracyConfig, graceful
 from httpx import BasicAuth, Response
 
 from beaver.config.models import HowliteConfig
+from beaver.services.data.howlite import errors as e
 from beaver.services.data.howlite import models as m
 from beaver.services.data.howlite.queries import QueryBuilderFactory
 from beaver.services.icalendar.service import ICalendarService
+from beaver.utils.singleflight import SingleFlight
 
 
 class Endpoint(BaseEndpoint):
@@ -41,6 +46,11 @@ class HowliteService(BaseService):
         super().__init__(*args, **kwargs)
         self._icalendar = ICalendarService()
         self._query_builder_factory = QueryBuilderFactory()
+        self._event_flights = SingleFlight[m.GetEventRequest, m.GetEventResponse]()
+        self._find_flights = SingleFlight[m.FindEventRequest, m.FindEventResponse]()
+        self._query_flights = SingleFlight[
+            m.QueryEventsRequest, m.QueryEventsResponse
+        ]()
 
     def _build_auth(self) -> BasicAuth:
         return BasicAuth(
@@ -58,6 +68,19 @@ class HowliteService(BaseService):
         calendars = root.findall(".//C:calendar-data", namespaces=dict(namespaces))
         return [calendar.text for calendar in calendars if calendar.text is not None]
 
+    def _forget_event(self, id: UUID) -> None:  # noqa: A002
+        # Reads started before a write must not be joined after it
+        self._event_flights.forget(m.GetEventRequest(id=id))
+        self._find_flights.forget(m.FindEventRequest(id=id))
+        self._query_flights.clear()
+
+    async def ping(self, request: m.PingRequest) -> m.PingResponse:
+        """Ping, opening a connection that later requests can reuse."""
+        # Options are cheap to compute, unlike anything with calendar data
+        await self._request("OPTIONS", Endpoint.CALENDAR, auth=self._build_auth())
+
+        return m.PingResponse()
+
     async def get_calendar(
         self, request: m.GetCalendarRequest
     ) -> m.GetCalendarResponse:
@@ -71,23 +94,46 @@ class HowliteService(BaseService):
 
         return m.GetCalendarResponse(calendar=calendar)
 
+    async def _get_event(self, request: m.GetEventRequest) -> m.GetEventResponse:
+        response = await self.get(
+            Endpoint.EVENT,
+            {"EVENT": str(request.id)},
+            auth=self._build_auth(),
+        )
+
+        calendar = self._icalendar.parser.string_to_calendar(response.text)
+        event = calendar.events[0]
+
+        return m.GetEventResponse(event=event, etag=response.headers.get("ETag"))
+
     async def get_event(self, request: m.GetEventRequest) -> m.GetEventResponse:
         """Get an event."""
+        return await self._event_flights.do(request, partial(self._get_event, request))
+
+    @graceful(allowed_status_code=HTTPStatus.NOT_FOUND)
+    async def _find_event(self, request: m.FindEventRequest) -> m.FindEventResponse:
+        # Missing events are expected here, so they are neither retried nor raised
         response = await self.get(
             Endpoint.EVENT,
             {"EVENT": str(request.id)},
             auth=self._build_auth(),
         )
 
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            return m.FindEventResponse(event=None, etag=None)
+
         calendar = self._icalendar.parser.string_to_calendar(response.text)
         event = calendar.events[0]
 
-        return m.GetEventResponse(event=event)
+        return m.FindEventResponse(event=event, etag=response.headers.get("ETag"))
 
-    async def query_events(
+    async def find_event(self, request: m.FindEventRequest) -> m.FindEventResponse:
+        """Find an event, if it exists."""
+        return await self._find_flights.do(request, partial(self._find_event, request))
+
+    async def _query_events(
         self, request: m.QueryEventsRequest
     ) -> m.QueryEventsResponse:
-        """Query events."""
         builder = self._query_builder_factory.get(request.query)
 
         namespaces = builder.namespaces
@@ -112,6 +158,14 @@ class HowliteService(BaseService):
 
         return m.QueryEventsResponse(events=events)
 
+    async def query_events(
+        self, request: m.QueryEventsRequest
+    ) -> m.QueryEventsResponse:
+        """Query events."""
+        return await self._query_flights.do(
+            request, partial(self._query_events, request)
+        )
+
     async def upsert_event(
         self, request: m.UpsertEventRequest
     ) -> m.UpsertEventResponse:
@@ -127,19 +181,61 @@ class HowliteService(BaseService):
             headers={"Content-Type": "text/calendar"},
         )
 
+        self._forget_event(request.event.id)
+
         get_event_request = m.GetEventRequest(id=request.event.id)
-        get_event_response = await self.get_event(get_event_request)
+        get_event_response = await self._get_event(get_event_request)
 
         return m.UpsertEventResponse(event=get_event_response.event)
 
+    @graceful(allowed_status_code=HTTPStatus.PRECONDITION_FAILED)
+    async def put_event(self, request: m.PutEventRequest) -> m.PutEventResponse:
+        """Put an event, if it was not changed since it was read."""
+        calendar = m.Calendar(events=[request.event])
+        payload = self._icalendar.parser.calendar_to_string(calendar)
+
+        headers = {"Content-Type": "text/calendar"}
+        if request.etag is not None:
+            headers["If-Match"] = request.etag
+
+        response = await self.put(
+            Endpoint.EVENT,
+            {"EVENT": str(request.event.id)},
+            auth=self._build_auth(),
+            content=payload,
+            headers=headers,
+        )
+
+        self._forget_event(request.event.id)
+
+        # A failed precondition means someone else wrote the event in between
+        if response.status_code == HTTPStatus.PRECONDITION_FAILED:
+            raise e.EventChangedError
+
+        return m.PutEventResponse(etag=response.headers.get("ETag"))
+
+    @graceful(
+        allowed_status_code=[HTTPStatus.NOT_FOUND, HTTPStatus.PRECONDITION_FAILED]
+    )
     async def delete_event(
         self, request: m.DeleteEventRequest
     ) -> m.DeleteEventResponse:
-        """Delete an event."""
-        await self.delete(
+        """Delete an event, succeeding if it is already gone."""
+        headers = {}
+        if request.etag is not None:
+            headers["If-Match"] = request.etag
+
+        response = await self.delete(
             Endpoint.EVENT,
             {"EVENT": str(request.id)},
             auth=self._build_auth(),
+            headers=headers,
         )
 
+        self._forget_event(request.id)
+
+        # A failed precondition means someone else wrote the event in between
+        if response.status_code == HTTPStatus.PRECONDITION_FAILED:
+            raise e.EventChangedError
+
         return m.DeleteEventResponse()
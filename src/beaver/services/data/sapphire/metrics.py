@@ -0,0 +1,6 @@
+from prisma import MetricHistogram, Metrics
+
+__all__ = [
+    "MetricHistogram",
+    "Metrics",
+]
@@ -1,9 +1,22 @@
+import asyncio
+import hashlib
 import os
 import subprocess
 from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from prisma import Prisma
 
 from beaver.config.models import Config
 
+# Arbitrary key of the advisory lock, different from the one taken by Prisma itself
+LOCK_KEY = 0x62656176
+
+APPLIED_QUERY = """
+SELECT "migration_name", "checksum" FROM "_prisma_migrations"
+WHERE "finished_at" IS NOT NULL AND "rolled_back_at" IS NULL
+"""
+
 
 class SapphireMigrator:
     """Migrator class for sapphire database migrations."""
@@ -24,8 +37,38 @@ class SapphireMigrator:
             "PRISMA_DB_URL": self._get_connection_string(),
         }
 
-    def migrate(self) -> None:
-        """Apply migrations."""
+    def _get_migrations_path(self) -> Path:
+        return Path("prisma") / "migrations"
+
+    def _get_checksums(self) -> Mapping[str, str]:
+        # Prisma stores SHA-256 checksums of migration scripts as they were applied
+        return {
+            path.parent.name: hashlib.sha256(path.read_bytes()).hexdigest()
+            for path in self._get_migrations_path().glob("*/migration.sql")
+        }
+
+    async def _is_applied(self, client: Prisma) -> bool:
+        rows = await client.query_raw(
+            "SELECT to_regclass('_prisma_migrations') IS NOT NULL AS \"exists\""
+        )
+
+        if not rows[0]["exists"]:
+            return False
+
+        checksums = self._get_checksums()
+
+        # Without migrations to compare with, deploying reports what is wrong
+        if not checksums:
+            return False
+
+        rows = await client.query_raw(APPLIED_QUERY)
+        applied = {row["migration_name"]: row["checksum"] for row in rows}
+
+        return all(
+            applied.get(name) == checksum for name, checksum in checksums.items()
+        )
+
+    def _deploy(self) -> None:
         try:
             subprocess.run(  # noqa: S603
                 self._get_command(),
@@ -36,3 +79,23 @@ class SapphireMigrator:
         except subprocess.CalledProcessError as ex:
             message = ex.stderr.decode() if ex.stderr else "Unknown error."
             raise RuntimeError(message) from ex
+
+    async def _migrate(self) -> None:
+        # Session locks need to be released on the same connection they were taken on
+        config = self._config.sapphire.sql.model_copy(update={"connection_limit": 1})
+
+        async with Prisma(datasource={"url": config.url}) as client:
+            # Other processes starting at the same time wait until migrations are done
+            await client.execute_raw("SELECT pg_advisory_lock($1)", LOCK_KEY)
+
+            try:
+                if await self._is_applied(client):
+                    return
+
+                await asyncio.to_thread(self._deploy)
+            finally:
+                await client.execute_raw("SELECT pg_advisory_unlock($1)", LOCK_KEY)
+
+    def migrate(self) -> None:
+        """Apply migrations, unless all of them are already applied."""
+        asyncio.run(self._migrate())
@@ -11,6 +11,40 @@ class ValidationError(ServiceError):
     """Raised when a validation error occurs."""
 
 
+class InvalidCursorError(ValidationError):
+    """Raised when a cursor is invalid."""
+
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"Cursor {cursor} is invalid.")
+
+
+class CursorOrderError(ValidationError):
+    """Raised when the order does not support paginating with a cursor."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Cannot paginate with a cursor when ordering by start, end or timezone."
+        )
+
+
+class StreamOrderError(ValidationError):
+    """Raised when the order does not support streaming."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Cannot stream events when ordering by start, end or timezone."
+        )
+
+
+class ComputedOrderLimitError(ValidationError):
+    """Raised when too many events would have to be ordered by computed fields."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(
+            f"Cannot order more than {limit} events by start, end or timezone. Narrow down the filter."
+        )
+
+
 class PartialUpdateInsufficientDataError(ValidationError):
     """Raised when a partial update is attempted with insufficient data."""
 
@@ -45,5 +79,49 @@ class SplitFirstInstanceError(ValidationError):
         )
 
 
+class EventDoesNotExistError(ValidationError):
+    """Raised when an event does not exist."""
+
+    def __init__(self, event_id: str) -> None:
+        super().__init__(f"Event with id {event_id} does not exist.")
+
+
+class ShowDoesNotExistError(ValidationError):
+    """Raised when a show does not exist."""
+
+    def __init__(self, show_id: str) -> None:
+        super().__init__(f"Show with id {show_id} does not exist.")
+
+
 class ConflictError(ValidationError):
     """Raised when a conflict error occurs."""
+
+
+class EventOverlapError(ConflictError):
+    """Raised when an event would overlap an instance of another event."""
+
+    def __init__(self, event_id: str, start: datetime) -> None:
+        super().__init__(
+            f"Event would overlap instance of event {event_id} starting at {isostringify(start)}."
+        )
+
+
+class EventChangedError(ConflictError):
+    """Raised when an event was changed since it was loaded."""
+
+    def __init__(self) -> None:
+        super().__init__("Event was changed since it was loaded.")
+
+
+class EventAlreadyExistsError(ConflictError):
+    """Raised when an event already exists."""
+
+    def __init__(self, event_id: str) -> None:
+        super().__init__(f"Event with id {event_id} already exists.")
+
+
+class DuplicateEventError(ConflictError):
+    """Raised when the same event is given more than once in a bulk operation."""
+
+    def __init__(self, event_id: str) -> None:
+        super().__init__(f"Event with id {event_id} is given more than once.")
@@ -1,7 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from collections.abc import Set as AbstractSet
 from datetime import datetime, timedelta
-from typing import NotRequired, Self, TypedDict
+from typing import Literal, NotRequired, Self, TypedDict
 from zoneinfo import ZoneInfo
 
 from beaver.models.base import datamodel
@@ -9,6 +9,7 @@ from beaver.services.data.howlite import models as hm
 from beaver.services.data.sapphire import enums as se
 from beaver.services.data.sapphire import models as sm
 from beaver.services.data.sapphire import types as st
+from beaver.services.entities.events.errors import ServiceError
 
 EventType = se.EventType
 
@@ -30,6 +31,12 @@ Inclusion = hm.Inclusion
 
 Exclusion = hm.Exclusion
 
+type EventField = Literal[
+    "start", "duration", "timezone", "recurrence", "include", "exclude"
+]
+
+type CountMode = Literal["exact", "estimated"]
+
 
 @datamodel
 class Show:
@@ -44,11 +51,13 @@ class Show:
     description: str | None
     """Description of the show."""
 
-    events: Sequence["Event"] | None
+    events: Sequence["Event | EventMetadata"] | None
     """Events belonging to the show."""
 
     @classmethod
-    def map(cls, show: sm.Show, events: Sequence["Event"] | None) -> Self:
+    def map(
+        cls, show: sm.Show, events: Sequence["Event | EventMetadata"] | None
+    ) -> Self:
         """Map from internal representation."""
         return cls(
             id=show.id, title=show.title, description=show.description, events=events
@@ -106,6 +115,28 @@ class Event:
         )
 
 
+@datamodel
+class EventMetadata:
+    """Event data without the schedule."""
+
+    id: str
+    """Identifier of the event."""
+
+    type: EventType
+    """Type of the event."""
+
+    show_id: str | None
+    """Identifier of the show the event belongs to."""
+
+    show: Show | None
+    """Show the event belongs to."""
+
+    @classmethod
+    def map(cls, sevent: sm.Event, show: Show | None) -> Self:
+        """Map from internal representation."""
+        return cls(id=sevent.id, type=sevent.type, show_id=sevent.showId, show=show)
+
+
 EventWhereInput = st.EventWhereInput
 
 EventInclude = st.EventInclude
@@ -155,6 +186,13 @@ type EventOrderByInput = (
 )
 
 
+class EventCursor(TypedDict, total=True):
+    """Position of an event in a list."""
+
+    values: dict[str, str | None]
+    """Values of the fields the list is ordered by, including the identifier."""
+
+
 class EventCreateInput(st.EventCreateWithoutRelationsInput):
     """Data to create an event."""
 
@@ -263,6 +301,45 @@ class SplitResult:
     """Event after the split."""
 
 
+@datamodel
+class EventState:
+    """Loaded state of an event."""
+
+    event: Event
+    """Event data."""
+
+    sevent: sm.Event
+    """Event data stored in sapphire."""
+
+    hevent: hm.Event
+    """Event data stored in howlite."""
+
+    etag: str | None
+    """Entity tag of the event data stored in howlite."""
+
+
+@datamodel
+class BulkResult:
+    """Result of an operation on a single event in bulk."""
+
+    event: Event | None
+    """Event the operation was applied to, if it succeeded."""
+
+    error: ServiceError | None
+    """Error that caused the operation to fail, if it did."""
+
+
+@datamodel
+class BulkUpdateItem:
+    """Update of a single event in bulk."""
+
+    data: EventUpdateInput
+    """Data to update an event."""
+
+    where: EventWhereUniqueInput
+    """Unique filter to apply to find an event."""
+
+
 @datamodel
 class CountRequest:
     """Request to count events."""
@@ -292,6 +369,9 @@ class ListRequest:
     offset: int | None
     """Number of events to skip."""
 
+    cursor: str | None
+    """Cursor of the event to continue listing after."""
+
     where: EventWhereInput | None
     """Filter to apply to find events."""
 
@@ -312,6 +392,106 @@ class ListResponse:
     events: Sequence[Event]
     """List of events that match the filter."""
 
+    cursor: str | None
+    """Cursor to continue listing after the last event, if there are more."""
+
+    count: int | None
+    """Number of all events that match the filter, if it was counted on the way."""
+
+
+@datamodel
+class ListMetadataResponse:
+    """Response for listing metadata of events."""
+
+    events: Sequence[EventMetadata]
+    """List of metadata of events that match the filter."""
+
+    cursor: str | None
+    """Cursor to continue listing after the last event, if there are more."""
+
+    count: int | None
+    """Number of all events that match the filter, if it was counted on the way."""
+
+
+@datamodel
+class PageRequest:
+    """Request to list a page of events along with their total count."""
+
+    limit: int | None
+    """Maximum number of events to return."""
+
+    offset: int | None
+    """Number of events to skip."""
+
+    cursor: str | None
+    """Cursor of the event to continue listing after."""
+
+    where: EventWhereInput | None
+    """Filter to apply to find events."""
+
+    query: Query | None
+    """Advanced query to apply to find events."""
+
+    include: EventInclude | None
+    """Relations to include in the response."""
+
+    order: EventOrderByInput | Sequence[EventOrderByInput] | None
+    """Order to apply to the results."""
+
+    schedule: bool
+    """Whether to get the schedule of events."""
+
+    count: CountMode
+    """How to count all events that match the filter."""
+
+
+@datamodel
+class PageResponse:
+    """Response for listing a page of events along with their total count."""
+
+    events: Sequence[Event] | Sequence[EventMetadata]
+    """List of events that match the filter."""
+
+    cursor: str | None
+    """Cursor to continue listing after the last event, if there are more."""
+
+    count: int
+    """Number of all events that match the filter, possibly estimated."""
+
+
+@datamodel
+class StreamRequest:
+    """Request to stream events."""
+
+    limit: int | None
+    """Maximum number of events to return."""
+
+    offset: int | None
+    """Number of events to skip."""
+
+    where: EventWhereInput | None
+    """Filter to apply to find events."""
+
+    query: Query | None
+    """Advanced query to apply to find events."""
+
+    include: EventInclude | None
+    """Relations to include in the response."""
+
+    order: EventOrderByInput | Sequence[EventOrderByInput] | None
+    """Order to apply to the results."""
+
+    schedule: bool
+    """Whether to get the schedule of events."""
+
+
+@datamodel
+class StreamResponse:
+    """Response for streaming events."""
+
+    events: AsyncIterator[Event | EventMetadata]
+    """Stream of events that match the filter."""
+
 
 @datamodel
 class GetRequest:
@@ -332,6 +512,14 @@ class GetResponse:
     """Event that matches the filter."""
 
 
+@datamodel
+class GetMetadataResponse:
+    """Response for getting metadata of an event."""
+
+    event: EventMetadata | None
+    """Metadata of the event that matches the filter."""
+
+
 @datamodel
 class CreateRequest:
     """Request to create an event."""
@@ -342,6 +530,9 @@ class CreateRequest:
     include: EventInclude | None
     """Relations to include in the response."""
 
+    reject_overlaps: bool
+    """Whether to fail if the event would overlap instances of other events."""
+
 
 @datamodel
 class CreateResponse:
@@ -364,6 +555,9 @@ class UpdateRequest:
     include: EventInclude | None
     """Relations to include in the response."""
 
+    reject_overlaps: bool
+    """Whether to fail if the event would overlap instances of other events."""
+
 
 @datamodel
 class UpdateResponse:
@@ -373,6 +567,47 @@ class UpdateResponse:
     """Event that was updated."""
 
 
+@datamodel
+class LoadRequest:
+    """Request to load the state of an event."""
+
+    where: EventWhereUniqueInput
+    """Unique filter to apply to find an event."""
+
+    include: EventInclude | None
+    """Relations to include in the response."""
+
+
+@datamodel
+class LoadResponse:
+    """Response for loading the state of an event."""
+
+    state: EventState | None
+    """State of the event that matched the request."""
+
+
+@datamodel
+class ApplyRequest:
+    """Request to apply an update to a loaded event."""
+
+    data: EventUpdateInput
+    """Data to update the event."""
+
+    state: EventState
+    """State of the event the update is based on."""
+
+    include: EventInclude | None
+    """Relations to include in the response."""
+
+
+@datamodel
+class ApplyResponse:
+    """Response for applying an update to a loaded event."""
+
+    state: EventState | None
+    """State of the event after the update."""
+
+
 @datamodel
 class SplitRequest:
     """Request to split an event."""
@@ -386,6 +621,9 @@ class SplitRequest:
     include: EventInclude | None
     """Relations to include in the response."""
 
+    reject_overlaps: bool
+    """Whether to fail if the events would overlap instances of other events."""
+
 
 @datamodel
 class SplitResponse:
@@ -412,3 +650,60 @@ class DeleteResponse:
 
     event: Event | None
     """Event that was deleted."""
+
+
+@datamodel
+class BulkCreateRequest:
+    """Request to create events in bulk."""
+
+    data: Sequence[EventCreateInput]
+    """Data to create events."""
+
+    include: EventInclude | None
+    """Relations to include in the response."""
+
+
+@datamodel
+class BulkCreateResponse:
+    """Response for creating events in bulk."""
+
+    results: Sequence[BulkResult]
+    """Results of creating each event, in the order of the request."""
+
+
+@datamodel
+class BulkUpdateRequest:
+    """Request to update events in bulk."""
+
+    items: Sequence[BulkUpdateItem]
+    """Updates of events."""
+
+    include: EventInclude | None
+    """Relations to include in the response."""
+
+
+@datamodel
+class BulkUpdateResponse:
+    """Response for updating events in bulk."""
+
+    results: Sequence[BulkResult]
+    """Results of updating each event, in the order of the request."""
+
+
+@datamodel
+class BulkDeleteRequest:
+    """Request to delete events in bulk."""
+
+    where: Sequence[EventWhereUniqueInput]
+    """Unique filters to apply to find events."""
+
+    include: EventInclude | None
+    """Relations to include in the response."""
+
+
+@datamodel
+class BulkDeleteResponse:
+    """Response for deleting events in bulk."""
+
+    results: Sequence[BulkResult]
+    """Results of deleting each event, in the order of the request."""
@@ -1,10 +1,27 @@
-from collections.abc import Generator, Sequence
-from contextlib import contextmanager
+import asyncio
+from collections import defaultdict
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    Generator,
+    Hashable,
+    Mapping,
+    Sequence,
+)
+from collections.abc import Set as AbstractSet
+from contextlib import asynccontextmanager, contextmanager, suppress
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
-from typing import cast
-from uuid import UUID
-
+from enum import Enum
+from functools import partial
+from typing import Any, LiteralString, cast
+from uuid import UUID, uuid4
+
+from beaver.config.models import EventsConfig, SapphireRawConfig
+from beaver.services.conflicts import errors as cfe
+from beaver.services.conflicts import models as cfm
+from beaver.services.conflicts.service import ConflictsService
 from beaver.services.data.howlite import errors as he
 from beaver.services.data.howlite import models as hm
 from beaver.services.data.howlite.service import HowliteService
@@ -17,20 +34,92 @@ from beaver.services.entities.events import models as m
 from beaver.services.icalendar import errors as ie
 from beaver.services.icalendar import models as im
 from beaver.services.icalendar.service import ICalendarService
+from beaver.services.metrics.service import MetricsService
+from beaver.services.occurrences import errors as oce
+from beaver.services.occurrences import models as ocm
+from beaver.services.occurrences.service import OccurrencesService
+from beaver.services.outbox import errors as oe
+from beaver.services.outbox import models as om
+from beaver.services.outbox.service import OutboxService
+from beaver.services.replicas.service import ReplicasService
+from beaver.services.timeline import errors as tle
+from beaver.services.timeline import models as tlm
+from beaver.services.timeline.service import TimelineService
+from beaver.utils.cursor import cursorparse, cursorstringify
+from beaver.utils.keyset import keysetwhere
+from beaver.utils.ordering import Ordering
+from beaver.utils.singleflight import SingleFlight, flightkey
+from beaver.utils.uuids import isuuid
+
+# Cursors continue after the identifier, even if that event no longer exists
+EVENTS_BY_IDS_QUERY = """
+SELECT "id", "type", "show_id", "count" FROM (
+  SELECT "id", "type", "show_id", COUNT(*) OVER () AS "count" FROM "events"
+  WHERE "id" = ANY($1::uuid[])
+) AS "matching"
+WHERE $2::uuid IS NULL OR "id" > $2::uuid
+ORDER BY "id" ASC
+LIMIT $3::integer OFFSET $4::integer
+"""
+
+EVENTS_BY_SHOW_QUERY = """
+SELECT "id", "type", "show_id", "count" FROM (
+  SELECT "id", "type", "show_id", COUNT(*) OVER () AS "count" FROM "events"
+  WHERE "show_id" = $1::uuid
+) AS "matching"
+WHERE $2::uuid IS NULL OR "id" > $2::uuid
+ORDER BY "id" ASC
+LIMIT $3::integer OFFSET $4::integer
+"""
 
 
 class EventsService:
     """Service to manage events."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
+        config: EventsConfig,
+        conflicts: ConflictsService,
+        flights: SingleFlight[Hashable, Any],
         howlite: HowliteService,
         icalendar: ICalendarService,
+        metrics: MetricsService,
+        occurrences: OccurrencesService,
+        outbox: OutboxService,
+        raw: SapphireRawConfig,
+        replicas: ReplicasService,
         sapphire: SapphireService,
+        timeline: TimelineService,
     ) -> None:
+        self._config = config
+        self._conflicts = conflicts
+        self._flights = flights
         self._howlite = howlite
         self._icalendar = icalendar
+        self._metrics = metrics
+        self._occurrences = occurrences
+        self._outbox = outbox
+        self._raw = raw
+        self._replicas = replicas
         self._sapphire = sapphire
+        self._timeline = timeline
+        self._queries: dict[m.Query, Sequence[hm.Event]] = {}
+        self._written = False
+
+    @property
+    def computed(self) -> int:
+        """Maximum number of events to order by start, end or timezone."""
+        return self._config.computed
+
+    @property
+    def concurrency(self) -> int:
+        """Maximum number of concurrent howlite requests in bulk operations."""
+        return self._config.concurrency
+
+    @property
+    def batch(self) -> int:
+        """Number of events to fetch at once when streaming."""
+        return self._config.batch
 
     @contextmanager
     def _handle_errors(self) -> Generator[None]:
@@ -40,24 +129,84 @@ class EventsService:
             raise e.ConflictError from ex
         except se.DataError as ex:
             raise e.ValidationError from ex
-        except (he.ServiceError, ie.ServiceError, se.ServiceError) as ex:
+        except he.EventChangedError as ex:
+            raise e.EventChangedError from ex
+        except (
+            cfe.ServiceError,
+            he.ServiceError,
+            ie.ServiceError,
+            oe.ServiceError,
+            se.ServiceError,
+            tle.ServiceError,
+        ) as ex:
             raise e.ServiceError from ex
 
+    @asynccontextmanager
+    async def _transaction(self, operation: str) -> AsyncGenerator[SapphireService]:
+        self._written = True
+
+        # Transactions are kept short, so how long they are held is worth watching
+        with self._metrics.measure(f"sapphire.transaction.events.{operation}"):
+            async with self._sapphire.tx() as transaction:
+                yield transaction
+
+        # Reads that started before the commit must not be joined after it
+        self._flights.clear()
+
+    def _reader(self) -> SapphireService:
+        # Replicas may not have caught up with writes made by this service yet
+        if self._written:
+            return self._sapphire
+
+        return self._replicas.reader()
+
+    @asynccontextmanager
+    async def _read(
+        self, operation: str, include: m.EventInclude | None
+    ) -> AsyncGenerator[SapphireService]:
+        reader = self._reader()
+
+        if not include:
+            # A single query is atomic anyway, so skip the transaction round trips
+            with self._metrics.measure(f"sapphire.read.events.{operation}"):
+                yield reader
+
+            return
+
+        # Relations are read with separate queries, so read them from one snapshot
+        with self._metrics.measure(f"sapphire.transaction.events.{operation}"):
+            async with reader.tx() as transaction:
+                with self._handle_errors():
+                    await transaction.execute_raw(
+                        "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"
+                    )
+
+                yield transaction
+
+    async def _query_event_ids(self, query: m.Query) -> Sequence[str]:
+        # Results are memoized for the lifetime of the service, which is one request
+        if query not in self._queries:
+            request = hm.QueryEventsRequest(query=query)
+
+            with self._handle_errors():
+                response = await self._howlite.query_events(request)
+
+            self._queries[query] = response.events
+
+        return [str(hevent.id) for hevent in self._queries[query]]
+
     async def _where_with_query(
         self, where: m.EventWhereInput | None, query: m.Query | None
     ) -> m.EventWhereInput | None:
         if query is None:
             return where
 
-        request = hm.QueryEventsRequest(query=query)
-
-        with self._handle_errors():
-            response = await self._howlite.query_events(request)
+        ids = await self._query_event_ids(query)
 
         where = where.copy() if where is not None else {}
         extra_where: m.EventWhereInput = {
             "id": {
-                "in": [str(event.id) for event in response.events],
+                "in": list(ids),
             },
         }
 
@@ -68,6 +217,86 @@ class EventsService:
 
         return where
 
+    def _keyset(
+        self, position: m.EventCursor, order: Sequence[m.EventOrderByInput]
+    ) -> m.EventWhereInput:
+        where = keysetwhere(
+            [(field, direction) for item in order for field, direction in item.items()],
+            position["values"],
+            nullable={"showId"},
+            enums={"type": [member.value for member in m.EventType]},
+        )
+        return cast("m.EventWhereInput", where)
+
+    def _where_after(
+        self,
+        where: m.EventWhereInput | None,
+        position: m.EventCursor | None,
+        order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None,
+    ) -> m.EventWhereInput | None:
+        if position is None:
+            return where
+
+        if order is None:
+            order = []
+        elif not isinstance(order, Sequence):
+            order = [order]
+
+        after = self._keyset(position, order)
+        return {"AND": [where, after]} if where else after
+
+    def _parse_cursor(
+        self, cursor: str, order: Sequence[m.EventOrderByInput]
+    ) -> m.EventCursor:
+        try:
+            position = cursorparse(cursor, m.EventCursor)
+            # Cursors from lists in another order miss values to continue from
+            self._keyset(position, order)
+        except (KeyError, ValueError) as ex:
+            raise e.InvalidCursorError(cursor) from ex
+
+        return position
+
+    def _build_cursor(
+        self, sevent: sm.Event, order: Sequence[m.EventOrderByInput]
+    ) -> str:
+        values: dict[str, str | None] = {}
+
+        # Values of all sort keys are kept, so that edits to the event don't matter
+        for item in order:
+            for field in item:
+                value = getattr(sevent, field)
+                values[field] = value.value if isinstance(value, Enum) else value
+
+        return cursorstringify(m.EventCursor(values=values))
+
+    def _is_computed_order(
+        self, order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None
+    ) -> bool:
+        if order is None:
+            return False
+
+        if not isinstance(order, Sequence):
+            order = [order]
+
+        return any(
+            key in {"start", "end", "timezone"} for item in order for key in item
+        )
+
+    def _order_with_tiebreaker(
+        self, order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None
+    ) -> Sequence[m.EventOrderByInput]:
+        if order is None:
+            order = []
+        elif not isinstance(order, Sequence):
+            order = [order]
+
+        # Order by identifier last to make the order total and cursors stable
+        if not any("id" in item for item in order):
+            order = [*order, {"id": "asc"}]
+
+        return order
+
     async def _merge_event(self, sevent: sm.Event, hevent: hm.Event) -> m.Event:
         if sevent.show is not None:
             show = await self._map_show(sevent.show)
@@ -77,18 +306,24 @@ class EventsService:
         return m.Event.map(sevent, hevent, show)
 
     async def _map_event(self, sevent: sm.Event) -> m.Event:
-        request = hm.GetEventRequest(id=UUID(sevent.id))
+        hevent = await self._get_howlite_event(sevent)
+        return await self._merge_event(sevent, hevent)
 
-        with self._handle_errors():
-            response = await self._howlite.get_event(request)
+    async def _map_metadata(self, sevent: sm.Event) -> m.EventMetadata:
+        if sevent.show is not None:
+            show = await self._map_show(sevent.show, schedule=False)
+        else:
+            show = None
 
-        return await self._merge_event(sevent, response.event)
+        return m.EventMetadata.map(sevent, show)
 
-    async def _map_show(self, sshow: sm.Show) -> m.Show:
-        if sshow.events is not None:
+    async def _map_show(self, sshow: sm.Show, *, schedule: bool = True) -> m.Show:
+        if sshow.events is None:
+            events = None
+        elif schedule:
             events = [await self._map_event(event) for event in sshow.events]
         else:
-            events = None
+            events = [await self._map_metadata(event) for event in sshow.events]
 
         return m.Show.map(sshow, events)
 
@@ -97,10 +332,14 @@ class EventsService:
         transaction: SapphireService,
         limit: int | None,
         offset: int | None,
+        cursor: m.EventCursor | None,
         where: m.EventWhereInput | None,
         include: m.EventInclude | None,
         order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None,
     ) -> Sequence[sm.Event]:
+        # Cursors are continued with filters, which still work if the event is gone
+        where = self._where_after(where, cursor, order)
+
         with self._handle_errors():
             return await transaction.event.find_many(
                 take=limit,
@@ -112,6 +351,143 @@ class EventsService:
                 else cast("st.EventOrderByInput | None", order),
             )
 
+    def _is_raw_order(
+        self, order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None
+    ) -> bool:
+        if order is not None and not isinstance(order, Sequence):
+            order = [order]
+
+        return order is None or list(order) == [{"id": "asc"}]
+
+    def _unwrap_conditions(self, where: m.EventWhereInput) -> Mapping[str, Any] | None:
+        conditions = cast("Mapping[str, Any]", where)
+
+        # Queries to howlite are added to the filter as the only condition
+        if conditions.keys() == {"AND"} and isinstance(conditions["AND"], list):
+            if len(conditions["AND"]) != 1:
+                return None
+
+            return conditions["AND"][0]
+
+        return conditions
+
+    def _match_by_ids(
+        self, conditions: Mapping[str, Any]
+    ) -> tuple[str, LiteralString, Any] | None:
+        ids = conditions.get("id")
+
+        if (
+            conditions.keys() != {"id"}
+            or not isinstance(ids, dict)
+            or ids.keys() != {"in"}
+            or not all(isuuid(value) for value in ids["in"])
+        ):
+            return None
+
+        return "by_ids", EVENTS_BY_IDS_QUERY, list(ids["in"])
+
+    def _match_by_show(
+        self, conditions: Mapping[str, Any]
+    ) -> tuple[str, LiteralString, Any] | None:
+        show_id = conditions.get("showId")
+
+        if conditions.keys() != {"showId"} or not isuuid(show_id):
+            return None
+
+        return "by_show", EVENTS_BY_SHOW_QUERY, show_id
+
+    def _match_raw_shape(
+        self,
+        cursor: m.EventCursor | None,
+        where: m.EventWhereInput | None,
+        include: m.EventInclude | None,
+        order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None,
+    ) -> tuple[str, LiteralString, Any] | None:
+        if include or where is None or not self._is_raw_order(order):
+            return None
+
+        if cursor is not None and not isuuid(cursor["values"]["id"]):
+            return None
+
+        conditions = self._unwrap_conditions(where)
+
+        if conditions is None:
+            return None
+
+        return self._match_by_ids(conditions) or self._match_by_show(conditions)
+
+    def _is_raw_enabled(self, shape: str) -> bool:
+        match shape:
+            case "by_ids":
+                return self._raw.events_by_ids
+            case "by_show":
+                return self._raw.events_by_show
+            case _:
+                return False
+
+    async def _list_raw_events(  # noqa: PLR0913
+        self,
+        client: SapphireService,
+        query: LiteralString,
+        argument: Any,
+        limit: int | None,
+        offset: int | None,
+        cursor: m.EventCursor | None,
+    ) -> tuple[Sequence[sm.Event], int | None]:
+        with self._handle_errors():
+            rows = await client.query_raw(
+                query,
+                argument,
+                cursor["values"]["id"] if cursor is not None else None,
+                limit,
+                offset,
+            )
+
+        # Rows are read straight from the database, so they don't need validation
+        sevents = [
+            sm.Event.model_construct(
+                id=row["id"], type=m.EventType(row["type"]), showId=row["show_id"]
+            )
+            for row in rows
+        ]
+
+        # Every row carries the number of all matching rows, regardless of the page
+        return sevents, rows[0]["count"] if rows else None
+
+    async def _read_sapphire_events(  # noqa: PLR0913
+        self,
+        limit: int | None,
+        offset: int | None,
+        cursor: m.EventCursor | None,
+        where: m.EventWhereInput | None,
+        include: m.EventInclude | None,
+        order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None,
+    ) -> tuple[Sequence[sm.Event], int | None]:
+        raw = self._match_raw_shape(cursor, where, include, order)
+
+        if raw is None:
+            async with self._read("list", include) as client:
+                sevents = await self._list_sapphire_events(
+                    client, limit, offset, cursor, where, include, order
+                )
+
+            return sevents, None
+
+        shape, query, argument = raw
+
+        # Both ways are measured under the same name, so they can be compared
+        async with self._read(f"list.{shape}", include) as client:
+            if self._is_raw_enabled(shape):
+                return await self._list_raw_events(
+                    client, query, argument, limit, offset, cursor
+                )
+
+            sevents = await self._list_sapphire_events(
+                client, limit, offset, cursor, where, include, order
+            )
+
+        return sevents, None
+
     async def _get_sapphire_event(
         self,
         transaction: SapphireService,
@@ -121,6 +497,12 @@ class EventsService:
         with self._handle_errors():
             return await transaction.event.find_unique(where=where, include=include)
 
+    async def _read_sapphire_event(
+        self, where: m.EventWhereUniqueInput, include: m.EventInclude | None
+    ) -> sm.Event | None:
+        async with self._read("get", include) as client:
+            return await self._get_sapphire_event(client, where, include)
+
     async def _create_sapphire_event(
         self,
         transaction: SapphireService,
@@ -152,6 +534,44 @@ class EventsService:
         with self._handle_errors():
             return await transaction.event.update(data=d, where=where, include=include)
 
+    async def _update_many_sapphire_events(
+        self,
+        transaction: SapphireService,
+        items: Sequence[m.BulkUpdateItem],
+        include: m.EventInclude | None,
+    ) -> Mapping[str, sm.Event]:
+        retyped: defaultdict[m.EventType, list[str]] = defaultdict(list)
+        renamed: dict[str, str] = {}
+
+        for item in items:
+            event_id = item.where["id"]
+
+            # Identifiers are unique, so each change of one needs its own update
+            if "id" in item.data and item.data["id"] != event_id:
+                await self._update_sapphire_event(
+                    transaction, item.data, item.where, None
+                )
+                renamed[event_id] = item.data["id"]
+            elif "type" in item.data:
+                retyped[item.data["type"]].append(event_id)
+
+        with self._handle_errors():
+            for event_type, ids in retyped.items():
+                await transaction.event.update_many(
+                    data={"type": event_type}, where={"id": {"in": ids}}
+                )
+
+        sevents = await self._find_sapphire_events(
+            transaction,
+            [renamed.get(item.where["id"], item.where["id"]) for item in items],
+            include,
+        )
+
+        return {
+            item.where["id"]: sevents[renamed.get(item.where["id"], item.where["id"])]
+            for item in items
+        }
+
     async def _delete_sapphire_event(
         self,
         transaction: SapphireService,
@@ -161,23 +581,187 @@ class EventsService:
         with self._handle_errors():
             return await transaction.event.delete(where=where, include=include)
 
+    async def _find_sapphire_events(
+        self,
+        transaction: SapphireService,
+        ids: Sequence[str],
+        include: m.EventInclude | None,
+    ) -> Mapping[str, sm.Event]:
+        with self._handle_errors():
+            sevents = await transaction.event.find_many(
+                where={"id": {"in": list(ids)}}, include=include
+            )
+
+        return {sevent.id: sevent for sevent in sevents}
+
+    async def _check_sapphire_shows(
+        self,
+        transaction: SapphireService,
+        data: Mapping[int, m.EventCreateInput],
+    ) -> Mapping[int, e.ServiceError]:
+        ids = {d["showId"] for d in data.values() if d.get("showId") is not None}
+
+        with self._handle_errors():
+            sshows = await transaction.show.find_many(
+                where={"id": {"in": [show_id for show_id in ids if isuuid(show_id)]}}
+            )
+
+        found = {sshow.id for sshow in sshows}
+
+        return {
+            index: e.ShowDoesNotExistError(d["showId"])
+            for index, d in data.items()
+            if d.get("showId") is not None and d["showId"] not in found
+        }
+
+    async def _check_sapphire_renames(
+        self,
+        transaction: SapphireService,
+        items: Mapping[int, m.BulkUpdateItem],
+    ) -> Mapping[int, e.ServiceError]:
+        targets = {
+            index: item.data["id"]
+            for index, item in items.items()
+            if "id" in item.data and item.data["id"] != item.where["id"]
+        }
+        taken = await self._find_sapphire_events(
+            transaction, list(targets.values()), None
+        )
+        claimed: set[str] = set()
+        errors: dict[int, e.ServiceError] = {}
+
+        # Renames are checked upfront, so that one can't fail the whole batch
+        for index, target in targets.items():
+            if target in taken:
+                errors[index] = e.EventAlreadyExistsError(target)
+            elif target in claimed:
+                errors[index] = e.DuplicateEventError(target)
+
+            claimed.add(target)
+
+        return errors
+
+    async def _create_many_sapphire_events(
+        self, transaction: SapphireService, data: Sequence[m.EventCreateInput]
+    ) -> None:
+        ds: list[st.EventCreateWithoutRelationsInput] = []
+
+        for item in data:
+            d: st.EventCreateWithoutRelationsInput = {"type": item["type"]}
+            if "id" in item:
+                d["id"] = item["id"]
+            if "showId" in item:
+                d["showId"] = item["showId"]
+            ds.append(d)
+
+        if not ds:
+            return
+
+        with self._handle_errors():
+            await transaction.event.create_many(data=ds)
+
+    async def _restore_sapphire_events(
+        self, transaction: SapphireService, sevents: Sequence[sm.Event]
+    ) -> None:
+        data: list[st.EventCreateWithoutRelationsInput] = []
+
+        for sevent in sevents:
+            d: st.EventCreateWithoutRelationsInput = {
+                "id": sevent.id,
+                "type": sevent.type,
+            }
+            if sevent.showId is not None:
+                d["showId"] = sevent.showId
+            data.append(d)
+
+        if not data:
+            return
+
+        with self._handle_errors():
+            await transaction.event.create_many(data=data)
+
+    async def _restore_sapphire_event(
+        self, transaction: SapphireService, osevent: sm.Event, nsevent: sm.Event
+    ) -> None:
+        with self._handle_errors():
+            await transaction.event.update(
+                data={"id": osevent.id, "type": osevent.type},
+                where={"id": nsevent.id},
+            )
+
+    async def _delete_many_sapphire_events(
+        self, transaction: SapphireService, ids: Sequence[str]
+    ) -> None:
+        if not ids:
+            return
+
+        with self._handle_errors():
+            await transaction.event.delete_many(where={"id": {"in": list(ids)}})
+
+    async def _pending_howlite_events(
+        self, ids: Sequence[UUID]
+    ) -> Mapping[UUID, hm.Event | None]:
+        if not self._outbox.enabled:
+            return {}
+
+        request = om.PendingRequest(ids=ids)
+
+        with self._handle_errors():
+            response = await self._outbox.pending(request)
+
+        return response.events
+
+    async def _defer_howlite_events(
+        self,
+        transaction: SapphireService,
+        upserts: Sequence[hm.Event],
+        deletes: Sequence[UUID] = (),
+    ) -> None:
+        writes = [
+            *(om.Write(id=event_id, event=None) for event_id in deletes),
+            *(om.Write(id=hevent.id, event=hevent) for hevent in upserts),
+        ]
+        request = om.PushRequest(transaction=transaction, writes=writes)
+
+        with self._handle_errors():
+            await self._outbox.push(request)
+
     async def _list_howlite_events(
         self, sevents: Sequence[sm.Event]
     ) -> Sequence[hm.Event]:
+        # Writes still waiting in the outbox take precedence, to read your own writes
+        pending = await self._pending_howlite_events([UUID(s.id) for s in sevents])
+
+        # Events found by queries earlier in the request were already read in full
+        queried = {
+            hevent.id: hevent
+            for hevents in self._queries.values()
+            for hevent in hevents
+        }
+
         hevents = []
 
         for sevent in sevents:
-            request = hm.GetEventRequest(id=UUID(sevent.id))
+            hevent = pending.get(UUID(sevent.id)) or queried.get(UUID(sevent.id))
 
-            with self._handle_errors():
-                response = await self._howlite.get_event(request)
+            if hevent is None:
+                request = hm.GetEventRequest(id=UUID(sevent.id))
+
+                with self._handle_errors():
+                    response = await self._howlite.get_event(request)
+
+                hevent = response.event
 
-            hevent = response.event
             hevents.append(hevent)
 
         return hevents
 
     async def _get_howlite_event(self, sevent: sm.Event) -> hm.Event:
+        pending = await self._pending_howlite_events([UUID(sevent.id)])
+
+        if (hevent := pending.get(UUID(sevent.id))) is not None:
+            return hevent
+
         request = hm.GetEventRequest(id=UUID(sevent.id))
 
         with self._handle_errors():
@@ -185,11 +769,22 @@ class EventsService:
 
         return response.event
 
-    async def _create_howlite_event(
-        self, data: m.EventCreateInput, sevent: sm.Event
+    async def _find_howlite_event(self, event_id: UUID) -> hm.FindEventResponse:
+        pending = await self._pending_howlite_events([event_id])
+
+        if (hevent := pending.get(event_id)) is not None:
+            return hm.FindEventResponse(event=hevent, etag=None)
+
+        request = hm.FindEventRequest(id=event_id)
+
+        with self._handle_errors():
+            return await self._howlite.find_event(request)
+
+    def _build_created_howlite_event(
+        self, data: m.EventCreateInput, event_id: str
     ) -> hm.Event:
-        hevent = hm.Event(
-            id=UUID(sevent.id),
+        return hm.Event(
+            id=UUID(event_id),
             start=data["start"],
             duration=data["duration"],
             timezone=data["timezone"],
@@ -197,6 +792,11 @@ class EventsService:
             include=data.get("include"),
             exclude=data.get("exclude"),
         )
+
+    async def _create_howlite_event(
+        self, data: m.EventCreateInput, sevent: sm.Event
+    ) -> hm.Event:
+        hevent = self._build_created_howlite_event(data, sevent.id)
         request = hm.UpsertEventRequest(event=hevent)
 
         with self._handle_errors():
@@ -204,14 +804,9 @@ class EventsService:
 
         return response.event
 
-    async def _update_howlite_event(
-        self, data: m.EventUpdateInput, osevent: sm.Event, nsevent: sm.Event
+    def _build_updated_howlite_event(
+        self, data: m.EventUpdateInput, ohevent: hm.Event, nsevent: sm.Event
     ) -> hm.Event:
-        with self._handle_errors():
-            request = hm.GetEventRequest(id=UUID(osevent.id))
-            response = await self._howlite.get_event(request)
-            ohevent = response.event
-
         ohrec = ohevent.recurrence
 
         if "recurrence" not in data:
@@ -259,7 +854,7 @@ class EventsService:
                     week_start=rec.get("week_start"),
                 )
 
-        nhevent = hm.Event(
+        return hm.Event(
             id=UUID(nsevent.id),
             start=data.get("start", ohevent.start),
             duration=data.get("duration", ohevent.duration),
@@ -269,19 +864,75 @@ class EventsService:
             exclude=data.get("exclude", ohevent.exclude),
         )
 
-        if ohevent.id != nhevent.id:
-            request = hm.DeleteEventRequest(id=ohevent.id)
+    async def _update_howlite_event(
+        self, data: m.EventUpdateInput, osevent: sm.Event, nsevent: sm.Event
+    ) -> hm.Event:
+        with self._handle_errors():
+            request = hm.GetEventRequest(id=UUID(osevent.id))
+            response = await self._howlite.get_event(request)
+            ohevent = response.event
 
-            with self._handle_errors():
-                await self._howlite.delete_event(request)
+        nhevent = self._build_updated_howlite_event(data, ohevent, nsevent)
 
         request = hm.UpsertEventRequest(event=nhevent)
 
         with self._handle_errors():
             response = await self._howlite.upsert_event(request)
 
+        # The old event is removed only once the new one is stored,
+        # so a failure in between never leaves the event missing
+        if ohevent.id != nhevent.id:
+            delete_request = hm.DeleteEventRequest(id=ohevent.id, etag=None)
+
+            try:
+                with self._handle_errors():
+                    await self._howlite.delete_event(delete_request)
+            except e.ServiceError:
+                # Compensate for the event written under the new identifier
+                compensate_request = hm.DeleteEventRequest(id=nhevent.id, etag=None)
+
+                with suppress(he.ServiceError):
+                    await self._howlite.delete_event(compensate_request)
+
+                raise
+
         return response.event
 
+    async def _put_howlite_event(
+        self, data: m.EventUpdateInput, state: m.EventState, nsevent: sm.Event
+    ) -> tuple[hm.Event, str | None]:
+        nhevent = self._build_updated_howlite_event(data, state.hevent, nsevent)
+
+        if state.hevent.id == nhevent.id:
+            request = hm.PutEventRequest(event=nhevent, etag=state.etag)
+
+            with self._handle_errors():
+                response = await self._howlite.put_event(request)
+
+            return nhevent, response.etag
+
+        # The new identifier is not taken yet, so only the old event needs matching
+        request = hm.PutEventRequest(event=nhevent, etag=None)
+
+        with self._handle_errors():
+            response = await self._howlite.put_event(request)
+
+        delete_request = hm.DeleteEventRequest(id=state.hevent.id, etag=state.etag)
+
+        try:
+            with self._handle_errors():
+                await self._howlite.delete_event(delete_request)
+        except e.ServiceError:
+            # Compensate for the event written under the new identifier
+            compensate_request = hm.DeleteEventRequest(id=nhevent.id, etag=None)
+
+            with suppress(he.ServiceError):
+                await self._howlite.delete_event(compensate_request)
+
+            raise
+
+        return nhevent, response.etag
+
     async def _delete_howlite_event(self, dsevent: sm.Event) -> hm.Event:
         get_event_request = hm.GetEventRequest(id=UUID(dsevent.id))
 
@@ -289,45 +940,277 @@ class EventsService:
             get_event_response = await self._howlite.get_event(get_event_request)
 
         hevent = get_event_response.event
-        delete_event_request = hm.DeleteEventRequest(id=hevent.id)
+        delete_event_request = hm.DeleteEventRequest(id=hevent.id, etag=None)
 
         with self._handle_errors():
             await self._howlite.delete_event(delete_event_request)
 
         return hevent
 
-    async def _sort_events(
-        self,
-        events: Sequence[m.Event],
-        order: m.EventOrderByInput | Sequence[m.EventOrderByInput] | None,
-    ) -> Sequence[m.Event]:
-        if order is None:
-            return list(events)
-
-        if not isinstance(order, Sequence):
-            order = [order]
-
-        for item in reversed(order):
-            for key, direction in item.items():
-                events = sorted(
-                    events,
-                    key=lambda event: getattr(event, key),
-                    reverse=direction == "desc",
-                )
-
-        return list(events)
-
-    def _list_event_instances(
-        self, event: m.Event, start: datetime, end: datetime, *, exceptions: bool
-    ) -> Sequence[im.Instance]:
-        ievent = im.Event(
+    def _build_howlite_event(self, event: m.Event) -> hm.Event:
+        return hm.Event(
             id=UUID(event.id),
             start=event.start,
             duration=event.duration,
             timezone=event.timezone,
             recurrence=event.recurrence,
-            include=event.include if exceptions else None,
-            exclude=event.exclude if exceptions else None,
+            include=event.include,
+            exclude=event.exclude,
+        )
+
+    async def _check_overlaps(
+        self, hevents: Sequence[hm.Event], exclude: AbstractSet[str]
+    ) -> None:
+        request = cfm.CheckRequest(events=hevents, exclude=exclude)
+
+        with self._handle_errors():
+            response = await self._conflicts.check(request)
+
+        if response.conflicts:
+            conflict = min(response.conflicts, key=lambda c: (c.start, c.event_id))
+            raise e.EventOverlapError(conflict.event_id, conflict.start)
+
+    async def _check_created_overlaps(
+        self, data: m.EventCreateInput
+    ) -> m.EventCreateInput:
+        # The identifier is fixed upfront, so the checked event is the created one
+        event_id, data = self._assign_event_id(data)
+        hevent = self._build_created_howlite_event(data, event_id)
+        await self._check_overlaps([hevent], set())
+        return data
+
+    async def _check_updated_overlaps(
+        self, data: m.EventUpdateInput, where: m.EventWhereUniqueInput
+    ) -> None:
+        osevent = await self._read_sapphire_event(where, None)
+
+        if osevent is None:
+            return
+
+        ohevent = await self._get_howlite_event(osevent)
+        nhevent = self._build_updated_howlite_event(data, ohevent, osevent)
+        await self._check_overlaps([nhevent], {osevent.id})
+
+    async def _refresh_instances(
+        self, events: Sequence[m.Event | None], previous: Sequence[str] = ()
+    ) -> None:
+        written = {event.id for event in events if event}
+        # Events stored under a new identifier leave their old instances behind
+        ids = set(previous) - written
+
+        # The events are already written and failed refreshes stop using stale data
+        if self._occurrences.enabled:
+            with suppress(oce.ServiceError):
+                await self._occurrences.refresh(ocm.RefreshRequest(ids=written))
+
+        if self._conflicts.enabled:
+            await self._conflicts.remove(cfm.RemoveRequest(ids=ids))
+
+            with suppress(cfe.ServiceError):
+                await self._conflicts.refresh(cfm.RefreshRequest(ids=written))
+
+        if self._timeline.enabled:
+            await self._timeline.remove(tlm.RemoveRequest(ids=ids))
+
+            with suppress(tle.ServiceError):
+                await self._timeline.refresh(tlm.RefreshRequest(ids=written))
+
+    async def _remove_instances(self, events: Sequence[m.Event | None]) -> None:
+        # Occurrences are deleted together with events by sapphire itself
+        ids = {event.id for event in events if event}
+
+        if self._conflicts.enabled:
+            await self._conflicts.remove(cfm.RemoveRequest(ids=ids))
+
+        if self._timeline.enabled:
+            await self._timeline.remove(tlm.RemoveRequest(ids=ids))
+
+    async def _invalidate_occurrences(self) -> None:
+        if not self._occurrences.enabled:
+            return
+
+        # Restored events have lost their occurrences, so none can be trusted
+        with suppress(oce.ServiceError):
+            await self._occurrences.invalidate(ocm.InvalidateRequest())
+
+    async def _compensate_create(self, sevent: sm.Event) -> None:
+        async with self._transaction("compensate") as transaction:
+            await self._delete_sapphire_event(transaction, {"id": sevent.id}, None)
+
+    async def _compensate_update(self, osevent: sm.Event, nsevent: sm.Event) -> None:
+        if osevent.id == nsevent.id and osevent.type == nsevent.type:
+            return
+
+        async with self._transaction("compensate") as transaction:
+            await self._restore_sapphire_event(transaction, osevent, nsevent)
+
+    async def _compensate_delete(self, sevent: sm.Event) -> None:
+        async with self._transaction("compensate") as transaction:
+            await self._restore_sapphire_events(transaction, [sevent])
+
+        await self._invalidate_occurrences()
+
+    async def _create_deferred(
+        self, data: m.EventCreateInput, include: m.EventInclude | None
+    ) -> m.Event:
+        async with self._transaction("create") as transaction:
+            sevent = await self._create_sapphire_event(transaction, data, include)
+            hevent = self._build_created_howlite_event(data, sevent.id)
+            await self._defer_howlite_events(transaction, [hevent])
+
+        return await self._merge_event(sevent, hevent)
+
+    async def _update_deferred(
+        self,
+        data: m.EventUpdateInput,
+        where: m.EventWhereUniqueInput,
+        include: m.EventInclude | None,
+    ) -> m.Event | None:
+        osevent = await self._read_sapphire_event(where, None)
+
+        if osevent is None:
+            return None
+
+        ohevent = await self._get_howlite_event(osevent)
+
+        async with self._transaction("update") as transaction:
+            nsevent = await self._update_sapphire_event(
+                transaction, data, where, include
+            )
+
+            if nsevent is None:
+                return None
+
+            nhevent = self._build_updated_howlite_event(data, ohevent, nsevent)
+            deletes = [ohevent.id] if ohevent.id != nhevent.id else []
+            await self._defer_howlite_events(transaction, [nhevent], deletes)
+
+        return await self._merge_event(nsevent, nhevent)
+
+    async def _apply_deferred(
+        self,
+        data: m.EventUpdateInput,
+        state: m.EventState,
+        include: m.EventInclude | None,
+    ) -> m.EventState | None:
+        async with self._transaction("apply") as transaction:
+            if "id" in data or "type" in data:
+                sevent = await self._update_sapphire_event(
+                    transaction, data, {"id": state.sevent.id}, include
+                )
+            else:
+                sevent = state.sevent
+
+            if sevent is None:
+                return None
+
+            hevent = self._build_updated_howlite_event(data, state.hevent, sevent)
+            deletes = [state.hevent.id] if state.hevent.id != hevent.id else []
+            await self._defer_howlite_events(transaction, [hevent], deletes)
+
+        event = await self._merge_event(sevent, hevent)
+        return m.EventState(event=event, sevent=sevent, hevent=hevent, etag=None)
+
+    async def _delete_deferred(
+        self, where: m.EventWhereUniqueInput, include: m.EventInclude | None
+    ) -> m.Event | None:
+        sevent = await self._read_sapphire_event(where, None)
+
+        if sevent is None:
+            return None
+
+        hevent = await self._get_howlite_event(sevent)
+
+        async with self._transaction("delete") as transaction:
+            sevent = await self._delete_sapphire_event(transaction, where, include)
+
+            if sevent is None:
+                return None
+
+            await self._defer_howlite_events(transaction, [], [hevent.id])
+
+        return await self._merge_event(sevent, hevent)
+
+    async def _run_deferred(
+        self,
+        call: Callable[[], Coroutine[Any, Any, m.Event | None]],
+        event_id: str,
+    ) -> m.BulkResult:
+        try:
+            event = await call()
+        except e.ServiceError as ex:
+            return m.BulkResult(event=None, error=ex)
+
+        if event is None:
+            return m.BulkResult(event=None, error=e.EventDoesNotExistError(event_id))
+
+        return m.BulkResult(event=event, error=None)
+
+    async def _run_limited[T](
+        self,
+        semaphore: asyncio.Semaphore,
+        call: Callable[[], Coroutine[Any, Any, T]],
+    ) -> T | e.ServiceError:
+        async with semaphore:
+            try:
+                return await call()
+            except e.ServiceError as ex:
+                return ex
+
+    async def _run_bounded[T](
+        self, calls: Sequence[Callable[[], Coroutine[Any, Any, T]]]
+    ) -> Sequence[T | e.ServiceError]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        return await asyncio.gather(
+            *(self._run_limited(semaphore, call) for call in calls)
+        )
+
+    def _assign_event_id(
+        self, data: m.EventCreateInput
+    ) -> tuple[str, m.EventCreateInput]:
+        # Identifiers are needed upfront to match created rows with the input
+        event_id = data.get("id") or str(uuid4())
+
+        data = data.copy()
+        data["id"] = event_id
+
+        return event_id, data
+
+    def _sort_events(
+        self,
+        events: Sequence[m.Event],
+        order: Sequence[m.EventOrderByInput],
+        limit: int | None = None,
+    ) -> Sequence[m.Event]:
+        # Sapphire orders types as they are declared, not by their names
+        types = {event_type: index for index, event_type in enumerate(m.EventType)}
+
+        ordering: Ordering[m.Event] = Ordering(
+            order,
+            {
+                "id": lambda event: event.id,
+                "type": lambda event: types[event.type],
+                "showId": lambda event: event.show_id,
+                "start": lambda event: event.start,
+                "end": lambda event: event.start + event.duration,
+                "timezone": lambda event: event.timezone.key,
+            },
+        )
+
+        return ordering.sort(events, limit)
+
+    def _list_event_instances(
+        self, event: m.Event, start: datetime, end: datetime, *, exceptions: bool
+    ) -> Sequence[im.Instance]:
+        ievent = im.Event(
+            id=UUID(event.id),
+            start=event.start,
+            duration=event.duration,
+            timezone=event.timezone,
+            recurrence=event.recurrence,
+            include=event.include if exceptions else None,
+            exclude=event.exclude if exceptions else None,
         )
 
         with self._handle_errors():
@@ -420,25 +1303,75 @@ class EventsService:
         where = await self._where_with_query(where, query)
 
         with self._handle_errors():
-            count = await self._sapphire.event.count(where=where)
+            count = await self._flights.do(
+                flightkey("event.count", self._written, where),
+                partial(self._reader().event.count, where=where),
+            )
 
         return m.CountResponse(count=count)
 
-    async def list(self, request: m.ListRequest) -> m.ListResponse:
-        """List events."""
+    async def _page_sapphire_events(
+        self, request: m.ListRequest
+    ) -> tuple[Sequence[sm.Event], str | None, int | None]:
         limit = request.limit
         offset = request.offset
+        cursor = request.cursor
         where = request.where
         query = request.query
         include = request.include
         order = request.order
 
+        sorder = self._order_with_tiebreaker(order)
+        position = self._parse_cursor(cursor, sorder) if cursor is not None else None
         where = await self._where_with_query(where, query)
 
-        async with self._sapphire.tx() as transaction:
-            sevents = await self._list_sapphire_events(
-                transaction, limit, offset, where, include, order
-            )
+        # Fetch one more event than requested to know if there are more
+        take = limit + 1 if limit is not None else None
+        skip = offset
+
+        sevents, count = await self._flights.do(
+            flightkey(
+                "event.find_many",
+                self._written,
+                take,
+                skip,
+                position,
+                where,
+                include,
+                sorder,
+            ),
+            partial(
+                self._read_sapphire_events, take, skip, position, where, include, sorder
+            ),
+        )
+
+        more = limit is not None and len(sevents) > limit
+        sevents = sevents[:limit]
+        next_cursor = (
+            self._build_cursor(sevents[-1], sorder) if more and sevents else None
+        )
+
+        return sevents, next_cursor, count
+
+    async def _list_computed(self, request: m.ListRequest) -> m.ListResponse:
+        if request.cursor is not None:
+            raise e.CursorOrderError
+
+        where = await self._where_with_query(request.where, request.query)
+        include = request.include
+
+        # Computed fields are only known after reading howlite, so all matching events
+        # are read, but only up to a limit, as each of them needs a howlite request
+        take = self.computed + 1
+        sevents, _ = await self._flights.do(
+            flightkey(
+                "event.find_many", self._written, take, None, None, where, include, None
+            ),
+            partial(self._read_sapphire_events, take, None, None, where, include, None),
+        )
+
+        if len(sevents) > self.computed:
+            raise e.ComputedOrderLimitError(self.computed)
 
         hevents = await self._list_howlite_events(sevents)
 
@@ -446,36 +1379,227 @@ class EventsService:
             await self._merge_event(dsevent, dtevent)
             for dsevent, dtevent in zip(sevents, hevents, strict=False)
         ]
-        events = await self._sort_events(events, order)
 
-        return m.ListResponse(events=events)
+        offset = request.offset or 0
+        limit = offset + request.limit if request.limit is not None else None
+        order = self._order_with_tiebreaker(request.order)
+        events = self._sort_events(events, order, limit)[offset:]
+
+        return m.ListResponse(events=events, cursor=None, count=None)
+
+    async def list(self, request: m.ListRequest) -> m.ListResponse:
+        """List events."""
+        if self._is_computed_order(request.order):
+            return await self._list_computed(request)
+
+        sevents, next_cursor, count = await self._page_sapphire_events(request)
+        hevents = await self._list_howlite_events(sevents)
+
+        events = [
+            await self._merge_event(dsevent, dtevent)
+            for dsevent, dtevent in zip(sevents, hevents, strict=False)
+        ]
+
+        return m.ListResponse(events=events, cursor=next_cursor, count=count)
+
+    async def list_metadata(self, request: m.ListRequest) -> m.ListMetadataResponse:
+        """List events without their schedule."""
+        if self._is_computed_order(request.order):
+            # Ordering by schedule fields needs the schedule from howlite anyway
+            response = await self.list(request)
+            events = [
+                m.EventMetadata(
+                    id=event.id, type=event.type, show_id=event.show_id, show=event.show
+                )
+                for event in response.events
+            ]
+            return m.ListMetadataResponse(
+                events=events, cursor=response.cursor, count=response.count
+            )
+
+        sevents, next_cursor, count = await self._page_sapphire_events(request)
+        events = [await self._map_metadata(sevent) for sevent in sevents]
+
+        return m.ListMetadataResponse(events=events, cursor=next_cursor, count=count)
+
+    def _count_from_page(self, request: m.PageRequest, found: int) -> int | None:
+        # Counting from a cursor would need the number of items before it
+        if request.cursor is not None:
+            return None
+
+        # A page that is not full reaches the end, so it shows the total,
+        # unless the offset skipped past the end
+        if (request.limit is None or found < request.limit) and (
+            found > 0 or not request.offset
+        ):
+            return (request.offset or 0) + found
+
+        return None
+
+    async def _estimate_count(self) -> int | None:
+        with self._handle_errors():
+            rows = await self._reader().query_raw(
+                "SELECT reltuples::bigint AS count FROM pg_class "
+                "WHERE oid = 'events'::regclass"
+            )
+
+        count = rows[0]["count"] if rows else -1
+
+        # Tables that were never analyzed have no estimate
+        return count if count >= 0 else None
+
+    async def page(self, request: m.PageRequest) -> m.PageResponse:
+        """List a page of events along with the number of all matching events."""
+        # Query howlite only once for both the page and the count
+        where = await self._where_with_query(request.where, request.query)
+
+        list_request = m.ListRequest(
+            limit=request.limit,
+            offset=request.offset,
+            cursor=request.cursor,
+            where=where,
+            query=None,
+            include=request.include,
+            order=request.order,
+        )
+
+        if request.schedule:
+            list_response = await self.list(list_request)
+        else:
+            list_response = await self.list_metadata(list_request)
+
+        count = self._count_from_page(request, len(list_response.events))
+
+        # Hand-written queries count all matching events along with the page
+        if count is None:
+            count = list_response.count
+
+        if count is None and request.count == "estimated" and not where:
+            count = await self._estimate_count()
+
+        if count is None:
+            count_response = await self.count(m.CountRequest(where=where, query=None))
+            count = count_response.count
+
+        return m.PageResponse(
+            events=list_response.events, cursor=list_response.cursor, count=count
+        )
+
+    async def _stream(
+        self, request: m.StreamRequest
+    ) -> AsyncGenerator[m.Event | m.EventMetadata]:
+        remaining = request.limit
+        offset = request.offset
+        cursor = None
+
+        # Fetch events in batches, so that only one batch is held at a time
+        while remaining is None or remaining > 0:
+            limit = min(self.batch, remaining) if remaining is not None else self.batch
+            list_request = m.ListRequest(
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                where=request.where,
+                query=request.query,
+                include=request.include,
+                order=request.order,
+            )
+
+            if request.schedule:
+                response = await self.list(list_request)
+            else:
+                response = await self.list_metadata(list_request)
+
+            for event in response.events:
+                yield event
+
+            if response.cursor is None:
+                return
+
+            if remaining is not None:
+                remaining -= len(response.events)
+
+            offset = None
+            cursor = response.cursor
+
+    async def stream(self, request: m.StreamRequest) -> m.StreamResponse:
+        """Stream events."""
+        # Batches are chained with cursors, which computed orders do not support
+        if self._is_computed_order(request.order):
+            raise e.StreamOrderError
+
+        return m.StreamResponse(events=self._stream(request))
 
     async def get(self, request: m.GetRequest) -> m.GetResponse:
         """Get event."""
         where = request.where
         include = request.include
 
-        async with self._sapphire.tx() as transaction:
-            sevent = await self._get_sapphire_event(transaction, where, include)
+        try:
+            event_id = UUID(where["id"])
+        except ValueError:
+            event_id = None
+
+        if event_id is None:
+            sevent = await self._read_sapphire_event(where, include)
+            hevent = None
+        else:
+            # The identifier is known upfront, so both stores can be read at once
+            sevent, response = await asyncio.gather(
+                self._read_sapphire_event(where, include),
+                self._find_howlite_event(event_id),
+            )
+            hevent = response.event
 
         if sevent is None:
             return m.GetResponse(event=None)
 
-        hevent = await self._get_howlite_event(sevent)
+        if hevent is None:
+            # The speculative read could have missed an event written in between
+            hevent = await self._get_howlite_event(sevent)
+
         event = await self._merge_event(sevent, hevent)
 
         return m.GetResponse(event=event)
 
+    async def get_metadata(self, request: m.GetRequest) -> m.GetMetadataResponse:
+        """Get event without its schedule."""
+        sevent = await self._read_sapphire_event(request.where, request.include)
+
+        if sevent is None:
+            return m.GetMetadataResponse(event=None)
+
+        event = await self._map_metadata(sevent)
+
+        return m.GetMetadataResponse(event=event)
+
     async def create(self, request: m.CreateRequest) -> m.CreateResponse:
         """Create event."""
         data = request.data
         include = request.include
 
-        async with self._sapphire.tx() as transaction:
+        self._queries.clear()
+
+        if request.reject_overlaps:
+            data = await self._check_created_overlaps(data)
+
+        if self._outbox.enabled:
+            event = await self._create_deferred(data, include)
+            await self._refresh_instances([event])
+            return m.CreateResponse(event=event)
+
+        async with self._transaction("create") as transaction:
             sevent = await self._create_sapphire_event(transaction, data, include)
+
+        # Howlite is written after the transaction commits and undone on failure
+        try:
             hevent = await self._create_howlite_event(data, sevent)
+        except e.ServiceError:
+            await self._compensate_create(sevent)
+            raise
 
         event = await self._merge_event(sevent, hevent)
+        await self._refresh_instances([event])
         return m.CreateResponse(event=event)
 
     async def update(self, request: m.UpdateRequest) -> m.UpdateResponse:
@@ -484,59 +1608,189 @@ class EventsService:
         where = request.where
         include = request.include
 
-        async with self._sapphire.tx() as transaction:
+        self._queries.clear()
+
+        if request.reject_overlaps:
+            await self._check_updated_overlaps(data, where)
+
+        if self._outbox.enabled:
+            event = await self._update_deferred(data, where, include)
+            await self._refresh_instances([event], [where["id"]])
+            return m.UpdateResponse(event=event)
+
+        async with self._transaction("update") as transaction:
             osevent = await self._get_sapphire_event(transaction, where, None)
             nsevent = await self._update_sapphire_event(
                 transaction, data, where, include
             )
 
-            if osevent is None or nsevent is None:
-                return m.UpdateResponse(event=None)
+        if osevent is None or nsevent is None:
+            return m.UpdateResponse(event=None)
 
+        try:
             hevent = await self._update_howlite_event(data, osevent, nsevent)
+        except e.ServiceError:
+            await self._compensate_update(osevent, nsevent)
+            raise
 
         event = await self._merge_event(nsevent, hevent)
+        await self._refresh_instances([event], [osevent.id])
         return m.UpdateResponse(event=event)
 
+    async def load(self, request: m.LoadRequest) -> m.LoadResponse:
+        """Load the stored state of an event to apply an update to it later."""
+        where = request.where
+        include = request.include
+
+        try:
+            event_id = UUID(where["id"])
+        except ValueError:
+            return m.LoadResponse(state=None)
+
+        sevent, response = await asyncio.gather(
+            self._read_sapphire_event(where, include),
+            self._find_howlite_event(event_id),
+        )
+
+        if sevent is None or response.event is None:
+            return m.LoadResponse(state=None)
+
+        event = await self._merge_event(sevent, response.event)
+
+        return m.LoadResponse(
+            state=m.EventState(
+                event=event, sevent=sevent, hevent=response.event, etag=response.etag
+            )
+        )
+
+    async def apply(self, request: m.ApplyRequest) -> m.ApplyResponse:
+        """Apply an update to a loaded event, if it was not changed since."""
+        data = request.data
+        state = request.state
+        include = request.include
+
+        self._queries.clear()
+
+        if self._outbox.enabled:
+            state = await self._apply_deferred(data, state, include)
+            await self._refresh_instances(
+                [state.event if state else None], [request.state.sevent.id]
+            )
+            return m.ApplyResponse(state=state)
+
+        # Without an entity tag, changes made since loading could not be detected
+        if state.etag is None:
+            raise e.EventChangedError
+
+        # Only identifier and type are stored in sapphire
+        if "id" not in data and "type" not in data:
+            hevent, etag = await self._put_howlite_event(data, state, state.sevent)
+            event = await self._merge_event(state.sevent, hevent)
+            await self._refresh_instances([event])
+            return m.ApplyResponse(
+                state=m.EventState(
+                    event=event, sevent=state.sevent, hevent=hevent, etag=etag
+                )
+            )
+
+        async with self._transaction("apply") as transaction:
+            sevent = await self._update_sapphire_event(
+                transaction, data, {"id": state.sevent.id}, include
+            )
+
+        if sevent is None:
+            return m.ApplyResponse(state=None)
+
+        try:
+            hevent, etag = await self._put_howlite_event(data, state, sevent)
+        except e.ServiceError:
+            await self._compensate_update(state.sevent, sevent)
+            raise
+
+        event = await self._merge_event(sevent, hevent)
+        await self._refresh_instances([event], [state.sevent.id])
+        return m.ApplyResponse(
+            state=m.EventState(event=event, sevent=sevent, hevent=hevent, etag=etag)
+        )
+
     async def split(self, request: m.SplitRequest) -> m.SplitResponse:
         """Split event."""
         where = request.where
         data = request.data
         include = request.include
 
-        async with self._sapphire.tx() as transaction:
-            bsevent = await self._get_sapphire_event(transaction, where, include)
+        self._queries.clear()
 
-            if bsevent is None:
-                return m.SplitResponse(result=None)
+        bsevent = await self._read_sapphire_event(where, include)
 
-            bhevent = await self._get_howlite_event(bsevent)
-            bevent = await self._merge_event(bsevent, bhevent)
+        if bsevent is None:
+            return m.SplitResponse(result=None)
 
-            if bevent.recurrence is None:
-                raise e.SplitOneTimeEventError
+        bhevent = await self._get_howlite_event(bsevent)
+        bevent = await self._merge_event(bsevent, bhevent)
+
+        if bevent.recurrence is None:
+            raise e.SplitOneTimeEventError
 
-            result = self._find_event_instance(bevent, data["at"], exceptions=False)
+        result = self._find_event_instance(bevent, data["at"], exceptions=False)
 
-            if result is None:
-                raise e.SplitInstanceMatchError(bevent.id, data["at"])
+        if result is None:
+            raise e.SplitInstanceMatchError(bevent.id, data["at"])
 
-            instance, position = result
+        instance, position = result
 
-            if position == 0:
-                raise e.SplitFirstInstanceError(bevent.id, data["at"])
+        if position == 0:
+            raise e.SplitFirstInstanceError(bevent.id, data["at"])
 
-            cdata = self._create_split_event_create_input(
-                bevent, bevent.recurrence, instance, position, data.get("update")
+        cdata = self._create_split_event_create_input(
+            bevent, bevent.recurrence, instance, position, data.get("update")
+        )
+        udata = self._create_split_event_update_input(bevent, instance)
+
+        if request.reject_overlaps:
+            event_id, cdata = self._assign_event_id(cdata)
+            await self._check_overlaps(
+                [
+                    self._build_created_howlite_event(cdata, event_id),
+                    self._build_updated_howlite_event(udata, bhevent, bsevent),
+                ],
+                {bsevent.id},
             )
-            udata = self._create_split_event_update_input(bevent, instance)
 
+        if self._outbox.enabled:
+            async with self._transaction("split") as transaction:
+                asevent = await self._create_sapphire_event(transaction, cdata, include)
+                ahevent = self._build_created_howlite_event(cdata, asevent.id)
+                bhevent = self._build_updated_howlite_event(udata, bhevent, bsevent)
+                await self._defer_howlite_events(transaction, [ahevent, bhevent])
+
+            bevent = await self._merge_event(bsevent, bhevent)
+            aevent = await self._merge_event(asevent, ahevent)
+            await self._refresh_instances([bevent, aevent])
+            return m.SplitResponse(result=m.SplitResult(before=bevent, after=aevent))
+
+        async with self._transaction("split") as transaction:
             asevent = await self._create_sapphire_event(transaction, cdata, include)
+
+        try:
             ahevent = await self._create_howlite_event(cdata, asevent)
+        except e.ServiceError:
+            await self._compensate_create(asevent)
+            raise
+
+        try:
             bhevent = await self._update_howlite_event(udata, bsevent, bsevent)
+        except e.ServiceError:
+            # Compensation must not hide the original error or skip the next step
+            with suppress(e.ServiceError):
+                await self._delete_howlite_event(asevent)
+
+            await self._compensate_create(asevent)
+            raise
 
         bevent = await self._merge_event(bsevent, bhevent)
         aevent = await self._merge_event(asevent, ahevent)
+        await self._refresh_instances([bevent, aevent])
         return m.SplitResponse(result=m.SplitResult(before=bevent, after=aevent))
 
     async def delete(self, request: m.DeleteRequest) -> m.DeleteResponse:
@@ -544,13 +1798,290 @@ class EventsService:
         where = request.where
         include = request.include
 
-        async with self._sapphire.tx() as transaction:
+        self._queries.clear()
+
+        if self._outbox.enabled:
+            event = await self._delete_deferred(where, include)
+            await self._remove_instances([event])
+            return m.DeleteResponse(event=event)
+
+        async with self._transaction("delete") as transaction:
             sevent = await self._delete_sapphire_event(transaction, where, include)
 
-            if sevent is None:
-                return m.DeleteResponse(event=None)
+        if sevent is None:
+            return m.DeleteResponse(event=None)
 
+        try:
             hevent = await self._delete_howlite_event(sevent)
+        except e.ServiceError:
+            await self._compensate_delete(sevent)
+            raise
 
         event = await self._merge_event(sevent, hevent)
+        await self._remove_instances([event])
         return m.DeleteResponse(event=event)
+
+    async def bulk_create(self, request: m.BulkCreateRequest) -> m.BulkCreateResponse:
+        """Create events in bulk."""
+        items = [self._assign_event_id(data) for data in request.data]
+        include = request.include
+
+        self._queries.clear()
+
+        # Each event is committed on its own together with its pending write
+        if self._outbox.enabled:
+            results = [
+                await self._run_deferred(
+                    partial(self._create_deferred, data, include), event_id
+                )
+                for event_id, data in items
+            ]
+            await self._refresh_instances([result.event for result in results])
+            return m.BulkCreateResponse(results=results)
+
+        events: dict[int, m.Event] = {}
+        errors: dict[int, e.ServiceError] = {}
+        pending: list[int] = []
+
+        async with self._transaction("bulk_create") as transaction:
+            existing = await self._find_sapphire_events(
+                transaction, [event_id for event_id, _ in items], None
+            )
+            seen = set(existing)
+
+            for index, (event_id, _) in enumerate(items):
+                if event_id in existing:
+                    errors[index] = e.EventAlreadyExistsError(event_id)
+                elif event_id in seen:
+                    errors[index] = e.DuplicateEventError(event_id)
+                else:
+                    pending.append(index)
+
+                seen.add(event_id)
+
+            errors |= await self._check_sapphire_shows(
+                transaction, {index: items[index][1] for index in pending}
+            )
+            pending = [index for index in pending if index not in errors]
+
+            await self._create_many_sapphire_events(
+                transaction, [items[index][1] for index in pending]
+            )
+            sevents = await self._find_sapphire_events(
+                transaction, [items[index][0] for index in pending], include
+            )
+
+        hevents = await self._run_bounded(
+            [
+                partial(
+                    self._create_howlite_event,
+                    items[index][1],
+                    sevents[items[index][0]],
+                )
+                for index in pending
+            ]
+        )
+
+        failed: list[str] = []
+
+        for index, hevent in zip(pending, hevents, strict=True):
+            sevent = sevents[items[index][0]]
+
+            if isinstance(hevent, e.ServiceError):
+                errors[index] = hevent
+                failed.append(sevent.id)
+            else:
+                events[index] = await self._merge_event(sevent, hevent)
+
+        # Compensate for events that could not be created in howlite
+        if failed:
+            async with self._transaction("compensate") as transaction:
+                await self._delete_many_sapphire_events(transaction, failed)
+
+        await self._refresh_instances(list(events.values()))
+
+        return m.BulkCreateResponse(
+            results=[
+                m.BulkResult(event=events.get(index), error=errors.get(index))
+                for index in range(len(items))
+            ]
+        )
+
+    async def bulk_update(self, request: m.BulkUpdateRequest) -> m.BulkUpdateResponse:
+        """Update events in bulk."""
+        items = request.items
+        include = request.include
+
+        self._queries.clear()
+
+        if self._outbox.enabled:
+            results = [
+                await self._run_deferred(
+                    partial(self._update_deferred, item.data, item.where, include),
+                    item.where["id"],
+                )
+                for item in items
+            ]
+            await self._refresh_instances(
+                [result.event for result in results],
+                [
+                    item.where["id"]
+                    for item, result in zip(items, results, strict=True)
+                    if result.event is not None
+                ],
+            )
+            return m.BulkUpdateResponse(results=results)
+
+        events: dict[int, m.Event] = {}
+        errors: dict[int, e.ServiceError] = {}
+        pending: list[int] = []
+        nsevents: dict[int, sm.Event] = {}
+
+        async with self._transaction("bulk_update") as transaction:
+            osevents = await self._find_sapphire_events(
+                transaction, [item.where["id"] for item in items], include
+            )
+            seen: set[str] = set()
+
+            for index, item in enumerate(items):
+                event_id = item.where["id"]
+
+                if event_id not in osevents:
+                    errors[index] = e.EventDoesNotExistError(event_id)
+                elif event_id in seen:
+                    errors[index] = e.DuplicateEventError(event_id)
+                else:
+                    pending.append(index)
+
+                seen.add(event_id)
+
+            errors |= await self._check_sapphire_renames(
+                transaction, {index: items[index] for index in pending}
+            )
+            pending = [index for index in pending if index not in errors]
+
+            # Only identifier and type are stored in sapphire
+            changed = [
+                index
+                for index in pending
+                if "id" in items[index].data or "type" in items[index].data
+            ]
+            usevents = await self._update_many_sapphire_events(
+                transaction, [items[index] for index in changed], include
+            )
+
+            for index in pending:
+                event_id = items[index].where["id"]
+                nsevents[index] = usevents.get(event_id, osevents[event_id])
+
+        hevents = await self._run_bounded(
+            [
+                partial(
+                    self._update_howlite_event,
+                    items[index].data,
+                    osevents[items[index].where["id"]],
+                    nsevents[index],
+                )
+                for index in pending
+            ]
+        )
+
+        for index, hevent in zip(pending, hevents, strict=True):
+            osevent = osevents[items[index].where["id"]]
+            nsevent = nsevents[index]
+
+            if isinstance(hevent, e.ServiceError):
+                errors[index] = hevent
+
+                # Compensate for events that could not be updated in howlite
+                await self._compensate_update(osevent, nsevent)
+            else:
+                events[index] = await self._merge_event(nsevent, hevent)
+
+        await self._refresh_instances(
+            list(events.values()), [items[index].where["id"] for index in events]
+        )
+
+        return m.BulkUpdateResponse(
+            results=[
+                m.BulkResult(event=events.get(index), error=errors.get(index))
+                for index in range(len(items))
+            ]
+        )
+
+    async def bulk_delete(self, request: m.BulkDeleteRequest) -> m.BulkDeleteResponse:
+        """Delete events in bulk."""
+        where = request.where
+        include = request.include
+
+        self._queries.clear()
+
+        if self._outbox.enabled:
+            results = [
+                await self._run_deferred(
+                    partial(self._delete_deferred, w, include), w["id"]
+                )
+                for w in where
+            ]
+            await self._remove_instances([result.event for result in results])
+            return m.BulkDeleteResponse(results=results)
+
+        events: dict[int, m.Event] = {}
+        errors: dict[int, e.ServiceError] = {}
+        pending: list[int] = []
+
+        async with self._transaction("bulk_delete") as transaction:
+            sevents = await self._find_sapphire_events(
+                transaction, [w["id"] for w in where], include
+            )
+            seen: set[str] = set()
+
+            for index, w in enumerate(where):
+                event_id = w["id"]
+
+                if event_id not in sevents:
+                    errors[index] = e.EventDoesNotExistError(event_id)
+                elif event_id in seen:
+                    errors[index] = e.DuplicateEventError(event_id)
+                else:
+                    pending.append(index)
+
+                seen.add(event_id)
+
+            await self._delete_many_sapphire_events(
+                transaction, [where[index]["id"] for index in pending]
+            )
+
+        hevents = await self._run_bounded(
+            [
+                partial(self._delete_howlite_event, sevents[where[index]["id"]])
+                for index in pending
+            ]
+        )
+
+        failed: list[sm.Event] = []
+
+        for index, hevent in zip(pending, hevents, strict=True):
+            sevent = sevents[where[index]["id"]]
+
+            if isinstance(hevent, e.ServiceError):
+                errors[index] = hevent
+                failed.append(sevent)
+            else:
+                events[index] = await self._merge_event(sevent, hevent)
+
+        # Compensate for events that could not be deleted from howlite
+        if failed:
+            async with self._transaction("compensate") as transaction:
+                await self._restore_sapphire_events(transaction, failed)
+
+            await self._invalidate_occurrences()
+
+        await self._remove_instances(list(events.values()))
+
+        return m.BulkDeleteResponse(
+            results=[
+                m.BulkResult(event=events.get(index), error=errors.get(index))
+                for index in range(len(where))
+            ]
+        )
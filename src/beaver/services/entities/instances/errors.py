@@ -11,6 +11,13 @@ class ValidationError(ServiceError):
     """Raised when a validation error occurs."""
 
 
+class InvalidCursorError(ValidationError):
+    """Raised when a cursor is invalid."""
+
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"Cursor {cursor} is invalid.")
+
+
 class EventDoesNotExistError(ValidationError):
     """Raised when an event does not exist."""
 
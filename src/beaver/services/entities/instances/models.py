@@ -1,9 +1,11 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from collections.abc import Set as AbstractSet
 from datetime import datetime, timedelta
 from typing import Literal, TypedDict
 
 from beaver.models.base import datamodel
 from beaver.services.entities.events import models as em
+from beaver.utils.time import NaiveDatetime
 
 EventType = em.EventType
 
@@ -119,6 +121,19 @@ type InstanceOrderByInput = (
 )
 
 
+class InstanceCursor(TypedDict, total=True):
+    """Position of an instance in a list."""
+
+    start: NaiveDatetime
+    """Start datetime of the instance in event timezone."""
+
+    duration: timedelta
+    """Duration of the instance."""
+
+    event_id: str
+    """Identifier of the event the instance belongs to."""
+
+
 @datamodel
 class InstanceCreateInput:
     """Data to create an instance."""
@@ -147,6 +162,12 @@ class ListRequest:
     end: datetime
     """End datetime in UTC to filter instances."""
 
+    limit: int | None
+    """Maximum number of instances to return."""
+
+    cursor: str | None
+    """Cursor of the instance to continue listing after."""
+
     where: InstanceWhereInput | None
     """Filter to apply to find instances."""
 
@@ -164,6 +185,101 @@ class ListResponse:
     instances: Sequence[Instance]
     """List of instances that match the filter."""
 
+    cursor: str | None
+    """Cursor to continue listing after the last instance, if there are more."""
+
+
+@datamodel
+class StreamRequest:
+    """Request to stream instances."""
+
+    start: datetime
+    """Start datetime in UTC to filter instances."""
+
+    end: datetime
+    """End datetime in UTC to filter instances."""
+
+    limit: int | None
+    """Maximum number of instances to return."""
+
+    where: InstanceWhereInput | None
+    """Filter to apply to find instances."""
+
+    include: InstanceInclude | None
+    """Relations to include in the response."""
+
+    order: InstanceOrderByInput | Sequence[InstanceOrderByInput] | None
+    """Order to apply to the results."""
+
+
+@datamodel
+class StreamResponse:
+    """Response for streaming instances."""
+
+    instances: AsyncIterator[Instance]
+    """Stream of instances that match the filter."""
+
+
+@datamodel
+class ConflictsRequest:
+    """Request to find instances that overlap a time range."""
+
+    start: datetime
+    """Start datetime in UTC of the time range."""
+
+    end: datetime
+    """End datetime in UTC of the time range."""
+
+    include: InstanceInclude | None
+    """Relations to include in the response."""
+
+
+@datamodel
+class ConflictsResponse:
+    """Response for finding instances that overlap a time range."""
+
+    instances: Sequence[Instance]
+    """Instances that overlap the time range, ordered by start."""
+
+
+@datamodel
+class Timeline:
+    """Instances around a point in time."""
+
+    current: Sequence[Instance]
+    """Instances that are ongoing, in order of start."""
+
+    next: Sequence[Instance]
+    """Instances that start later, in order of start."""
+
+
+@datamodel
+class NowRequest:
+    """Request to look up instances around a point in time."""
+
+    at: datetime
+    """Datetime in UTC to look up instances at."""
+
+    next: int
+    """Maximum number of instances starting after the datetime to return."""
+
+    include: InstanceInclude | None
+    """Relations to include in the response."""
+
+    tags: AbstractSet[str]
+    """Tags of instances the client already has."""
+
+
+@datamodel
+class NowResponse:
+    """Response for looking up instances around a point in time."""
+
+    tag: str
+    """Tag that identifies the instances."""
+
+    timeline: Timeline | None
+    """Instances around the datetime, unless the client already has them."""
+
 
 @datamodel
 class GetRequest:
@@ -184,6 +300,25 @@ class GetResponse:
     """Instance that matches the filter."""
 
 
+@datamodel
+class LookupRequest:
+    """Request to look up many instances at once."""
+
+    where: Sequence[InstanceWhereUniqueInput]
+    """Unique filters to apply to find each instance."""
+
+    include: InstanceInclude | None
+    """Relations to include in the response."""
+
+
+@datamodel
+class LookupResponse:
+    """Response for looking up many instances at once."""
+
+    instances: Sequence[Instance | None]
+    """Instances that match the filters, in the same order, if they exist."""
+
+
 @datamodel
 class CreateRequest:
     """Request to create an instance."""
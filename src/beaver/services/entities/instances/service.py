@@ -1,8 +1,25 @@
-from collections.abc import Generator, Sequence
+import asyncio
+import hashlib
+import heapq
+import itertools
+from collections.abc import (
+    AsyncGenerator,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from collections.abc import Set as AbstractSet
 from contextlib import contextmanager
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import cast
 from uuid import UUID
 
+from beaver.config.models import InstancesConfig
+from beaver.services.conflicts import errors as cfe
+from beaver.services.conflicts import models as cfm
+from beaver.services.conflicts.service import ConflictsService
 from beaver.services.entities.events import errors as ee
 from beaver.services.entities.events import models as em
 from beaver.services.entities.events.service import EventsService
@@ -11,14 +28,39 @@ from beaver.services.entities.instances import models as m
 from beaver.services.icalendar import errors as ie
 from beaver.services.icalendar import models as im
 from beaver.services.icalendar.service import ICalendarService
+from beaver.services.occurrences import errors as oce
+from beaver.services.occurrences import models as ocm
+from beaver.services.occurrences.service import OccurrencesService
+from beaver.services.timeline import errors as tle
+from beaver.services.timeline import models as tlm
+from beaver.services.timeline.service import TimelineService
+from beaver.utils.cursor import cursorparse, cursorstringify
+from beaver.utils.ordering import Ordering
 
 
 class InstancesService:
     """Service to manage instances."""
 
-    def __init__(self, events: EventsService, icalendar: ICalendarService) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        config: InstancesConfig,
+        conflicts: ConflictsService,
+        events: EventsService,
+        icalendar: ICalendarService,
+        occurrences: OccurrencesService,
+        timeline: TimelineService,
+    ) -> None:
+        self._config = config
+        self._conflicts = conflicts
         self._events = events
         self._icalendar = icalendar
+        self._occurrences = occurrences
+        self._timeline = timeline
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of instances to list at once."""
+        return self._config.limit
 
     @contextmanager
     def _handle_errors(self) -> Generator[None]:
@@ -34,16 +76,110 @@ class InstancesService:
             raise e.ServiceError from ex
         except ie.ServiceError as ex:
             raise e.ServiceError from ex
+        except oce.ServiceError as ex:
+            raise e.ServiceError from ex
+        except cfe.ServiceError as ex:
+            raise e.ServiceError from ex
+        except tle.ServiceError as ex:
+            raise e.ServiceError from ex
+
+    def _parse_cursor(self, cursor: str) -> m.InstanceCursor:
+        try:
+            return cursorparse(cursor, m.InstanceCursor)
+        except ValueError as ex:
+            raise e.InvalidCursorError(cursor) from ex
+
+    def _build_position(self, instance: m.Instance) -> m.InstanceCursor:
+        return m.InstanceCursor(
+            start=instance.start,
+            duration=instance.duration,
+            event_id=instance.event_id,
+        )
+
+    def _build_cursor(self, instance: m.Instance) -> str:
+        return cursorstringify(self._build_position(instance))
+
+    def _order_with_tiebreaker(
+        self,
+        order: m.InstanceOrderByInput | Sequence[m.InstanceOrderByInput] | None,
+    ) -> Sequence[m.InstanceOrderByInput]:
+        if order is None:
+            order = []
+        elif not isinstance(order, Sequence):
+            order = [order]
+
+        keys = {key for item in order for key in item}
+        tiebreakers: list[m.InstanceOrderByInput] = []
+
+        # Instances are identified by event and start, so this makes the order total
+        if "event_id" not in keys:
+            tiebreakers.append({"event_id": "asc"})
+        if "start" not in keys:
+            tiebreakers.append({"start": "asc"})
+
+        return [*order, *tiebreakers]
+
+    def _map_event_where(
+        self, where: m.InstanceWhereInput | None
+    ) -> em.EventWhereInput | None:
+        if where and "event" in where and "is" in where["event"]:
+            return where["event"]["is"]
+
+        if where and "event" in where and "is_not" in where["event"]:
+            return {"NOT": [where["event"]["is_not"]]}
+
+        return None
+
+    def _map_event_include(
+        self, include: m.InstanceInclude | None
+    ) -> em.EventInclude | None:
+        if (
+            include
+            and "event" in include
+            and not isinstance(include["event"], bool)
+            and "include" in include["event"]
+        ):
+            return include["event"]["include"]
+
+        return None
+
+    def _build_ordering(
+        self, order: Sequence[m.InstanceOrderByInput]
+    ) -> Ordering[m.Instance]:
+        return Ordering(
+            order,
+            {
+                "start": lambda instance: instance.start,
+                "duration": lambda instance: instance.duration,
+                "event_id": lambda instance: instance.event_id,
+            },
+        )
+
+    def _is_after(
+        self,
+        instance: m.Instance,
+        cursor: m.InstanceCursor,
+        ordering: Ordering[m.Instance],
+    ) -> bool:
+        bound = m.Instance(
+            start=cursor["start"],
+            duration=cursor["duration"],
+            event_id=cursor["event_id"],
+            event=None,
+        )
+
+        return ordering.key(instance) > ordering.key(bound)
 
     async def _list_events(
         self,
-        query: em.Query,
+        query: em.Query | None,
         where: em.EventWhereInput | None = None,
         include: em.EventInclude | None = None,
     ) -> Sequence[em.Event]:
         list_request = em.ListRequest(
             limit=None,
             offset=None,
+            cursor=None,
             where=where,
             query=query,
             include=include,
@@ -67,23 +203,33 @@ class InstancesService:
 
         return get_response.event
 
-    async def _update_event(
+    async def _load_event(
         self,
-        data: em.EventUpdateInput,
         where: em.EventWhereUniqueInput,
         include: em.EventInclude | None = None,
+    ) -> em.EventState | None:
+        load_request = em.LoadRequest(where=where, include=include)
+
+        with self._handle_errors():
+            load_response = await self._events.load(load_request)
+
+        return load_response.state
+
+    async def _apply_event(
+        self,
+        data: em.EventUpdateInput,
+        state: em.EventState,
+        include: em.EventInclude | None = None,
     ) -> em.Event | None:
-        update_request = em.UpdateRequest(data=data, where=where, include=include)
+        apply_request = em.ApplyRequest(data=data, state=state, include=include)
 
         with self._handle_errors():
-            update_response = await self._events.update(update_request)
+            apply_response = await self._events.apply(apply_request)
 
-        return update_response.event
+        return apply_response.state.event if apply_response.state else None
 
-    def _list_event_instances(
-        self, event: em.Event, start: datetime, end: datetime
-    ) -> Sequence[im.Instance]:
-        ievent = im.Event(
+    def _build_icalendar_event(self, event: em.Event) -> im.Event:
+        return im.Event(
             id=UUID(event.id),
             start=event.start,
             duration=event.duration,
@@ -93,65 +239,431 @@ class InstancesService:
             exclude=event.exclude,
         )
 
+    def _list_event_instances(
+        self, event: em.Event, start: datetime, end: datetime
+    ) -> Sequence[im.Instance]:
+        ievent = self._build_icalendar_event(event)
+
         with self._handle_errors():
             return self._icalendar.expander.expand(ievent, start, end)
 
-    def _sort_instances(
+    def _iterate_instances(
         self,
-        instances: Sequence[m.Instance],
-        order: m.InstanceOrderByInput | Sequence[m.InstanceOrderByInput] | None,
+        event: em.Event,
+        start: datetime,
+        end: datetime,
+        include: m.InstanceInclude | None,
+    ) -> Iterator[m.Instance]:
+        ievent = self._build_icalendar_event(event)
+
+        with self._handle_errors():
+            for instance in self._icalendar.expander.iterate(ievent, start, end):
+                yield m.Instance(
+                    start=instance.start,
+                    duration=instance.duration,
+                    event_id=event.id,
+                    event=event if include and include.get("event") else None,
+                )
+
+    def _is_mergeable(self, order: Sequence[m.InstanceOrderByInput]) -> bool:
+        # Instances of each event are expanded in ascending order of their start
+        return len(order) > 0 and order[0] == {"start": "asc"}
+
+    def _resume_start(
+        self, event: em.Event, start: datetime, position: m.InstanceCursor | None
+    ) -> datetime:
+        if position is None:
+            return start
+
+        # Instances starting before the cursor come before it in the order,
+        # so expansion can begin just ahead of it instead of at the range start
+        after = position["start"].replace(tzinfo=event.timezone) - timedelta(seconds=1)
+        return max(start, after)
+
+    def _merge_instances(  # noqa: PLR0913
+        self,
+        events: Sequence[em.Event],
+        start: datetime,
+        end: datetime,
+        include: m.InstanceInclude | None,
+        ordering: Ordering[m.Instance],
+        position: m.InstanceCursor | None = None,
+    ) -> Iterator[m.Instance]:
+        streams = [
+            self._iterate_instances(
+                event, self._resume_start(event, start, position), end, include
+            )
+            for event in events
+        ]
+        merged = heapq.merge(*streams, key=lambda instance: instance.start)
+
+        # Only instances starting at the same time need the rest of the order
+        for _, group in itertools.groupby(merged, key=lambda instance: instance.start):
+            yield from ordering.sort(group)
+
+    def _expand_instances(
+        self,
+        events: Sequence[em.Event],
+        start: datetime,
+        end: datetime,
+        include: m.InstanceInclude | None,
+    ) -> Iterator[m.Instance]:
+        for event in events:
+            yield from self._iterate_instances(event, start, end, include)
+
+    def _skip_instances(
+        self,
+        instances: Iterable[m.Instance],
+        position: m.InstanceCursor | None,
+        ordering: Ordering[m.Instance],
+    ) -> Iterable[m.Instance]:
+        if position is None:
+            return instances
+
+        return (i for i in instances if self._is_after(i, position, ordering))
+
+    def _is_precomputed(self, order: Sequence[m.InstanceOrderByInput]) -> bool:
+        # Occurrences are stored with their duration folded into the end
+        return all(key in {"start", "event_id"} for item in order for key in item)
+
+    async def _is_covered(self, start: datetime, end: datetime) -> bool:
+        if not self._occurrences.enabled:
+            return False
+
+        covers_request = ocm.CoversRequest(start=start, end=end)
+
+        with self._handle_errors():
+            covers_response = await self._occurrences.covers(covers_request)
+
+        return covers_response.covered
+
+    async def _find_included_events(
+        self, ids: AbstractSet[str], include: m.InstanceInclude | None
+    ) -> Mapping[str, em.Event]:
+        # Events are only needed when they are included in the response
+        if not ids or not include or not include.get("event"):
+            return {}
+
+        events = await self._list_events(
+            query=None,
+            where={"id": {"in": list(ids)}},
+            include=self._map_event_include(include),
+        )
+
+        return {event.id: event for event in events}
+
+    def _map_occurrence_order(
+        self, order: Sequence[m.InstanceOrderByInput]
+    ) -> Sequence[ocm.OccurrenceOrder]:
+        return [
+            cast("ocm.OccurrenceOrder", (key, direction))
+            for item in order
+            for key, direction in item.items()
+        ]
+
+    async def _list_occurrences(  # noqa: PLR0913
+        self,
+        start: datetime,
+        end: datetime,
+        where: m.InstanceWhereInput | None,
+        include: m.InstanceInclude | None,
+        order: Sequence[m.InstanceOrderByInput],
+        position: m.InstanceCursor | None,
+        limit: int,
     ) -> Sequence[m.Instance]:
-        if order is None:
-            return list(instances)
+        list_request = ocm.ListRequest(
+            start=start,
+            end=end,
+            where=self._map_event_where(where),
+            order=self._map_occurrence_order(order),
+            after={"start": position["start"], "event_id": position["event_id"]}
+            if position is not None
+            else None,
+            limit=limit,
+        )
 
-        if not isinstance(order, Sequence):
-            order = [order]
+        with self._handle_errors():
+            list_response = await self._occurrences.list(list_request)
 
-        for item in reversed(order):
-            for key, direction in item.items():
-                instances = sorted(
-                    instances,
-                    key=lambda instance: getattr(instance, key),
-                    reverse=direction == "desc",
-                )
+        occurrences = list_response.occurrences
+        events = await self._find_included_events(
+            {occurrence.event_id for occurrence in occurrences}, include
+        )
 
-        return list(instances)
+        return [
+            m.Instance(
+                start=occurrence.start,
+                duration=occurrence.duration,
+                event_id=occurrence.event_id,
+                event=events.get(occurrence.event_id),
+            )
+            for occurrence in occurrences
+        ]
+
+    def _build_page(
+        self, instances: Sequence[m.Instance], limit: int
+    ) -> m.ListResponse:
+        more = len(instances) > limit
+        instances = instances[:limit]
+        next_cursor = self._build_cursor(instances[-1]) if more and instances else None
+
+        return m.ListResponse(instances=instances, cursor=next_cursor)
 
     async def list(self, request: m.ListRequest) -> m.ListResponse:
         """List instances."""
         start = request.start
         end = request.end
+        limit = request.limit
+        cursor = request.cursor
         where = request.where
         include = request.include
+        order = request.order
+
+        position = self._parse_cursor(cursor) if cursor is not None else None
+        order = self._order_with_tiebreaker(order)
+        ordering = self._build_ordering(order)
+        limit = min(limit, self.limit) if limit is not None else self.limit
+
+        # Take one more instance than requested to know if there are more
+        if self._is_precomputed(order) and await self._is_covered(start, end):
+            # Read precomputed instances with an indexed range scan
+            instances = await self._list_occurrences(
+                start, end, where, include, order, position, limit + 1
+            )
+            return self._build_page(instances, limit)
 
         events = await self._list_events(
             query=em.TimeRangeQuery(start=start, end=end),
-            where=where["event"]["is"]
-            if where and "event" in where and "is" in where["event"]
-            else {"NOT": [where["event"]["is_not"]]}
-            if where and "event" in where and "is_not" in where["event"]
-            else None,
-            include=include["event"]["include"]
-            if include
-            and "event" in include
-            and not isinstance(include["event"], bool)
-            and "include" in include["event"]
-            else None,
+            where=self._map_event_where(where),
+            include=self._map_event_include(include),
         )
 
+        if self._is_mergeable(order):
+            # Expand lazily from the cursor and stop as soon as the page is full
+            instances = self._merge_instances(
+                events, start, end, include, ordering, position
+            )
+            instances = self._skip_instances(instances, position, ordering)
+            instances = list(itertools.islice(instances, limit + 1))
+        else:
+            # Expand everything, but keep only as many instances as needed
+            instances = self._expand_instances(events, start, end, include)
+            instances = self._skip_instances(instances, position, ordering)
+            instances = ordering.sort(instances, limit + 1)
+
+        return self._build_page(instances, limit)
+
+    async def _stream_occurrences(  # noqa: PLR0913
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int | None,
+        where: m.InstanceWhereInput | None,
+        include: m.InstanceInclude | None,
+        order: Sequence[m.InstanceOrderByInput],
+    ) -> AsyncGenerator[m.Instance]:
+        remaining = limit
+        position = None
+
+        # Read precomputed instances in pages, so that only one page is held at a time
+        while remaining is None or remaining > 0:
+            batch = min(self.limit, remaining) if remaining is not None else self.limit
+            instances = await self._list_occurrences(
+                start, end, where, include, order, position, batch
+            )
+
+            for instance in instances:
+                yield instance
+
+            if len(instances) < batch:
+                return
+
+            if remaining is not None:
+                remaining -= len(instances)
+
+            position = self._build_position(instances[-1])
+
+    async def _stream_events(
+        self,
+        start: datetime,
+        end: datetime,
+        where: m.InstanceWhereInput | None,
+        include: m.InstanceInclude | None,
+    ) -> AsyncGenerator[em.Event]:
+        stream_request = em.StreamRequest(
+            limit=None,
+            offset=None,
+            where=self._map_event_where(where),
+            query=em.TimeRangeQuery(start=start, end=end),
+            include=self._map_event_include(include),
+            order=None,
+            schedule=True,
+        )
+
+        with self._handle_errors():
+            stream_response = await self._events.stream(stream_request)
+
+            async for event in stream_response.events:
+                yield cast("em.Event", event)
+
+    async def _sort_instances(  # noqa: PLR0913
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int | None,
+        where: m.InstanceWhereInput | None,
+        include: m.InstanceInclude | None,
+        ordering: Ordering[m.Instance],
+    ) -> Sequence[m.Instance]:
+        instances: Sequence[m.Instance] = []
+        batch: list[em.Event] = []
+        events = self._stream_events(start, end, where, include)
+
+        # Expand events batch by batch, keeping only the best instances so far
+        async for event in events:
+            batch.append(event)
+
+            if len(batch) >= self._events.batch:
+                expanded = self._expand_instances(batch, start, end, include)
+                instances = ordering.sort([*instances, *expanded], limit)
+                batch = []
+
+        expanded = self._expand_instances(batch, start, end, include)
+        return ordering.sort([*instances, *expanded], limit)
+
+    async def _stream(  # noqa: PLR0913
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int | None,
+        where: m.InstanceWhereInput | None,
+        include: m.InstanceInclude | None,
+        order: Sequence[m.InstanceOrderByInput],
+    ) -> AsyncGenerator[m.Instance]:
+        if self._is_precomputed(order) and await self._is_covered(start, end):
+            async for instance in self._stream_occurrences(
+                start, end, limit, where, include, order
+            ):
+                yield instance
+
+            return
+
+        ordering = self._build_ordering(order)
+
+        if self._is_mergeable(order):
+            # Instances of any event can come first, so all events are needed
+            events = [
+                event async for event in self._stream_events(start, end, where, include)
+            ]
+            instances = self._merge_instances(events, start, end, include, ordering)
+            instances = itertools.islice(instances, limit)
+        else:
+            instances = await self._sort_instances(
+                start, end, limit, where, include, ordering
+            )
+
+        for instance in instances:
+            yield instance
+
+            # Expanding is synchronous, so let other requests run in between
+            await asyncio.sleep(0)
+
+    async def stream(self, request: m.StreamRequest) -> m.StreamResponse:
+        """Stream instances."""
+        start = request.start
+        end = request.end
+        limit = request.limit
+        where = request.where
+        include = request.include
+        order = request.order
+
+        order = self._order_with_tiebreaker(order)
+
+        # Events are read lazily in batches once the stream is consumed
+        return m.StreamResponse(
+            instances=self._stream(start, end, limit, where, include, order)
+        )
+
+    async def conflicts(self, request: m.ConflictsRequest) -> m.ConflictsResponse:
+        """Find instances that overlap a time range."""
+        start = request.start
+        end = request.end
+        include = request.include
+
+        find_request = cfm.FindRequest(start=start, end=end, exclude=set())
+
+        with self._handle_errors():
+            find_response = await self._conflicts.find(find_request)
+
+        conflicts = find_response.conflicts
+        events = await self._find_included_events(
+            {conflict.event_id for conflict in conflicts}, include
+        )
+        ordering = self._build_ordering(self._order_with_tiebreaker({"start": "asc"}))
+
         instances = [
             m.Instance(
+                start=conflict.start,
+                duration=conflict.duration,
+                event_id=conflict.event_id,
+                event=events.get(conflict.event_id),
+            )
+            for conflict in conflicts
+        ]
+
+        return m.ConflictsResponse(instances=ordering.sort(instances))
+
+    def _build_tag(self, *sections: Sequence[tlm.Instance]) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+
+        for section in sections:
+            for instance in section:
+                digest.update(
+                    f"{instance.event_id}/{instance.start.isoformat()}/"
+                    f"{instance.duration.total_seconds()};".encode()
+                )
+
+            digest.update(b"|")
+
+        return digest.hexdigest()
+
+    async def now(self, request: m.NowRequest) -> m.NowResponse:
+        """Look up instances that are ongoing at and start after a point in time."""
+        include = request.include
+
+        now_request = tlm.NowRequest(at=request.at, next=request.next)
+
+        with self._handle_errors():
+            now_response = await self._timeline.now(now_request)
+
+        current = now_response.current
+        upcoming = now_response.next
+        tag = self._build_tag(current, upcoming)
+
+        # Clients poll often, so skip loading events when nothing changed,
+        # but tags don't cover event data, so included events are always sent
+        if tag in request.tags and not (include and include.get("event")):
+            return m.NowResponse(tag=tag, timeline=None)
+
+        events = await self._find_included_events(
+            {instance.event_id for instance in [*current, *upcoming]}, include
+        )
+
+        def _map(instance: tlm.Instance) -> m.Instance:
+            return m.Instance(
                 start=instance.start,
                 duration=instance.duration,
-                event_id=event.id,
-                event=event if include and include.get("event") else None,
+                event_id=instance.event_id,
+                event=events.get(instance.event_id),
             )
-            for event in events
-            for instance in self._list_event_instances(event, start, end)
-        ]
-        instances = self._sort_instances(instances, request.order)
 
-        return m.ListResponse(instances=instances)
+        return m.NowResponse(
+            tag=tag,
+            timeline=m.Timeline(
+                current=[_map(instance) for instance in current],
+                next=[_map(instance) for instance in upcoming],
+            ),
+        )
 
     async def get(self, request: m.GetRequest) -> m.GetResponse:
         """Get instance."""
@@ -189,16 +701,84 @@ class InstancesService:
             )
         )
 
+    def _find_event_instances(
+        self, event: em.Event, starts: AbstractSet[datetime]
+    ) -> Mapping[datetime, im.Instance]:
+        utcstarts = [
+            start.replace(tzinfo=event.timezone).astimezone(UTC) for start in starts
+        ]
+        ievent = self._build_icalendar_event(event)
+        instances: dict[datetime, im.Instance] = {}
+
+        # A single expansion spans all requested starts of the event
+        with self._handle_errors():
+            for instance in self._icalendar.expander.iterate(
+                ievent, min(utcstarts), max(utcstarts) + event.duration
+            ):
+                if instance.start in starts:
+                    instances[instance.start] = instance
+
+                if len(instances) == len(starts):
+                    break
+
+        return instances
+
+    async def lookup(self, request: m.LookupRequest) -> m.LookupResponse:
+        """Look up many instances at once."""
+        where = request.where
+        include = request.include
+
+        starts: dict[str, set[datetime]] = {}
+
+        for key in where:
+            starts.setdefault(key["event_id"], set()).add(key["start"])
+
+        if not starts:
+            return m.LookupResponse(instances=[])
+
+        events = await self._list_events(
+            query=None,
+            where={"id": {"in": list(starts)}},
+            include=self._map_event_include(include),
+        )
+
+        instances: dict[tuple[str, datetime], m.Instance] = {}
+
+        for event in events:
+            found = self._find_event_instances(event, starts[event.id])
+
+            for start, instance in found.items():
+                instances[(event.id, start)] = m.Instance(
+                    start=instance.start,
+                    duration=instance.duration,
+                    event_id=event.id,
+                    event=event if include and include.get("event") else None,
+                )
+
+        return m.LookupResponse(
+            instances=[instances.get((key["event_id"], key["start"])) for key in where]
+        )
+
     async def create(self, request: m.CreateRequest) -> m.CreateResponse:
         """Create instance."""
         data = request.data
         include = request.include
 
-        event = await self._get_event(where={"id": data.event_id})
+        state = await self._load_event(
+            where={"id": data.event_id},
+            include=include["event"]["include"]
+            if include
+            and "event" in include
+            and not isinstance(include["event"], bool)
+            and "include" in include["event"]
+            else None,
+        )
 
-        if event is None:
+        if state is None:
             raise e.EventDoesNotExistError(data.event_id)
 
+        event = state.event
+
         utcstart = data.start.replace(tzinfo=event.timezone).astimezone(UTC)
         instances = self._list_event_instances(
             event, utcstart, utcstart + event.duration
@@ -207,18 +787,12 @@ class InstancesService:
         if any(i.start == data.start for i in instances):
             raise e.InstanceAlreadyExistsError(event.id, data.start)
 
-        event = await self._update_event(
+        event = await self._apply_event(
             data={
                 "include": (event.include or set()) | {em.Inclusion(start=data.start)},
                 "exclude": (event.exclude or set()) - {em.Exclusion(start=data.start)},
             },
-            where={"id": event.id},
-            include=include["event"]["include"]
-            if include
-            and "event" in include
-            and not isinstance(include["event"], bool)
-            and "include" in include["event"]
-            else None,
+            state=state,
         )
 
         if event is None:
@@ -244,11 +818,21 @@ class InstancesService:
         where = request.where
         include = request.include
 
-        event = await self._get_event(where={"id": where["event_id"]})
+        state = await self._load_event(
+            where={"id": where["event_id"]},
+            include=include["event"]["include"]
+            if include
+            and "event" in include
+            and not isinstance(include["event"], bool)
+            and "include" in include["event"]
+            else None,
+        )
 
-        if event is None:
+        if state is None:
             return m.UpdateResponse(instance=None)
 
+        event = state.event
+
         utcstart = where["start"].replace(tzinfo=event.timezone).astimezone(UTC)
         instances = self._list_event_instances(
             event, utcstart, utcstart + event.duration
@@ -276,16 +860,7 @@ class InstancesService:
                 (event.exclude or set()) | {em.Exclusion(start=instance.start)}
             ) - {em.Exclusion(start=data["start"])}
 
-        event = await self._update_event(
-            data=edata,
-            where={"id": event.id},
-            include=include["event"]["include"]
-            if include
-            and "event" in include
-            and not isinstance(include["event"], bool)
-            and "include" in include["event"]
-            else None,
-        )
+        event = await self._apply_event(data=edata, state=state)
 
         if event is None:
             return m.UpdateResponse(instance=None)
@@ -311,11 +886,21 @@ class InstancesService:
         where = request.where
         include = request.include
 
-        event = await self._get_event(where={"id": where["event_id"]})
+        state = await self._load_event(
+            where={"id": where["event_id"]},
+            include=include["event"]["include"]
+            if include
+            and "event" in include
+            and not isinstance(include["event"], bool)
+            and "include" in include["event"]
+            else None,
+        )
 
-        if event is None:
+        if state is None:
             return m.DeleteResponse(instance=None)
 
+        event = state.event
+
         utcstart = where["start"].replace(tzinfo=event.timezone).astimezone(UTC)
         instances = self._list_event_instances(
             event, utcstart, utcstart + event.duration
@@ -325,18 +910,12 @@ class InstancesService:
         if instance is None:
             return m.DeleteResponse(instance=None)
 
-        event = await self._update_event(
+        event = await self._apply_event(
             data={
                 "exclude": (event.exclude or set())
                 | {em.Exclusion(start=where["start"])}
             },
-            where={"id": event.id},
-            include=include["event"]["include"]
-            if include
-            and "event" in include
-            and not isinstance(include["event"], bool)
-            and "include" in include["event"]
-            else None,
+            state=state,
         )
 
         if event is None:
@@ -6,5 +6,27 @@ class ValidationError(ServiceError):
     """Raised when a validation error occurs."""
 
 
+class InvalidCursorError(ValidationError):
+    """Raised when a cursor is invalid."""
+
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"Cursor {cursor} is invalid.")
+
+
 class ConflictError(ValidationError):
     """Raised when a conflict error occurs."""
+
+
+class EventsNotDeletedError(ServiceError):
+    """Raised when some events of a deleted show could not be deleted."""
+
+    def __init__(self, show_id: str, *, restored: bool) -> None:
+        outcome = (
+            "the show was restored with only those events"
+            if restored
+            else "the show could not be restored"
+        )
+        super().__init__(
+            f"Some events of show with id {show_id} could not be deleted, "
+            f"and {outcome}."
+        )
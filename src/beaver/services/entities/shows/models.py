@@ -1,7 +1,7 @@
 from collections.abc import Sequence
 from collections.abc import Set as AbstractSet
 from datetime import datetime, timedelta
-from typing import Self
+from typing import Literal, Self, TypedDict
 from zoneinfo import ZoneInfo
 
 from beaver.models.base import datamodel
@@ -30,6 +30,12 @@ Inclusion = hm.Inclusion
 
 Exclusion = hm.Exclusion
 
+type EventField = Literal[
+    "start", "duration", "timezone", "recurrence", "include", "exclude"
+]
+
+type CountMode = Literal["exact", "estimated"]
+
 
 @datamodel
 class Event:
@@ -82,6 +88,28 @@ class Event:
         )
 
 
+@datamodel
+class EventMetadata:
+    """Event data without the schedule."""
+
+    id: str
+    """Identifier of the event."""
+
+    type: EventType
+    """Type of the event."""
+
+    show_id: str | None
+    """Identifier of the show the event belongs to."""
+
+    show: "Show | None"
+    """Show the event belongs to."""
+
+    @classmethod
+    def map(cls, sevent: sm.Event, show: "Show | None") -> Self:
+        """Map from internal representation."""
+        return cls(id=sevent.id, type=sevent.type, show_id=sevent.showId, show=show)
+
+
 @datamodel
 class Show:
     """Show data."""
@@ -95,11 +123,11 @@ class Show:
     description: str | None
     """Description of the show."""
 
-    events: Sequence[Event] | None
+    events: Sequence[Event | EventMetadata] | None
     """Events belonging to the show."""
 
     @classmethod
-    def map(cls, show: sm.Show, events: Sequence[Event] | None) -> Self:
+    def map(cls, show: sm.Show, events: Sequence[Event | EventMetadata] | None) -> Self:
         """Map from internal representation."""
         return cls(
             id=show.id, title=show.title, description=show.description, events=events
@@ -126,6 +154,14 @@ type ShowOrderByInput = (
     ShowOrderByIdInput | ShowOrderByTitleInput | ShowOrderByDescriptionInput
 )
 
+
+class ShowCursor(TypedDict, total=True):
+    """Position of a show in a list."""
+
+    values: dict[str, str | None]
+    """Values of the fields the list is ordered by, including the identifier."""
+
+
 ShowCreateInput = st.ShowCreateWithoutRelationsInput
 
 ShowUpdateInput = st.ShowUpdateManyMutationInput
@@ -157,6 +193,9 @@ class ListRequest:
     offset: int | None
     """Number of shows to skip."""
 
+    cursor: str | None
+    """Cursor of the show to continue listing after."""
+
     where: ShowWhereInput | None
     """Filter to apply to find shows."""
 
@@ -166,6 +205,9 @@ class ListRequest:
     order: ShowOrderByInput | Sequence[ShowOrderByInput] | None
     """Order to apply to the results."""
 
+    schedule: bool
+    """Whether to get the schedule of included events."""
+
 
 @datamodel
 class ListResponse:
@@ -174,6 +216,111 @@ class ListResponse:
     shows: Sequence[Show]
     """List of shows that match the filter."""
 
+    cursor: str | None
+    """Cursor to continue listing after the last show, if there are more."""
+
+    count: int | None
+    """Number of all shows that match the filter, if it was counted on the way."""
+
+
+@datamodel
+class PageRequest:
+    """Request to list a page of shows along with their total count."""
+
+    limit: int | None
+    """Maximum number of shows to return."""
+
+    offset: int | None
+    """Number of shows to skip."""
+
+    cursor: str | None
+    """Cursor of the show to continue listing after."""
+
+    where: ShowWhereInput | None
+    """Filter to apply to find shows."""
+
+    include: ShowInclude | None
+    """Relations to include in the response."""
+
+    order: ShowOrderByInput | Sequence[ShowOrderByInput] | None
+    """Order to apply to the results."""
+
+    schedule: bool
+    """Whether to get the schedule of included events."""
+
+    count: CountMode
+    """How to count all shows that match the filter."""
+
+
+@datamodel
+class PageResponse:
+    """Response for listing a page of shows along with their total count."""
+
+    shows: Sequence[Show]
+    """List of shows that match the filter."""
+
+    cursor: str | None
+    """Cursor to continue listing after the last show, if there are more."""
+
+    count: int
+    """Number of all shows that match the filter, possibly estimated."""
+
+
+@datamodel
+class ShowHighlights:
+    """Text of a show with matches of a search marked."""
+
+    title: str
+    """Title of the show with matches wrapped in <mark> tags."""
+
+    description: str | None
+    """Description of the show with matches wrapped in <mark> tags."""
+
+
+@datamodel
+class SearchResult:
+    """Show found by a search."""
+
+    show: Show
+    """Show that matches the search."""
+
+    rank: float
+    """Relevance of the show to the search, higher is better."""
+
+    highlights: ShowHighlights | None
+    """Text of the show with matches marked, if requested."""
+
+
+@datamodel
+class SearchRequest:
+    """Request to search shows."""
+
+    text: str
+    """Text to search for in titles and descriptions."""
+
+    limit: int | None
+    """Maximum number of shows to return."""
+
+    where: ShowWhereInput | None
+    """Filter to apply to find shows."""
+
+    include: ShowInclude | None
+    """Relations to include in the response."""
+
+    schedule: bool
+    """Whether to get the schedule of included events."""
+
+    highlight: bool
+    """Whether to mark matches in the text of shows."""
+
+
+@datamodel
+class SearchResponse:
+    """Response for searching shows."""
+
+    results: Sequence[SearchResult]
+    """Shows that match the search, most relevant first."""
+
 
 @datamodel
 class GetRequest:
@@ -185,6 +332,9 @@ class GetRequest:
     include: ShowInclude | None
     """Relations to include in the response."""
 
+    schedule: bool
+    """Whether to get the schedule of included events."""
+
 
 @datamodel
 class GetResponse:
@@ -1,9 +1,16 @@
 import builtins
-from collections.abc import Generator, Sequence
-from contextlib import contextmanager
-from typing import cast
+import html
+import re
+from collections.abc import AsyncGenerator, Generator, Hashable, Sequence
+from collections.abc import Set as AbstractSet
+from contextlib import asynccontextmanager, contextmanager, suppress
+from functools import partial
+from typing import Any, cast
 from uuid import UUID
 
+from beaver.config.models import SapphireRawConfig
+from beaver.services.conflicts import models as cfm
+from beaver.services.conflicts.service import ConflictsService
 from beaver.services.data.howlite import errors as he
 from beaver.services.data.howlite import models as hm
 from beaver.services.data.howlite.service import HowliteService
@@ -13,14 +20,89 @@ from beaver.services.data.sapphire import types as st
 from beaver.services.data.sapphire.service import SapphireService
 from beaver.services.entities.shows import errors as e
 from beaver.services.entities.shows import models as m
+from beaver.services.metrics.service import MetricsService
+from beaver.services.occurrences import errors as oce
+from beaver.services.occurrences import models as ocm
+from beaver.services.occurrences.service import OccurrencesService
+from beaver.services.outbox import errors as oe
+from beaver.services.outbox import models as om
+from beaver.services.outbox.service import OutboxService
+from beaver.services.replicas.service import ReplicasService
+from beaver.services.timeline import models as tlm
+from beaver.services.timeline.service import TimelineService
+from beaver.utils.cursor import cursorparse, cursorstringify
+from beaver.utils.keyset import keysetwhere
+from beaver.utils.singleflight import SingleFlight, flightkey
+from beaver.utils.uuids import isuuid
+
+# Titles match on word prefixes, similar spelling or anywhere as a substring,
+# so that partial input typed in a picker finds shows as well
+SEARCH_QUERY = """
+SELECT
+  "id",
+  ts_rank("search", "query") + similarity("title", $1::text) AS "rank",
+  CASE WHEN $3::boolean
+    THEN ts_headline('simple', "title", "query", $5::text)
+  END AS "title",
+  CASE WHEN $3::boolean AND "description" IS NOT NULL
+    THEN ts_headline('simple', "description", "query", $5::text)
+  END AS "description"
+FROM "shows", to_tsquery('simple', $2::text) AS "query"
+WHERE "search" @@ "query"
+  OR "title" % $1::text
+  OR "title" ILIKE '%' || $6::text || '%'
+ORDER BY "rank" DESC, "id" ASC
+LIMIT $4::integer OFFSET $7::integer
+"""
+
+# Number of ranked shows to filter at once when searching with a filter
+SEARCH_BATCH = 100
+
+# Matches are marked with private use characters, so the text can be escaped later
+HEADLINE_START = "\ue000"
+HEADLINE_STOP = "\ue001"
+HEADLINE_OPTIONS = (
+    f"StartSel={HEADLINE_START}, StopSel={HEADLINE_STOP}, HighlightAll=true"
+)
+
+# Cursors continue after the identifier, even if that show no longer exists
+SHOWS_PAGE_QUERY = """
+SELECT "id", "title", "description", "count" FROM (
+  SELECT "id", "title", "description", COUNT(*) OVER () AS "count" FROM "shows"
+) AS "matching"
+WHERE $1::uuid IS NULL OR "id" > $1::uuid
+ORDER BY "id" ASC
+LIMIT $2::integer OFFSET $3::integer
+"""
 
 
 class ShowsService:
     """Service to manage shows."""
 
-    def __init__(self, howlite: HowliteService, sapphire: SapphireService) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        config: SapphireRawConfig,
+        conflicts: ConflictsService,
+        flights: SingleFlight[Hashable, Any],
+        howlite: HowliteService,
+        metrics: MetricsService,
+        occurrences: OccurrencesService,
+        outbox: OutboxService,
+        replicas: ReplicasService,
+        sapphire: SapphireService,
+        timeline: TimelineService,
+    ) -> None:
+        self._config = config
+        self._conflicts = conflicts
+        self._flights = flights
         self._howlite = howlite
+        self._metrics = metrics
+        self._occurrences = occurrences
+        self._outbox = outbox
+        self._replicas = replicas
         self._sapphire = sapphire
+        self._timeline = timeline
+        self._written = False
 
     @contextmanager
     def _handle_errors(self) -> Generator[None]:
@@ -30,25 +112,119 @@ class ShowsService:
             raise e.ConflictError from ex
         except se.DataError as ex:
             raise e.ValidationError from ex
-        except (he.ServiceError, se.ServiceError) as ex:
+        except (he.ServiceError, oe.ServiceError, se.ServiceError) as ex:
             raise e.ServiceError from ex
 
-    async def _map_event(self, sevent: sm.Event) -> m.Event:
+    @asynccontextmanager
+    async def _transaction(self, operation: str) -> AsyncGenerator[SapphireService]:
+        self._written = True
+
+        with self._metrics.measure(f"sapphire.transaction.shows.{operation}"):
+            async with self._sapphire.tx() as transaction:
+                yield transaction
+
+        # Reads that started before the commit must not be joined after it
+        self._flights.clear()
+
+    def _reader(self) -> SapphireService:
+        # Replicas may not have caught up with writes made by this service yet
+        if self._written:
+            return self._sapphire
+
+        return self._replicas.reader()
+
+    def _keyset(
+        self, position: m.ShowCursor, order: Sequence[m.ShowOrderByInput]
+    ) -> m.ShowWhereInput:
+        where = keysetwhere(
+            [(field, direction) for item in order for field, direction in item.items()],
+            position["values"],
+            nullable={"description"},
+        )
+        return cast("m.ShowWhereInput", where)
+
+    def _where_after(
+        self,
+        where: m.ShowWhereInput | None,
+        position: m.ShowCursor | None,
+        order: Sequence[m.ShowOrderByInput],
+    ) -> m.ShowWhereInput | None:
+        if position is None:
+            return where
+
+        after = self._keyset(position, order)
+        return {"AND": [where, after]} if where else after
+
+    def _parse_cursor(
+        self, cursor: str, order: Sequence[m.ShowOrderByInput]
+    ) -> m.ShowCursor:
+        try:
+            position = cursorparse(cursor, m.ShowCursor)
+            # Cursors from lists in another order miss values to continue from
+            self._keyset(position, order)
+        except (KeyError, ValueError) as ex:
+            raise e.InvalidCursorError(cursor) from ex
+
+        return position
+
+    def _build_cursor(self, sshow: sm.Show, order: Sequence[m.ShowOrderByInput]) -> str:
+        # Values of all sort keys are kept, so that edits to the show don't matter
+        values = {field: getattr(sshow, field) for item in order for field in item}
+        return cursorstringify(m.ShowCursor(values=values))
+
+    def _order_with_tiebreaker(
+        self, order: m.ShowOrderByInput | Sequence[m.ShowOrderByInput] | None
+    ) -> Sequence[m.ShowOrderByInput]:
+        if order is None:
+            order = []
+        elif not isinstance(order, Sequence):
+            order = [order]
+
+        # Order by identifier last to make the order total and cursors stable
+        if not any("id" in item for item in order):
+            order = [*order, {"id": "asc"}]
+
+        return order
+
+    async def _get_howlite_event(self, sevent: sm.Event) -> hm.Event:
+        if self._outbox.enabled:
+            # Writes still waiting in the outbox take precedence
+            pending_request = om.PendingRequest(ids=[UUID(sevent.id)])
+
+            with self._handle_errors():
+                pending_response = await self._outbox.pending(pending_request)
+
+            if (hevent := pending_response.events.get(UUID(sevent.id))) is not None:
+                return hevent
+
         request = hm.GetEventRequest(id=UUID(sevent.id))
 
         with self._handle_errors():
             res = await self._howlite.get_event(request)
 
+        return res.event
+
+    async def _map_event(
+        self, sevent: sm.Event, *, schedule: bool = True
+    ) -> m.Event | m.EventMetadata:
         if sevent.show is not None:
-            show = await self._map_show(sevent.show)
+            show = await self._map_show(sevent.show, schedule=schedule)
         else:
             show = None
 
-        return m.Event.map(sevent, res.event, show)
+        # Schedule is stored in howlite, so skipping it saves the requests
+        if not schedule:
+            return m.EventMetadata.map(sevent, show)
 
-    async def _map_show(self, sshow: sm.Show) -> m.Show:
+        hevent = await self._get_howlite_event(sevent)
+        return m.Event.map(sevent, hevent, show)
+
+    async def _map_show(self, sshow: sm.Show, *, schedule: bool = True) -> m.Show:
         if sshow.events is not None:
-            events = [await self._map_event(event) for event in sshow.events]
+            events = [
+                await self._map_event(event, schedule=schedule)
+                for event in sshow.events
+            ]
         else:
             events = None
 
@@ -57,86 +233,325 @@ class ShowsService:
     async def count(self, request: m.CountRequest) -> m.CountResponse:
         """Count shows."""
         with self._handle_errors():
-            count = await self._sapphire.show.count(where=request.where)
+            count = await self._flights.do(
+                flightkey("show.count", self._written, request.where),
+                partial(self._reader().show.count, where=request.where),
+            )
 
         return m.CountResponse(count=count)
 
+    async def _find_many_shows(  # noqa: PLR0913
+        self,
+        client: SapphireService,
+        take: int | None,
+        skip: int | None,
+        position: m.ShowCursor | None,
+        where: m.ShowWhereInput | None,
+        include: m.ShowInclude | None,
+        order: Sequence[m.ShowOrderByInput],
+    ) -> Sequence[sm.Show]:
+        # Cursors are continued with filters, which still work if the show is gone
+        return await client.show.find_many(
+            take=take,
+            skip=skip,
+            where=self._where_after(where, position, order),
+            include=include,
+            order=builtins.list(order),
+        )
+
+    async def _find_shows(  # noqa: PLR0913
+        self,
+        take: int | None,
+        skip: int | None,
+        position: m.ShowCursor | None,
+        where: m.ShowWhereInput | None,
+        include: m.ShowInclude | None,
+        order: Sequence[m.ShowOrderByInput],
+    ) -> tuple[Sequence[sm.Show], int | None]:
+        client = self._reader()
+
+        if (
+            where
+            or include
+            or builtins.list(order) != [{"id": "asc"}]
+            or (position is not None and not isuuid(position["values"]["id"]))
+        ):
+            shows = await self._find_many_shows(
+                client, take, skip, position, where, include, order
+            )
+            return shows, None
+
+        # Both ways are measured under the same name, so they can be compared
+        with self._metrics.measure("sapphire.read.shows.list.page"):
+            if not self._config.shows_page:
+                shows = await self._find_many_shows(
+                    client, take, skip, position, where, include, order
+                )
+                return shows, None
+
+            rows = await client.query_raw(
+                SHOWS_PAGE_QUERY,
+                position["values"]["id"] if position is not None else None,
+                take,
+                skip,
+            )
+
+        # Rows are read straight from the database, so they don't need validation
+        shows = [
+            sm.Show.model_construct(
+                id=row["id"], title=row["title"], description=row["description"]
+            )
+            for row in rows
+        ]
+
+        # Every row carries the number of all shows, regardless of the page
+        return shows, rows[0]["count"] if rows else None
+
     async def list(self, request: m.ListRequest) -> m.ListResponse:
         """List shows."""
+        limit = request.limit
+        offset = request.offset
+        cursor = request.cursor
+
+        order = self._order_with_tiebreaker(request.order)
+        position = self._parse_cursor(cursor, order) if cursor is not None else None
+
+        # Fetch one more show than requested to know if there are more
+        take = limit + 1 if limit is not None else None
+        skip = offset
+
+        with self._handle_errors():
+            shows, count = await self._flights.do(
+                flightkey(
+                    "show.find_many",
+                    self._written,
+                    take,
+                    skip,
+                    position,
+                    request.where,
+                    request.include,
+                    order,
+                ),
+                partial(
+                    self._find_shows,
+                    take,
+                    skip,
+                    position,
+                    request.where,
+                    request.include,
+                    order,
+                ),
+            )
+
+        more = limit is not None and len(shows) > limit
+        shows = shows[:limit]
+        next_cursor = self._build_cursor(shows[-1], order) if more and shows else None
+
+        shows = [
+            await self._map_show(show, schedule=request.schedule) for show in shows
+        ]
+        return m.ListResponse(shows=shows, cursor=next_cursor, count=count)
+
+    def _count_from_page(self, request: m.PageRequest, found: int) -> int | None:
+        # Counting from a cursor would need the number of items before it
+        if request.cursor is not None:
+            return None
+
+        # A page that is not full reaches the end, so it shows the total,
+        # unless the offset skipped past the end
+        if (request.limit is None or found < request.limit) and (
+            found > 0 or not request.offset
+        ):
+            return (request.offset or 0) + found
+
+        return None
+
+    async def _estimate_count(self) -> int | None:
+        with self._handle_errors():
+            rows = await self._reader().query_raw(
+                "SELECT reltuples::bigint AS count FROM pg_class "
+                "WHERE oid = 'shows'::regclass"
+            )
+
+        count = rows[0]["count"] if rows else -1
+
+        # Tables that were never analyzed have no estimate
+        return count if count >= 0 else None
+
+    async def page(self, request: m.PageRequest) -> m.PageResponse:
+        """List a page of shows along with the number of all matching shows."""
+        list_request = m.ListRequest(
+            limit=request.limit,
+            offset=request.offset,
+            cursor=request.cursor,
+            where=request.where,
+            include=request.include,
+            order=request.order,
+            schedule=request.schedule,
+        )
+
+        list_response = await self.list(list_request)
+
+        count = self._count_from_page(request, len(list_response.shows))
+
+        # The hand-written query counts all shows along with the page
+        if count is None:
+            count = list_response.count
+
+        if count is None and request.count == "estimated" and not request.where:
+            count = await self._estimate_count()
+
+        if count is None:
+            count_response = await self.count(m.CountRequest(where=request.where))
+            count = count_response.count
+
+        return m.PageResponse(
+            shows=list_response.shows, cursor=list_response.cursor, count=count
+        )
+
+    def _build_tsquery(self, text: str) -> str:
+        # Every word is matched as a prefix, since the last one may be incomplete
+        words = re.findall(r"[^\W_]+", text.lower())
+        return " & ".join(f"{word}:*" for word in words)
+
+    def _escape_like(self, text: str) -> str:
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def _mark(self, text: str | None) -> str | None:
+        if text is None:
+            return None
+
+        # Shows are plain text, so only the marks should be read as HTML
+        return (
+            html.escape(text)
+            .replace(HEADLINE_START, "<mark>")
+            .replace(HEADLINE_STOP, "</mark>")
+        )
+
+    async def _search_shows(
+        self, text: str, limit: int | None, offset: int, *, highlight: bool
+    ) -> Sequence[dict[str, Any]]:
+        with self._handle_errors():
+            return await self._reader().query_raw(
+                SEARCH_QUERY,
+                text,
+                self._build_tsquery(text),
+                highlight,
+                limit,
+                HEADLINE_OPTIONS,
+                self._escape_like(text),
+                offset,
+            )
+
+    async def _filter_shows(
+        self, rows: Sequence[dict[str, Any]], request: m.SearchRequest
+    ) -> Sequence[sm.Show]:
+        matched: st.ShowWhereInput = {"id": {"in": [row["id"] for row in rows]}}
+        where = request.where
+
         with self._handle_errors():
-            shows = await self._sapphire.show.find_many(
-                take=request.limit,
-                skip=request.offset,
-                where=request.where,
+            shows = await self._reader().show.find_many(
+                where={"AND": [where, matched]} if where is not None else matched,
                 include=request.include,
-                order=builtins.list(request.order)
-                if isinstance(request.order, Sequence)
-                else request.order,
             )
 
-        shows = [await self._map_show(show) for show in shows]
-        return m.ListResponse(shows=shows)
+        positions = {row["id"]: index for index, row in enumerate(rows)}
+        return sorted(shows, key=lambda show: positions[show.id])
+
+    async def _find_ranked_shows(
+        self, request: m.SearchRequest
+    ) -> Sequence[tuple[sm.Show, dict[str, Any]]]:
+        limit = request.limit
+        found: list[tuple[sm.Show, dict[str, Any]]] = []
+        offset = 0
+
+        # Filters can't be applied in the query, so ranked shows are filtered in pages
+        while limit is None or len(found) < limit:
+            batch = SEARCH_BATCH if request.where is not None else limit
+            rows = await self._search_shows(
+                request.text, batch, offset, highlight=request.highlight
+            )
+
+            if not rows:
+                break
+
+            ranked = {row["id"]: row for row in rows}
+            shows = await self._filter_shows(rows, request)
+            found.extend((show, ranked[show.id]) for show in shows)
+
+            if batch is None or len(rows) < batch:
+                break
+
+            offset += len(rows)
+
+        return found[:limit]
+
+    async def search(self, request: m.SearchRequest) -> m.SearchResponse:
+        """Search shows by text, ranking them by relevance."""
+        results = []
+
+        for show, row in await self._find_ranked_shows(request):
+            highlights = (
+                m.ShowHighlights(
+                    title=self._mark(row["title"]) or "",
+                    description=self._mark(row["description"]),
+                )
+                if request.highlight
+                else None
+            )
+            results.append(
+                m.SearchResult(
+                    show=await self._map_show(show, schedule=request.schedule),
+                    rank=float(row["rank"]),
+                    highlights=highlights,
+                )
+            )
+
+        return m.SearchResponse(results=results)
 
     async def get(self, request: m.GetRequest) -> m.GetResponse:
         """Get show."""
         with self._handle_errors():
-            show = await self._sapphire.show.find_unique(
+            show = await self._reader().show.find_unique(
                 where=request.where, include=request.include
             )
 
         if show is None:
             return m.GetResponse(show=None)
 
-        show = await self._map_show(show)
+        show = await self._map_show(show, schedule=request.schedule)
         return m.GetResponse(show=show)
 
     async def create(self, request: m.CreateRequest) -> m.CreateResponse:
         """Create show."""
+        self._written = True
+
         with self._handle_errors():
             show = await self._sapphire.show.create(
                 data=cast("st.ShowCreateInput", request.data), include=request.include
             )
 
+        # Reads that started before the write must not be joined after it
+        self._flights.clear()
+
         show = await self._map_show(show)
         return m.CreateResponse(show=show)
 
-    async def _update_handle_events(
-        self, transaction: SapphireService, old: sm.Show, new: sm.Show
-    ) -> Sequence[sm.Event]:
-        events = []
-
-        if new.id != old.id:
-            for event in await transaction.event.find_many(where={"showId": old.id}):
-                await transaction.event.update(
-                    data={"show": {"connect": {"id": new.id}}}, where={"id": event.id}
-                )
-
-            events = await transaction.event.find_many(where={"showId": new.id})
-
-        return events
-
     async def update(self, request: m.UpdateRequest) -> m.UpdateResponse:
         """Update show."""
-        async with self._sapphire.tx() as transaction:
+        async with self._transaction("update") as transaction:
             with self._handle_errors():
-                old = await transaction.show.find_unique(where=request.where)
-
-                if old is None:
-                    return m.UpdateResponse(show=None)
-
-                new = await transaction.show.update(
+                show = await transaction.show.update(
                     data=cast("st.ShowUpdateInput", request.data),
                     where=request.where,
                     include=request.include,
                 )
 
-                if new is None:
+                if show is None:
                     return m.UpdateResponse(show=None)
 
-                await self._update_handle_events(transaction, old, new)
-
-        new = await self._map_show(new)
-        return m.UpdateResponse(show=new)
+        show = await self._map_show(show)
+        return m.UpdateResponse(show=show)
 
     async def _delete_handle_events(
         self, transaction: SapphireService, show: sm.Show
@@ -147,15 +562,68 @@ class ShowsService:
             where={"id": {"in": [event.id for event in events]}}
         )
 
+        return events
+
+    async def _delete_howlite_events(
+        self, events: Sequence[sm.Event]
+    ) -> Sequence[sm.Event]:
+        failed: list[sm.Event] = []
+
         for event in events:
-            req = hm.DeleteEventRequest(id=UUID(event.id))
-            await self._howlite.delete_event(req)
+            req = hm.DeleteEventRequest(id=UUID(event.id), etag=None)
 
-        return events
+            try:
+                await self._howlite.delete_event(req)
+            except he.ServiceError:
+                failed.append(event)
+
+        return failed
+
+    async def _restore_show(self, show: sm.Show, events: Sequence[sm.Event]) -> bool:
+        # The title could have been taken by another show in the meantime
+        try:
+            async with self._transaction("compensate") as transaction:
+                with self._handle_errors():
+                    await transaction.show.create(
+                        data={
+                            "id": show.id,
+                            "title": show.title,
+                            "description": show.description,
+                        }
+                    )
+                    await transaction.event.create_many(
+                        data=[
+                            {"id": event.id, "type": event.type, "showId": show.id}
+                            for event in events
+                        ]
+                    )
+        except e.ServiceError:
+            return False
+
+        if not self._occurrences.enabled:
+            return True
+
+        # Restored events have lost their occurrences, so none can be trusted
+        with suppress(oce.ServiceError):
+            await self._occurrences.invalidate(ocm.InvalidateRequest())
+
+        return True
+
+    async def _remove_instances(self, ids: AbstractSet[str]) -> None:
+        # Occurrences are deleted together with events by sapphire itself
+        if self._conflicts.enabled:
+            await self._conflicts.remove(cfm.RemoveRequest(ids=ids))
+
+        if self._timeline.enabled:
+            await self._timeline.remove(tlm.RemoveRequest(ids=ids))
 
     async def delete(self, request: m.DeleteRequest) -> m.DeleteResponse:
-        """Delete show."""
-        async with self._sapphire.tx() as transaction:
+        """Delete show.
+
+        If some events can't be deleted from howlite, the show is restored
+        only with them, since the others are already gone from howlite.
+        """
+        async with self._transaction("delete") as transaction:
             with self._handle_errors():
                 show = await transaction.show.delete(
                     where=request.where, include=request.include
@@ -164,7 +632,32 @@ class ShowsService:
                 if show is None:
                     return m.DeleteResponse(show=None)
 
-                await self._delete_handle_events(transaction, show)
-
+                events = await self._delete_handle_events(transaction, show)
+
+                if self._outbox.enabled:
+                    await self._outbox.push(
+                        om.PushRequest(
+                            transaction=transaction,
+                            writes=[
+                                om.Write(id=UUID(event.id), event=None)
+                                for event in events
+                            ],
+                        )
+                    )
+
+        # Events no longer referenced from sapphire are unreachable,
+        # so they can be removed from howlite after the transaction commits
+        ids = {event.id for event in events}
+
+        if not self._outbox.enabled:
+            failed = await self._delete_howlite_events(events)
+
+            # Compensate for events that could not be deleted from howlite
+            if failed:
+                await self._remove_instances(ids - {event.id for event in failed})
+                restored = await self._restore_show(show, failed)
+                raise e.EventsNotDeletedError(show.id, restored=restored)
+
+        await self._remove_instances(ids)
         show = await self._map_show(show)
         return m.DeleteResponse(show=show)
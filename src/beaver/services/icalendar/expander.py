@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -38,3 +38,24 @@ class EventExpander:
         ]
 
         return [self._build_instance(vevent, tz) for vevent in vevents]
+
+    def iterate(
+        self, event: m.Event, start: datetime, end: datetime
+    ) -> Iterator[m.Instance]:
+        """Lazily expand the event into instances between start and end in order."""
+        tz = event.timezone
+
+        calendar = m.Calendar(events=[event])
+        calendar = self._parser.calendar_to_ical(calendar)
+
+        for component in recurring_ical_events.of(calendar).after(start):
+            if not isinstance(component, vEvent):
+                continue
+
+            instance = self._build_instance(component, tz)
+
+            # Occurrences are yielded in order, so nothing after this one can match
+            if instance.start.replace(tzinfo=tz) >= end:
+                return
+
+            yield instance
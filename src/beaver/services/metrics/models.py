@@ -0,0 +1,39 @@
+from collections.abc import Mapping
+
+from beaver.models.base import datamodel
+
+
+@datamodel
+class Summary:
+    """Summary of observed values of a metric."""
+
+    count: int
+    """Number of observed values."""
+
+    total: float
+    """Sum of observed values."""
+
+    max: float
+    """Largest observed value."""
+
+    p50: float
+    """Median of recently observed values."""
+
+    p99: float
+    """99th percentile of recently observed values."""
+
+
+@datamodel
+class GetRequest:
+    """Request to get metrics."""
+
+
+@datamodel
+class GetResponse:
+    """Response for getting metrics."""
+
+    summaries: Mapping[str, Summary]
+    """Summaries of metrics by name."""
+
+    gauges: Mapping[str, float]
+    """Current values of metrics by name."""
@@ -0,0 +1,148 @@
+import math
+import time
+from collections import deque
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+
+from beaver.services.data.sapphire import errors as se
+from beaver.services.data.sapphire import metrics as smt
+from beaver.services.data.sapphire.service import SapphireService
+from beaver.services.metrics import errors as e
+from beaver.services.metrics import models as m
+
+# Histograms of the query engine, in milliseconds
+SAPPHIRE_HISTOGRAMS = {
+    "prisma_client_queries_wait_histogram_ms": "sapphire.pool.wait",
+    "prisma_client_queries_duration_histogram_ms": "sapphire.queries.duration",
+}
+
+SAPPHIRE_GAUGES = {
+    "prisma_client_queries_wait": "sapphire.pool.waiting",
+    "prisma_pool_connections_busy": "sapphire.pool.busy",
+    "prisma_pool_connections_idle": "sapphire.pool.idle",
+    "prisma_pool_connections_open": "sapphire.pool.open",
+}
+
+
+class Series:
+    """Observed values of a single metric."""
+
+    def __init__(self, window: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque[float](maxlen=window)
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.samples.append(value)
+
+
+class MetricsService:
+    """Service to collect metrics in process."""
+
+    def __init__(self, sapphire: SapphireService, window: int = 1024) -> None:
+        self._sapphire = sapphire
+        self._window = window
+        self._series: dict[str, Series] = {}
+
+    def _quantile(self, samples: Sequence[float], q: float) -> float:
+        if not samples:
+            return 0.0
+
+        return samples[min(len(samples) - 1, math.ceil(q * len(samples)) - 1)]
+
+    def _summarize(self, series: Series) -> m.Summary:
+        samples = sorted(series.samples)
+
+        return m.Summary(
+            count=series.count,
+            total=series.total,
+            max=series.max,
+            p50=self._quantile(samples, 0.5),
+            p99=self._quantile(samples, 0.99),
+        )
+
+    def _bucket_quantile(
+        self, buckets: Sequence[tuple[float, int]], count: int, q: float
+    ) -> float:
+        target = math.ceil(q * count)
+        seen = 0
+
+        # Only bucket bounds are known, so report the bound the quantile falls under
+        for bound, bucket in buckets:
+            seen += bucket
+
+            if seen >= target:
+                return bound
+
+        return 0.0
+
+    def _summarize_histogram(self, histogram: smt.MetricHistogram) -> m.Summary:
+        buckets = [(bound / 1000, count) for bound, count in histogram.buckets]
+        largest = next((bound for bound, count in reversed(buckets) if count), 0.0)
+
+        return m.Summary(
+            count=histogram.count,
+            total=histogram.sum / 1000,
+            max=largest,
+            p50=self._bucket_quantile(buckets, histogram.count, 0.5),
+            p99=self._bucket_quantile(buckets, histogram.count, 0.99),
+        )
+
+    async def _get_sapphire_metrics(
+        self,
+    ) -> tuple[dict[str, m.Summary], dict[str, float]]:
+        try:
+            metrics = await self._sapphire.get_metrics()
+        except se.ServiceError as ex:
+            raise e.ServiceError from ex
+
+        summaries = {
+            SAPPHIRE_HISTOGRAMS[metric.key]: self._summarize_histogram(metric.value)
+            for metric in metrics.histograms
+            if metric.key in SAPPHIRE_HISTOGRAMS
+        }
+        gauges = {
+            SAPPHIRE_GAUGES[metric.key]: metric.value
+            for metric in metrics.gauges
+            if metric.key in SAPPHIRE_GAUGES
+        }
+
+        return summaries, gauges
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a value of a metric."""
+        if name not in self._series:
+            self._series[name] = Series(self._window)
+
+        self._series[name].observe(value)
+
+    @contextmanager
+    def measure(self, name: str) -> Generator[None]:
+        """Record the time spent in the block in seconds."""
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    async def get(self, request: m.GetRequest) -> m.GetResponse:
+        """Get metrics."""
+        summaries = {
+            name: self._summarize(series) for name, series in self._series.items()
+        }
+        gauges: dict[str, float] = {}
+
+        if self._sapphire.is_connected():
+            sapphire_summaries, gauges = await self._get_sapphire_metrics()
+            summaries |= sapphire_summaries
+
+        return m.GetResponse(
+            summaries=dict(sorted(summaries.items())),
+            gauges=dict(sorted(gauges.items())),
+        )
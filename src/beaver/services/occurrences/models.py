@@ -0,0 +1,129 @@
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from datetime import datetime, timedelta
+from typing import Literal, TypedDict
+
+from beaver.models.base import datamodel
+from beaver.services.data.sapphire import types as st
+
+type OccurrenceField = Literal["start", "event_id"]
+
+type SortOrder = Literal["asc", "desc"]
+
+type OccurrenceOrder = tuple[OccurrenceField, SortOrder]
+
+
+@datamodel
+class Occurrence:
+    """Precomputed instance of an event."""
+
+    event_id: str
+    """Identifier of the event the occurrence belongs to."""
+
+    start: datetime
+    """Start datetime of the occurrence in event timezone."""
+
+    duration: timedelta
+    """Duration of the occurrence."""
+
+
+class OccurrencePosition(TypedDict, total=True):
+    """Position of an occurrence in a list."""
+
+    start: datetime
+    """Start datetime of the occurrence in event timezone."""
+
+    event_id: str
+    """Identifier of the event the occurrence belongs to."""
+
+
+@datamodel
+class RefreshRequest:
+    """Request to refresh occurrences of events."""
+
+    ids: AbstractSet[str]
+    """Identifiers of the events."""
+
+
+@datamodel
+class RefreshResponse:
+    """Response for refreshing occurrences of events."""
+
+
+@datamodel
+class InvalidateRequest:
+    """Request to invalidate all occurrences."""
+
+
+@datamodel
+class InvalidateResponse:
+    """Response for invalidating all occurrences."""
+
+
+@datamodel
+class ExtendRequest:
+    """Request to extend the time range covered by occurrences."""
+
+
+@datamodel
+class ExtendResponse:
+    """Response for extending the time range covered by occurrences."""
+
+    start: datetime
+    """Start datetime in UTC of the covered time range."""
+
+    end: datetime
+    """End datetime in UTC of the covered time range."""
+
+    rebuilt: bool
+    """Whether all occurrences were computed anew."""
+
+
+@datamodel
+class CoversRequest:
+    """Request to check if occurrences cover a time range."""
+
+    start: datetime
+    """Start datetime in UTC of the time range."""
+
+    end: datetime
+    """End datetime in UTC of the time range."""
+
+
+@datamodel
+class CoversResponse:
+    """Response for checking if occurrences cover a time range."""
+
+    covered: bool
+    """Whether all occurrences in the time range are precomputed."""
+
+
+@datamodel
+class ListRequest:
+    """Request to list occurrences."""
+
+    start: datetime
+    """Start datetime in UTC to filter occurrences."""
+
+    end: datetime
+    """End datetime in UTC to filter occurrences."""
+
+    where: st.EventWhereInput | None
+    """Filter to apply to events of the occurrences."""
+
+    order: Sequence[OccurrenceOrder]
+    """Order to apply to the results."""
+
+    after: OccurrencePosition | None
+    """Position of the occurrence to continue listing after."""
+
+    limit: int | None
+    """Maximum number of occurrences to return."""
+
+
+@datamodel
+class ListResponse:
+    """Response for listing occurrences."""
+
+    occurrences: Sequence[Occurrence]
+    """Occurrences that match the request."""
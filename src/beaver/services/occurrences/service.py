@@ -0,0 +1,282 @@
+import asyncio
+from collections.abc import Generator, Iterator, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from contextlib import AbstractAsyncContextManager, contextmanager, suppress
+from datetime import UTC, datetime
+from typing import Any, cast
+from uuid import UUID
+
+from beaver.config.models import SapphireOccurrencesConfig
+from beaver.services.data.howlite import errors as he
+from beaver.services.data.howlite import models as hm
+from beaver.services.data.howlite.service import HowliteService
+from beaver.services.data.sapphire import errors as se
+from beaver.services.data.sapphire import models as sm
+from beaver.services.data.sapphire import types as st
+from beaver.services.data.sapphire.service import SapphireService
+from beaver.services.icalendar import errors as ie
+from beaver.services.icalendar.service import ICalendarService
+from beaver.services.occurrences import errors as e
+from beaver.services.occurrences import models as m
+from beaver.services.outbox import errors as oe
+from beaver.services.outbox import models as om
+from beaver.services.outbox.service import OutboxService
+
+
+class OccurrencesService:
+    """Service for instances of events precomputed in sapphire."""
+
+    def __init__(
+        self,
+        config: SapphireOccurrencesConfig,
+        howlite: HowliteService,
+        outbox: OutboxService,
+        sapphire: SapphireService,
+    ) -> None:
+        self._config = config
+        self._howlite = howlite
+        self._outbox = outbox
+        self._sapphire = sapphire
+        self._icalendar = ICalendarService()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether instances of events are precomputed."""
+        return self._config.enabled
+
+    @property
+    def horizon(self) -> int:
+        """Identifier of the only row with the covered time range."""
+        return 1
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except (
+            he.ServiceError,
+            ie.ServiceError,
+            oe.ServiceError,
+            se.ServiceError,
+        ) as ex:
+            raise e.ServiceError from ex
+
+    def _tx(self) -> AbstractAsyncContextManager[SapphireService]:
+        # Whole time ranges are written at once, which takes longer than usual
+        return self._sapphire.tx(timeout=self._config.timeout)
+
+    def _field(self, field: m.OccurrenceField) -> str:
+        return {"start": "localStart", "event_id": "eventId"}[field]
+
+    def _expand(
+        self, events: Sequence[hm.Event], start: datetime, end: datetime
+    ) -> Iterator[st.OccurrenceCreateWithoutRelationsInput]:
+        for event in events:
+            for instance in self._icalendar.expander.iterate(event, start, end):
+                utcstart = instance.start.replace(tzinfo=event.timezone)
+                utcstart = utcstart.astimezone(UTC)
+
+                yield {
+                    "eventId": str(event.id),
+                    # Local datetimes are stored without timezone, so mark them as UTC
+                    "localStart": instance.start.replace(tzinfo=UTC),
+                    "start": utcstart,
+                    "end": utcstart + instance.duration,
+                }
+
+    async def _query_events(self, start: datetime, end: datetime) -> Sequence[hm.Event]:
+        request = hm.QueryEventsRequest(query=hm.TimeRangeQuery(start=start, end=end))
+
+        with self._handle_errors():
+            response = await self._howlite.query_events(request)
+
+        return response.events
+
+    async def _load(self, ids: AbstractSet[str]) -> Mapping[str, hm.Event | None]:
+        request = om.CurrentRequest(ids=[UUID(event_id) for event_id in ids])
+
+        with self._handle_errors():
+            response = await self._outbox.current(request)
+
+        return {str(event_id): event for event_id, event in response.events.items()}
+
+    async def _get_horizon(
+        self, transaction: SapphireService
+    ) -> sm.OccurrenceHorizon | None:
+        with self._handle_errors():
+            return await transaction.occurrencehorizon.find_unique(
+                where={"id": self.horizon}
+            )
+
+    async def _rebuild(self, start: datetime, end: datetime) -> None:
+        events = await self._query_events(start, end)
+
+        with self._handle_errors():
+            data = list(self._expand(events, start, end))
+
+            async with self._tx() as transaction:
+                await transaction.occurrence.delete_many()
+                await transaction.occurrence.create_many(data=data)
+                await transaction.occurrencehorizon.upsert(
+                    where={"id": self.horizon},
+                    data={
+                        "create": {"id": self.horizon, "start": start, "end": end},
+                        "update": {"start": start, "end": end},
+                    },
+                )
+
+    async def _advance(
+        self, horizon: sm.OccurrenceHorizon, start: datetime, end: datetime
+    ) -> None:
+        # Only the time range that is not covered yet needs to be expanded
+        events = await self._query_events(horizon.end, end)
+
+        with self._handle_errors():
+            data = list(self._expand(events, horizon.end, end))
+
+            async with self._tx() as transaction:
+                await transaction.occurrence.delete_many(where={"end": {"lte": start}})
+                # Instances overlapping the previous end are already there
+                await transaction.occurrence.create_many(
+                    data=data, skip_duplicates=True
+                )
+                await transaction.occurrencehorizon.update(
+                    where={"id": self.horizon},
+                    data={"start": start, "end": end},
+                )
+
+    async def _invalidate(self) -> None:
+        with self._handle_errors():
+            await self._sapphire.occurrencehorizon.delete_many(
+                where={"id": self.horizon}
+            )
+
+    async def refresh(self, request: m.RefreshRequest) -> m.RefreshResponse:
+        """Recompute occurrences of events after they were written."""
+        if not self.enabled or not request.ids:
+            return m.RefreshResponse()
+
+        async with self._lock:
+            try:
+                # Reading under the lock keeps refreshes from applying older data
+                events = await self._load(request.ids)
+                written = [event for event in events.values() if event is not None]
+
+                with self._handle_errors():
+                    async with self._tx() as transaction:
+                        horizon = await self._get_horizon(transaction)
+
+                        # Nothing is covered, so there is nothing to keep up to date
+                        if horizon is None:
+                            return m.RefreshResponse()
+
+                        data = list(self._expand(written, horizon.start, horizon.end))
+
+                        await transaction.occurrence.delete_many(
+                            where={"eventId": {"in": list(events)}}
+                        )
+                        await transaction.occurrence.create_many(data=data)
+            except e.ServiceError:
+                # Stale occurrences must not be used, so stop using all of them
+                with suppress(e.ServiceError):
+                    await self._invalidate()
+
+                raise
+
+        return m.RefreshResponse()
+
+    async def invalidate(self, request: m.InvalidateRequest) -> m.InvalidateResponse:
+        """Stop using occurrences until they are computed anew."""
+        async with self._lock:
+            await self._invalidate()
+
+        return m.InvalidateResponse()
+
+    async def extend(self, request: m.ExtendRequest) -> m.ExtendResponse:
+        """Move the covered time range forward, computing missing occurrences."""
+        now = datetime.now(UTC)
+        start = now - self._config.past
+        end = now + self._config.future
+
+        async with self._lock:
+            horizon = await self._get_horizon(self._sapphire)
+
+            if horizon is None or start < horizon.start:
+                # Moving the start backwards would leave a gap, so compute everything
+                await self._rebuild(start, end)
+                rebuilt = True
+            else:
+                end = max(end, horizon.end)
+                await self._advance(horizon, start, end)
+                rebuilt = False
+
+        return m.ExtendResponse(start=start, end=end, rebuilt=rebuilt)
+
+    async def covers(self, request: m.CoversRequest) -> m.CoversResponse:
+        """Check if occurrences cover a time range."""
+        if not self.enabled:
+            return m.CoversResponse(covered=False)
+
+        horizon = await self._get_horizon(self._sapphire)
+
+        covered = (
+            horizon is not None
+            and horizon.start <= request.start
+            and request.end <= horizon.end
+        )
+
+        return m.CoversResponse(covered=covered)
+
+    def _build_keyset(
+        self, order: Sequence[m.OccurrenceOrder], after: m.OccurrencePosition
+    ) -> list[st.OccurrenceWhereInput]:
+        values = {
+            "start": after["start"].replace(tzinfo=UTC),
+            "event_id": after["event_id"],
+        }
+        conditions: list[st.OccurrenceWhereInput] = []
+
+        # Rows after the position differ from it on the first field that is not equal
+        for index, (field, direction) in enumerate(order):
+            condition: dict[str, Any] = {
+                self._field(previous): values[previous] for previous, _ in order[:index]
+            }
+            operator = "gt" if direction == "asc" else "lt"
+            condition[self._field(field)] = {operator: values[field]}
+            conditions.append(cast("st.OccurrenceWhereInput", condition))
+
+        return conditions
+
+    def _map_occurrence(self, occurrence: sm.Occurrence) -> m.Occurrence:
+        return m.Occurrence(
+            event_id=occurrence.eventId,
+            start=occurrence.localStart.replace(tzinfo=None),
+            duration=occurrence.end - occurrence.start,
+        )
+
+    async def list(self, request: m.ListRequest) -> m.ListResponse:
+        """List occurrences overlapping a time range."""
+        where: st.OccurrenceWhereInput = {
+            "start": {"lt": request.end},
+            "end": {"gt": request.start},
+        }
+
+        if request.where is not None:
+            where["event"] = {"is": request.where}
+
+        if request.after is not None:
+            where["OR"] = self._build_keyset(request.order, request.after)
+
+        order = [{self._field(field): direction} for field, direction in request.order]
+
+        with self._handle_errors():
+            occurrences = await self._sapphire.occurrence.find_many(
+                where=where,
+                order=cast("list[st.OccurrenceOrderByInput]", order),
+                take=request.limit,
+            )
+
+        return m.ListResponse(
+            occurrences=[self._map_occurrence(occurrence) for occurrence in occurrences]
+        )
@@ -0,0 +1,9 @@
+class ServiceError(Exception):
+    """Base class for service errors."""
+
+
+class PayloadError(ServiceError):
+    """Raised when the payload of a pending write is invalid."""
+
+    def __init__(self, entry: int) -> None:
+        super().__init__(f"Payload of outbox entry {entry} is invalid.")
@@ -0,0 +1,87 @@
+from collections.abc import Mapping, Sequence
+from uuid import UUID
+
+from beaver.models.base import datamodel
+from beaver.services.data.howlite import models as hm
+from beaver.services.data.sapphire.service import SapphireService
+
+
+@datamodel
+class Write:
+    """Pending write of an event."""
+
+    id: UUID
+    """Identifier of the event."""
+
+    event: hm.Event | None
+    """Event data to write, or nothing to remove the event."""
+
+
+@datamodel
+class PushRequest:
+    """Request to push writes to the outbox."""
+
+    transaction: SapphireService
+    """Transaction to push the writes in."""
+
+    writes: Sequence[Write]
+    """Writes to push, in order."""
+
+
+@datamodel
+class PushResponse:
+    """Response for pushing writes to the outbox."""
+
+
+@datamodel
+class PendingRequest:
+    """Request to get the pending state of events."""
+
+    ids: Sequence[UUID]
+    """Identifiers of the events."""
+
+
+@datamodel
+class PendingResponse:
+    """Response for getting the pending state of events."""
+
+    events: Mapping[UUID, hm.Event | None]
+    """Latest pending event data of events that have pending writes."""
+
+
+@datamodel
+class CurrentRequest:
+    """Request to get the current state of events."""
+
+    ids: Sequence[UUID]
+    """Identifiers of the events."""
+
+
+@datamodel
+class CurrentResponse:
+    """Response for getting the current state of events."""
+
+    events: Mapping[UUID, hm.Event | None]
+    """Latest event data of events, with pending writes taking precedence."""
+
+
+@datamodel
+class DrainRequest:
+    """Request to drain the outbox."""
+
+    limit: int
+    """Maximum number of pending writes to process."""
+
+
+@datamodel
+class DrainResponse:
+    """Response for draining the outbox."""
+
+    applied: int
+    """Number of pending writes that were applied."""
+
+    failed: int
+    """Number of pending writes that failed and will be retried."""
+
+    parked: int
+    """Number of pending writes that failed and will not be retried."""
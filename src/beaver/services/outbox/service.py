@@ -0,0 +1,226 @@
+import asyncio
+from collections.abc import Generator, Mapping, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Literal
+from uuid import UUID
+
+from beaver.config.models import HowliteOutboxConfig
+from beaver.services.data.howlite import errors as he
+from beaver.services.data.howlite import models as hm
+from beaver.services.data.howlite.service import HowliteService
+from beaver.services.data.sapphire import errors as se
+from beaver.services.data.sapphire import models as sm
+from beaver.services.data.sapphire import types as st
+from beaver.services.data.sapphire.service import SapphireService
+from beaver.services.icalendar.service import ICalendarService
+from beaver.services.outbox import errors as e
+from beaver.services.outbox import models as m
+
+
+class OutboxService:
+    """Service for the outbox of pending writes to howlite."""
+
+    def __init__(
+        self,
+        config: HowliteOutboxConfig,
+        howlite: HowliteService,
+        sapphire: SapphireService,
+    ) -> None:
+        self._config = config
+        self._howlite = howlite
+        self._sapphire = sapphire
+        self._icalendar = ICalendarService()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether writes to howlite go through the outbox."""
+        return self._config.enabled
+
+    @property
+    def concurrency(self) -> int:
+        """Maximum number of concurrent howlite requests when draining."""
+        return self._config.concurrency
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except (he.ServiceError, se.ServiceError) as ex:
+            raise e.ServiceError from ex
+
+    def _serialize(self, event: hm.Event) -> str:
+        calendar = hm.Calendar(events=[event])
+        return self._icalendar.parser.calendar_to_string(calendar)
+
+    def _deserialize(self, entry: sm.OutboxEntry) -> hm.Event:
+        try:
+            calendar = self._icalendar.parser.string_to_calendar(entry.payload or "")
+            return calendar.events[0]
+        except Exception as ex:
+            raise e.PayloadError(entry.id) from ex
+
+    def _group(
+        self, entries: Sequence[sm.OutboxEntry]
+    ) -> Mapping[str, Sequence[sm.OutboxEntry]]:
+        groups: dict[str, list[sm.OutboxEntry]] = {}
+
+        for entry in entries:
+            groups.setdefault(entry.eventId, []).append(entry)
+
+        return groups
+
+    async def _apply(self, entry: sm.OutboxEntry) -> None:
+        if entry.payload is None:
+            request = hm.DeleteEventRequest(id=UUID(entry.eventId), etag=None)
+            await self._howlite.delete_event(request)
+        else:
+            request = hm.PutEventRequest(event=self._deserialize(entry), etag=None)
+            await self._howlite.put_event(request)
+
+    async def _retry(self, entry: sm.OutboxEntry, *, park: bool) -> bool:
+        attempts = self._config.attempts if park else entry.attempts + 1
+        delay = timedelta(seconds=self._config.backoff * 2**entry.attempts)
+
+        where: st.OutboxEntryWhereInput = {
+            "eventId": entry.eventId,
+            "id": {"lte": entry.id},
+        }
+
+        # Earlier entries of the event are retried together with the last one,
+        # but those already parked stay parked
+        if not park:
+            where["attempts"] = {"lt": self._config.attempts}
+
+        await self._sapphire.outboxentry.update_many(
+            data={"attempts": attempts, "nextAttemptAt": datetime.now(UTC) + delay},
+            where=where,
+        )
+
+        return attempts < self._config.attempts
+
+    async def _drain_event(
+        self, semaphore: asyncio.Semaphore, entries: Sequence[sm.OutboxEntry]
+    ) -> Literal["applied", "failed", "parked"]:
+        # Every write replaces the whole event, so only the last one matters
+        entry = entries[-1]
+
+        async with semaphore:
+            try:
+                await self._apply(entry)
+            except e.PayloadError:
+                # Writes that can't be read will never succeed
+                await self._retry(entry, park=True)
+                return "parked"
+            except Exception:
+                return "failed" if await self._retry(entry, park=False) else "parked"
+
+        # Parked entries of the event are superseded by the last one as well
+        await self._sapphire.outboxentry.delete_many(
+            where={"eventId": entry.eventId, "id": {"lte": entry.id}}
+        )
+        return "applied"
+
+    async def push(self, request: m.PushRequest) -> m.PushResponse:
+        """Push writes to the outbox as part of a transaction."""
+        data: list[st.OutboxEntryCreateWithoutRelationsInput] = []
+
+        for write in request.writes:
+            d: st.OutboxEntryCreateWithoutRelationsInput = {
+                "eventId": str(write.id),
+                "operation": "delete",
+            }
+            if write.event is not None:
+                d["operation"] = "upsert"
+                d["payload"] = self._serialize(write.event)
+            data.append(d)
+
+        if data:
+            with self._handle_errors():
+                await request.transaction.outboxentry.create_many(data=data)
+
+        return m.PushResponse()
+
+    async def pending(self, request: m.PendingRequest) -> m.PendingResponse:
+        """Get the latest pending state of events."""
+        if not request.ids:
+            return m.PendingResponse(events={})
+
+        # Parked entries will never be applied, so they don't count as pending
+        with self._handle_errors():
+            entries = await self._sapphire.outboxentry.find_many(
+                where={
+                    "eventId": {"in": [str(event_id) for event_id in request.ids]},
+                    "attempts": {"lt": self._config.attempts},
+                },
+                order={"id": "asc"},
+            )
+
+        return m.PendingResponse(
+            events={
+                UUID(event_id): self._deserialize(group[-1])
+                if group[-1].payload is not None
+                else None
+                for event_id, group in self._group(entries).items()
+            }
+        )
+
+    async def _find(
+        self, semaphore: asyncio.Semaphore, event_id: UUID
+    ) -> hm.Event | None:
+        request = hm.FindEventRequest(id=event_id)
+
+        async with semaphore:
+            response = await self._howlite.find_event(request)
+
+        return response.event
+
+    async def current(self, request: m.CurrentRequest) -> m.CurrentResponse:
+        """Get the current state of events, including pending writes."""
+        events: dict[UUID, hm.Event | None] = {}
+
+        if self.enabled:
+            pending = await self.pending(m.PendingRequest(ids=request.ids))
+            events.update(pending.events)
+
+        # Events without pending writes are already up to date in howlite
+        missing = [event_id for event_id in request.ids if event_id not in events]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        with self._handle_errors():
+            found = await asyncio.gather(
+                *(self._find(semaphore, event_id) for event_id in missing)
+            )
+
+        events.update(zip(missing, found, strict=True))
+
+        return m.CurrentResponse(events=events)
+
+    async def drain(self, request: m.DrainRequest) -> m.DrainResponse:
+        """Apply pending writes to howlite, in order for each event."""
+        # Entries that failed recently or too many times are skipped
+        with self._handle_errors():
+            entries = await self._sapphire.outboxentry.find_many(
+                where={
+                    "attempts": {"lt": self._config.attempts},
+                    "nextAttemptAt": {"lte": datetime.now(UTC)},
+                },
+                take=request.limit,
+                order={"id": "asc"},
+            )
+
+        groups = self._group(entries)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        with self._handle_errors():
+            results = await asyncio.gather(
+                *(self._drain_event(semaphore, group) for group in groups.values())
+            )
+
+        counts = {"applied": 0, "failed": 0, "parked": 0}
+        for group, result in zip(groups.values(), results, strict=True):
+            counts[result] += len(group)
+
+        return m.DrainResponse(
+            applied=counts["applied"], failed=counts["failed"], parked=counts["parked"]
+        )
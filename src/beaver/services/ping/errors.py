@@ -1,2 +1,6 @@
 class ServiceError(Exception):
     """Base class for service errors."""
+
+
+class NotReadyError(ServiceError):
+    """Raised when the service is not ready to handle requests yet."""
@@ -1,9 +1,21 @@
+from beaver.services.ping import errors as e
 from beaver.services.ping import models as m
+from beaver.services.readiness import models as rdm
+from beaver.services.readiness.service import ReadinessService
 
 
 class PingService:
     """Service for pings."""
 
+    def __init__(self, readiness: ReadinessService) -> None:
+        self._readiness = readiness
+
     async def ping(self, request: m.PingRequest) -> m.PingResponse:
         """Ping."""
+        response = await self._readiness.check(rdm.CheckRequest())
+
+        # Pings are answered right away, but only succeed once databases are ready
+        if not response.ready:
+            raise e.NotReadyError
+
         return m.PingResponse()
@@ -0,0 +1,43 @@
+from beaver.models.base import datamodel
+
+
+@datamodel
+class ConnectRequest:
+    """Request to connect to databases."""
+
+
+@datamodel
+class ConnectResponse:
+    """Response for connecting to databases."""
+
+    howlite: bool
+    """Whether howlite database was reached."""
+
+
+@datamodel
+class DisconnectRequest:
+    """Request to disconnect from databases."""
+
+
+@datamodel
+class DisconnectResponse:
+    """Response for disconnecting from databases."""
+
+
+@datamodel
+class CheckRequest:
+    """Request to check if the service is ready."""
+
+
+@datamodel
+class CheckResponse:
+    """Response for checking if the service is ready."""
+
+    ready: bool
+    """Whether all databases are ready to use."""
+
+    howlite: bool
+    """Whether howlite database was reached."""
+
+    sapphire: bool
+    """Whether sapphire database is connected."""
@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from beaver.services.data.howlite import errors as he
+from beaver.services.data.howlite import models as hm
+from beaver.services.data.howlite.service import HowliteService
+from beaver.services.data.sapphire import errors as se
+from beaver.services.data.sapphire.service import SapphireService
+from beaver.services.readiness import errors as e
+from beaver.services.readiness import models as m
+
+
+class ReadinessService:
+    """Service to connect to databases and track whether they are ready."""
+
+    def __init__(self, howlite: HowliteService, sapphire: SapphireService) -> None:
+        self._howlite = howlite
+        self._sapphire = sapphire
+        self._howlite_ready = False
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except (he.ServiceError, se.ServiceError) as ex:
+            raise e.ServiceError from ex
+
+    async def _connect_sapphire(self) -> None:
+        if self._sapphire.is_connected():
+            return
+
+        with self._handle_errors():
+            await self._sapphire.connect()
+
+    async def _connect_howlite(self) -> bool:
+        # Howlite is pinged every time, so readiness follows its current state
+        try:
+            await self._howlite.ping(hm.PingRequest())
+        except he.ServiceError:
+            self._howlite_ready = False
+        else:
+            self._howlite_ready = True
+
+        return self._howlite_ready
+
+    async def connect(self, request: m.ConnectRequest) -> m.ConnectResponse:
+        """Connect to databases that are not ready yet and check howlite."""
+        # Databases are independent, so startup only takes as long as the slowest
+        _, howlite = await asyncio.gather(
+            self._connect_sapphire(), self._connect_howlite()
+        )
+
+        return m.ConnectResponse(howlite=howlite)
+
+    async def disconnect(self, request: m.DisconnectRequest) -> m.DisconnectResponse:
+        """Disconnect from databases."""
+        self._howlite_ready = False
+
+        if self._sapphire.is_connected():
+            with self._handle_errors():
+                await self._sapphire.disconnect()
+
+        return m.DisconnectResponse()
+
+    async def check(self, request: m.CheckRequest) -> m.CheckResponse:
+        """Check which databases are ready."""
+        howlite = self._howlite_ready
+        sapphire = self._sapphire.is_connected()
+
+        return m.CheckResponse(
+            ready=howlite and sapphire, howlite=howlite, sapphire=sapphire
+        )
@@ -0,0 +1,34 @@
+from beaver.models.base import datamodel
+
+
+@datamodel
+class ConnectRequest:
+    """Request to connect to replicas."""
+
+
+@datamodel
+class ConnectResponse:
+    """Response for connecting to replicas."""
+
+
+@datamodel
+class DisconnectRequest:
+    """Request to disconnect from replicas."""
+
+
+@datamodel
+class DisconnectResponse:
+    """Response for disconnecting from replicas."""
+
+
+@datamodel
+class CheckRequest:
+    """Request to check how far behind the primary replicas are."""
+
+
+@datamodel
+class CheckResponse:
+    """Response for checking how far behind the primary replicas are."""
+
+    healthy: int
+    """Number of replicas that are close enough behind to be read from."""
@@ -0,0 +1,119 @@
+import asyncio
+import itertools
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from beaver.config.models import SapphireReplicasConfig, SapphireSQLConfig
+from beaver.services.data.sapphire import errors as se
+from beaver.services.data.sapphire.service import SapphireService
+from beaver.services.replicas import models as m
+
+# Replicas with nothing left to replay are caught up, however old the last write is,
+# but only while they stream from the primary, since otherwise they can't know of it
+LAG_QUERY = """
+SELECT (
+  CASE
+    WHEN NOT EXISTS (
+      SELECT FROM pg_stat_wal_receiver WHERE "status" = 'streaming'
+    ) THEN NULL
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+  END
+)::float AS "lag"
+"""
+
+
+class ReplicasService:
+    """Service to route reads to replicas of the sapphire database."""
+
+    def __init__(
+        self,
+        config: SapphireReplicasConfig,
+        sql: SapphireSQLConfig,
+        primary: SapphireService,
+    ) -> None:
+        self._config = config
+        self._primary = primary
+        self._replicas = [
+            SapphireService(
+                datasource={"url": self._build_url(url, sql)},
+                connect_timeout=sql.engine_timeout,
+            )
+            for url in config.urls
+        ]
+        self._healthy: list[SapphireService] = []
+        self._counter = itertools.count()
+
+    def _build_url(self, url: str, sql: SapphireSQLConfig) -> str:
+        # Replicas are connected to like the primary, unless their URLs say otherwise
+        parts = urlsplit(url)
+        parameters = {**sql.parameters, **dict(parse_qsl(parts.query))}
+        return parts._replace(query=urlencode(parameters)).geturl()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether there are any replicas to read from."""
+        return bool(self._replicas)
+
+    async def _connect(self, replica: SapphireService) -> bool:
+        if replica.is_connected():
+            return True
+
+        try:
+            await replica.connect()
+        except se.ServiceError:
+            return False
+
+        return True
+
+    async def _lag(self, replica: SapphireService) -> float | None:
+        if not await self._connect(replica):
+            return None
+
+        try:
+            rows = await replica.query_raw(LAG_QUERY)
+        except se.ServiceError:
+            return None
+
+        if not rows or rows[0]["lag"] is None:
+            return None
+
+        return float(rows[0]["lag"])
+
+    async def connect(self, request: m.ConnectRequest) -> m.ConnectResponse:
+        """Connect to replicas that are available."""
+        # Unavailable replicas are retried on every check
+        await asyncio.gather(*(self._connect(replica) for replica in self._replicas))
+
+        return m.ConnectResponse()
+
+    async def disconnect(self, request: m.DisconnectRequest) -> m.DisconnectResponse:
+        """Disconnect from all replicas."""
+        self._healthy = []
+
+        for replica in self._replicas:
+            if replica.is_connected():
+                await replica.disconnect()
+
+        return m.DisconnectResponse()
+
+    async def check(self, request: m.CheckRequest) -> m.CheckResponse:
+        """Check how far behind the primary replicas are and pick ones to read from."""
+        lags = await asyncio.gather(*(self._lag(replica) for replica in self._replicas))
+        limit = self._config.lag.total_seconds()
+
+        self._healthy = [
+            replica
+            for replica, lag in zip(self._replicas, lags, strict=True)
+            if lag is not None and lag <= limit
+        ]
+
+        return m.CheckResponse(healthy=len(self._healthy))
+
+    def reader(self) -> SapphireService:
+        """Get a client to read from, falling back to the primary."""
+        healthy = self._healthy
+
+        if not healthy:
+            return self._primary
+
+        return healthy[next(self._counter) % len(healthy)]
@@ -0,0 +1,83 @@
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from datetime import datetime, timedelta
+
+from beaver.models.base import datamodel
+
+
+@datamodel
+class Instance:
+    """Instance of an event on the timeline."""
+
+    event_id: str
+    """Identifier of the event the instance belongs to."""
+
+    start: datetime
+    """Start datetime of the instance in event timezone."""
+
+    duration: timedelta
+    """Duration of the instance."""
+
+
+@datamodel
+class RebuildRequest:
+    """Request to rebuild the timeline from howlite."""
+
+
+@datamodel
+class RebuildResponse:
+    """Response for rebuilding the timeline from howlite."""
+
+    start: datetime
+    """Start datetime in UTC of the time range on the timeline."""
+
+    end: datetime
+    """End datetime in UTC of the time range on the timeline."""
+
+
+@datamodel
+class RefreshRequest:
+    """Request to refresh instances of events after they were written."""
+
+    ids: AbstractSet[str]
+    """Identifiers of the events."""
+
+
+@datamodel
+class RefreshResponse:
+    """Response for refreshing instances of events."""
+
+
+@datamodel
+class RemoveRequest:
+    """Request to remove instances of events after they were deleted."""
+
+    ids: AbstractSet[str]
+    """Identifiers of the events."""
+
+
+@datamodel
+class RemoveResponse:
+    """Response for removing instances of events."""
+
+
+@datamodel
+class NowRequest:
+    """Request to look up instances around a point in time."""
+
+    at: datetime
+    """Datetime in UTC to look up instances at."""
+
+    next: int
+    """Maximum number of instances starting after the datetime to return."""
+
+
+@datamodel
+class NowResponse:
+    """Response for looking up instances around a point in time."""
+
+    current: Sequence[Instance]
+    """Instances that are ongoing at the datetime, in order of start."""
+
+    next: Sequence[Instance]
+    """Instances that start after the datetime, in order of start."""
@@ -0,0 +1,180 @@
+import asyncio
+import bisect
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from beaver.config.models import TimelineConfig
+from beaver.services.data.howlite import errors as he
+from beaver.services.data.howlite import models as hm
+from beaver.services.data.howlite.service import HowliteService
+from beaver.services.icalendar import errors as ie
+from beaver.services.icalendar.service import ICalendarService
+from beaver.services.outbox import errors as oe
+from beaver.services.outbox import models as om
+from beaver.services.outbox.service import OutboxService
+from beaver.services.timeline import errors as e
+from beaver.services.timeline import models as m
+
+type Entry = tuple[datetime, str, datetime, m.Instance]
+
+
+class _Timeline:
+    """Instances sorted by start in UTC, ready for binary searches."""
+
+    __slots__ = ("entries", "longest", "starts")
+
+    def __init__(self, entries: Iterable[Entry]) -> None:
+        self.entries = sorted(entries, key=lambda entry: entry[:2])
+        self.starts = [entry[0] for entry in self.entries]
+        self.longest = max(
+            (end - start for start, _, end, _ in self.entries), default=timedelta(0)
+        )
+
+    def without(self, ids: AbstractSet[str]) -> Iterator[Entry]:
+        return (entry for entry in self.entries if entry[1] not in ids)
+
+    def current(self, at: datetime) -> list[m.Instance]:
+        # Nothing that started earlier than the longest instance can still be ongoing
+        lower = bisect.bisect_left(self.starts, at - self.longest)
+        upper = bisect.bisect_right(self.starts, at)
+
+        return [
+            instance for _, _, end, instance in self.entries[lower:upper] if end > at
+        ]
+
+    def next(self, at: datetime, limit: int) -> list[m.Instance]:
+        lower = bisect.bisect_right(self.starts, at)
+        return [instance for _, _, _, instance in self.entries[lower : lower + limit]]
+
+
+class TimelineService:
+    """Service for the timeline of upcoming instances of events."""
+
+    def __init__(
+        self, config: TimelineConfig, howlite: HowliteService, outbox: OutboxService
+    ) -> None:
+        self._config = config
+        self._howlite = howlite
+        self._outbox = outbox
+        self._icalendar = ICalendarService()
+        self._timeline = _Timeline([])
+        self._range: tuple[datetime, datetime] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether upcoming instances of events are kept in memory."""
+        return self._config.enabled
+
+    @contextmanager
+    def _handle_errors(self) -> Generator[None]:
+        try:
+            yield
+        except (he.ServiceError, ie.ServiceError, oe.ServiceError) as ex:
+            raise e.ServiceError from ex
+
+    def _expand(
+        self, events: Iterable[hm.Event], start: datetime, end: datetime
+    ) -> Iterator[Entry]:
+        for event in events:
+            for instance in self._icalendar.expander.iterate(event, start, end):
+                utcstart = instance.start.replace(tzinfo=event.timezone)
+                utcstart = utcstart.astimezone(UTC)
+
+                yield (
+                    utcstart,
+                    str(event.id),
+                    utcstart + instance.duration,
+                    m.Instance(
+                        event_id=str(event.id),
+                        start=instance.start,
+                        duration=instance.duration,
+                    ),
+                )
+
+    async def _load(self, ids: AbstractSet[str]) -> Mapping[str, hm.Event | None]:
+        request = om.CurrentRequest(ids=[UUID(event_id) for event_id in ids])
+
+        with self._handle_errors():
+            response = await self._outbox.current(request)
+
+        return {str(event_id): event for event_id, event in response.events.items()}
+
+    async def _build(self, start: datetime, end: datetime) -> _Timeline:
+        request = hm.QueryEventsRequest(query=hm.TimeRangeQuery(start=start, end=end))
+
+        with self._handle_errors():
+            response = await self._howlite.query_events(request)
+
+        with self._handle_errors():
+            return _Timeline(self._expand(response.events, start, end))
+
+    async def _lookup(self, at: datetime) -> _Timeline:
+        if (
+            self.enabled
+            and self._range is not None
+            and self._range[0] <= at < self._range[1]
+        ):
+            return self._timeline
+
+        # Outside of the time range on the timeline, instances are expanded on the fly
+        return await self._build(at, at + self._config.future)
+
+    async def rebuild(self, request: m.RebuildRequest) -> m.RebuildResponse:
+        """Rebuild the timeline from howlite, moving its time range forward."""
+        start = datetime.now(UTC)
+        end = start + self._config.future
+
+        async with self._lock:
+            self._timeline = await self._build(start, end)
+            self._range = (start, end)
+
+        return m.RebuildResponse(start=start, end=end)
+
+    async def refresh(self, request: m.RefreshRequest) -> m.RefreshResponse:
+        """Replace instances of events on the timeline after they were written."""
+        if not self.enabled:
+            return m.RefreshResponse()
+
+        async with self._lock:
+            if self._range is None:
+                return m.RefreshResponse()
+
+            start, end = self._range
+
+            try:
+                # Events are read under the lock, so the last refresh sees the last write
+                events = await self._load(request.ids)
+
+                with self._handle_errors():
+                    written = [event for event in events.values() if event is not None]
+                    entries = list(self._expand(written, start, end))
+            except e.ServiceError:
+                # The timeline would miss instances, so stop using it until rebuilt
+                self._range = None
+                raise
+
+            self._timeline = _Timeline(
+                [*self._timeline.without(events.keys()), *entries]
+            )
+
+        return m.RefreshResponse()
+
+    async def remove(self, request: m.RemoveRequest) -> m.RemoveResponse:
+        """Remove instances of events from the timeline after they were deleted."""
+        async with self._lock:
+            self._timeline = _Timeline(self._timeline.without(request.ids))
+
+        return m.RemoveResponse()
+
+    async def now(self, request: m.NowRequest) -> m.NowResponse:
+        """Look up instances that are ongoing at and start after a point in time."""
+        timeline = await self._lookup(request.at)
+
+        return m.NowResponse(
+            current=timeline.current(request.at),
+            next=timeline.next(request.at, request.next),
+        )
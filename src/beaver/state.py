@@ -1,8 +1,19 @@
+from collections.abc import Hashable
+from typing import Any
+
 from litestar.datastructures import State as LitestarState
 
 from beaver.config.models import Config
+from beaver.services.conflicts.service import ConflictsService
 from beaver.services.data.howlite.service import HowliteService
 from beaver.services.data.sapphire.service import SapphireService
+from beaver.services.metrics.service import MetricsService
+from beaver.services.occurrences.service import OccurrencesService
+from beaver.services.outbox.service import OutboxService
+from beaver.services.readiness.service import ReadinessService
+from beaver.services.replicas.service import ReplicasService
+from beaver.services.timeline.service import TimelineService
+from beaver.utils.singleflight import SingleFlight
 
 
 class State(LitestarState):
@@ -11,8 +22,32 @@ class State(LitestarState):
     config: Config
     """Configuration for the service."""
 
+    conflicts: ConflictsService
+    """Service to detect instances of events that overlap each other."""
+
+    flights: SingleFlight[Hashable, Any]
+    """Group for coalescing identical concurrent reads."""
+
     howlite: HowliteService
     """Service for howlite database."""
 
+    metrics: MetricsService
+    """Service to collect metrics in process."""
+
+    occurrences: OccurrencesService
+    """Service for instances of events precomputed in sapphire."""
+
+    outbox: OutboxService
+    """Service for the outbox of pending writes to howlite."""
+
+    readiness: ReadinessService
+    """Service to connect to databases and track whether they are ready."""
+
+    replicas: ReplicasService
+    """Service to route reads to replicas of the sapphire database."""
+
     sapphire: SapphireService
     """Service for sapphire database."""
+
+    timeline: TimelineService
+    """Service for the timeline of upcoming instances of events."""
@@ -0,0 +1,21 @@
+import base64
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+def cursorstringify(data: Any) -> str:
+    """Encode data as an opaque cursor string."""
+    payload = TypeAdapter(Any).dump_json(data)
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def cursorparse[T](value: str, schema: type[T]) -> T:
+    """Decode data from an opaque cursor string.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the schema.
+
+    """
+    payload = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+    return TypeAdapter(schema).validate_json(payload)
@@ -0,0 +1,86 @@
+import bisect
+import itertools
+import math
+from collections.abc import Hashable, Iterator
+from datetime import datetime, timedelta
+
+type _Entry[K, V] = tuple[datetime, int, datetime, K, V]
+
+
+class IntervalIndex[K: Hashable, V]:
+    """Indexes half-open time intervals to find the ones overlapping a range.
+
+    Intervals are grouped by key, so all intervals of a key can be replaced at once.
+    They are kept in buckets of similar length, each sorted by start.
+    An interval can only overlap a range if it starts less than its length
+    before the range, so each bucket is searched with a binary search
+    bounded by its longest possible length and then scanned over the matches.
+    Finding overlapping intervals takes O(log n + k) time for k matches,
+    as long as intervals of similar length don't overlap each other much.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, list[_Entry[K, V]]] = {}
+        self._entries: dict[K, list[tuple[int, _Entry[K, V]]]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._buckets.values())
+
+    def _bucket(self, length: timedelta) -> int:
+        # Lengths in a bucket are shorter than 2 to the power of its number in seconds
+        return int(length.total_seconds()).bit_length()
+
+    def _bound(self, bucket: int) -> timedelta:
+        return timedelta(seconds=2**bucket)
+
+    def add(self, key: K, start: datetime, end: datetime, value: V) -> None:
+        """Add an interval with a value under a key."""
+        bucket = self._bucket(end - start)
+        # The counter keeps entries with the same start from comparing keys or values
+        entry = (start, next(self._counter), end, key, value)
+
+        bisect.insort(self._buckets.setdefault(bucket, []), entry)
+        self._entries.setdefault(key, []).append((bucket, entry))
+
+    def discard(self, key: K) -> None:
+        """Remove all intervals under a key, if there are any."""
+        for bucket, entry in self._entries.pop(key, []):
+            entries = self._buckets[bucket]
+            del entries[bisect.bisect_left(entries, entry)]
+
+            if not entries:
+                del self._buckets[bucket]
+
+    def clear(self) -> None:
+        """Remove all intervals."""
+        self._buckets.clear()
+        self._entries.clear()
+
+    def _overlaps(
+        self, istart: datetime, iend: datetime, start: datetime, end: datetime
+    ) -> bool:
+        # Points at the same instant don't contain each other, but still overlap
+        if istart == iend and start == end:
+            return istart == start
+
+        # One of the intervals has to start within the other,
+        # which also makes empty intervals behave like points
+        return istart <= start < iend or start <= istart < end
+
+    def overlapping(self, start: datetime, end: datetime) -> Iterator[V]:
+        """Find values of intervals that overlap a range.
+
+        Empty intervals and ranges are treated as points,
+        which overlap intervals that contain them and points at the same instant.
+        """
+        for bucket, entries in self._buckets.items():
+            lower = bisect.bisect_left(entries, (start - self._bound(bucket),))
+            # An empty range also overlaps intervals starting right at it
+            upper = bisect.bisect_left(
+                entries, (end, math.inf) if end == start else (end,)
+            )
+
+            for istart, _, iend, _, value in entries[lower:upper]:
+                if self._overlaps(istart, iend, start, end):
+                    yield value
@@ -0,0 +1,78 @@
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from typing import Any, Literal
+
+type Direction = Literal["asc", "desc"]
+
+
+def _equal(field: str, value: Any) -> dict[str, Any]:
+    return {field: value}
+
+
+def _after(
+    field: str,
+    direction: Direction,
+    value: Any,
+    *,
+    nullable: bool,
+    members: Sequence[str] | None,
+) -> dict[str, Any] | None:
+    # Enums can only be compared for equality, so list the members that come after
+    if members is not None:
+        index = members.index(value)
+        following = members[index + 1 :] if direction == "asc" else members[:index]
+        return {field: {"in": list(following)}}
+
+    # Nulls come last in ascending order and first in descending order
+    if direction == "asc":
+        if value is None:
+            return None
+
+        if nullable:
+            return {"OR": [{field: {"gt": value}}, {field: None}]}
+
+        return {field: {"gt": value}}
+
+    if value is None:
+        return {field: {"not": None}}
+
+    return {field: {"lt": value}}
+
+
+def keysetwhere(
+    order: Sequence[tuple[str, Direction]],
+    values: Mapping[str, Any],
+    nullable: AbstractSet[str] = frozenset(),
+    enums: Mapping[str, Sequence[str]] | None = None,
+) -> dict[str, Any]:
+    """Build a filter for rows that come after a position in an order.
+
+    The position is given by the values of all fields in the order,
+    which should end with a unique field to make the order total.
+    Rows after the position are those equal to it on some leading fields
+    and coming after it on the next one.
+
+    Raises:
+        KeyError: If a value of a field in the order is missing.
+        ValueError: If a value of an enum field is not one of its members.
+
+    """
+    enums = enums or {}
+    branches: list[dict[str, Any]] = []
+
+    for index, (field, direction) in enumerate(order):
+        after = _after(
+            field,
+            direction,
+            values[field],
+            nullable=field in nullable,
+            members=enums.get(field),
+        )
+
+        if after is not None:
+            equal = [
+                _equal(previous, values[previous]) for previous, _ in order[:index]
+            ]
+            branches.append({"AND": [*equal, after]})
+
+    return {"OR": branches}
@@ -0,0 +1,62 @@
+import heapq
+from collections.abc import Callable, Iterable, Mapping
+from functools import total_ordering
+from typing import Any
+
+
+@total_ordering
+class _Descending:
+    """Wraps a value to invert its ordering."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+
+class Ordering[T]:
+    """Orders items by a specification compiled into a single composite key.
+
+    The specification is a sequence of mappings from field names to
+    sort directions, where earlier fields take precedence over later ones.
+    Values of each field are computed once per item, using the given getters.
+    """
+
+    def __init__(
+        self,
+        order: Iterable[Mapping[str, object]],
+        fields: Mapping[str, Callable[[T], Any]],
+    ) -> None:
+        self._keys = [
+            (fields[key], direction == "desc")
+            for item in order
+            for key, direction in item.items()
+        ]
+
+    def key(self, item: T) -> tuple[Any, ...]:
+        """Build the composite key of an item."""
+        parts: list[Any] = []
+
+        for getter, descending in self._keys:
+            value = getter(item)
+            # Nulls go last in ascending order and first in descending, like in SQL
+            part = (value is None, value)
+            parts.append(_Descending(part) if descending else part)
+
+        return tuple(parts)
+
+    def sort(self, items: Iterable[T], limit: int | None = None) -> list[T]:
+        """Sort items, keeping only the first ones if there is a limit."""
+        if limit is None:
+            return sorted(items, key=self.key)
+
+        # Only the best items are kept in a heap, instead of sorting all of them
+        return heapq.nsmallest(limit, items, key=self.key)
@@ -0,0 +1,45 @@
+import asyncio
+import json
+from collections.abc import Callable, Coroutine, Hashable
+from functools import partial
+from typing import Any
+
+
+class SingleFlight[K: Hashable, V]:
+    """Coalesces concurrent calls with the same key into a single call.
+
+    While a call for a key is in flight, other callers with the same key
+    wait for its result instead of starting a call of their own.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Task[V]] = {}
+
+    def _release(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def forget(self, key: K) -> None:
+        """Make the next call with the key start anew."""
+        self._calls.pop(key, None)
+
+    def clear(self) -> None:
+        """Make the next calls with any key start anew."""
+        self._calls.clear()
+
+    async def do(self, key: K, function: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        """Run the function or join the in-flight call with the same key."""
+        task = self._calls.get(key)
+
+        if task is None:
+            task = asyncio.create_task(function())
+            task.add_done_callback(partial(self._release, key))
+            self._calls[key] = task
+
+        # Shield the call, so that a cancelled caller does not cancel the others
+        return await asyncio.shield(task)
+
+
+def flightkey(*parts: Any) -> str:
+    """Build a key for a call from its arguments."""
+    return json.dumps(parts, sort_keys=True, default=str)
@@ -0,0 +1,12 @@
+from typing import Any
+from uuid import UUID
+
+
+def isuuid(value: Any) -> bool:
+    """Check if a value is a string with a valid UUID."""
+    try:
+        UUID(value)
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+    return True
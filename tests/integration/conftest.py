@@ -1,4 +1,6 @@
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import LiteralString
 
 import pytest
 import pytest_asyncio
@@ -10,11 +12,53 @@ from prisma import Prisma
 from beaver.api.app import AppBuilder
 from beaver.config.builder import ConfigBuilder
 from beaver.config.models import Config
+from beaver.services.data.sapphire.migrator import SapphireMigrator
 from tests.utils.containers import AsyncDockerContainer
 from tests.utils.waiting.conditions import CallableCondition
 from tests.utils.waiting.strategies import TimeoutStrategy
 from tests.utils.waiting.waiter import Waiter
 
+SEED: list[LiteralString] = [
+    """
+    INSERT INTO "shows" ("id", "title", "description")
+    SELECT
+      md5('show' || i)::uuid,
+      'Show ' || md5('title' || i),
+      CASE WHEN i % 2 = 0 THEN 'Description ' || md5('description' || i) END
+    FROM generate_series(1, 5000) AS i
+    """,
+    """
+    INSERT INTO "events" ("id", "type", "show_id")
+    SELECT
+      md5('event' || i)::uuid,
+      (ARRAY['live', 'replay', 'prerecorded'])[1 + i % 3]::"event_type",
+      md5('show' || (1 + i % 5000))::uuid
+    FROM generate_series(1, 50000) AS i
+    """,
+    """
+    INSERT INTO "outbox" ("event_id", "operation")
+    SELECT md5('event' || (1 + i % 50000))::uuid, 'delete'
+    FROM generate_series(1, 20000) AS i
+    """,
+    """
+    INSERT INTO "occurrences" ("event_id", "local_start", "start_utc", "end_utc")
+    SELECT
+      md5('event' || i)::uuid,
+      '2026-01-01 00:00'::timestamp + i * interval '1 hour',
+      '2026-01-01 00:00+00'::timestamptz + i * interval '1 hour',
+      '2026-01-01 01:00+00'::timestamptz + i * interval '1 hour'
+    FROM generate_series(1, 50000) AS i
+    """,
+    'ANALYZE "shows", "events", "outbox", "occurrences"',
+]
+
+CLEANUP: list[LiteralString] = [
+    'DELETE FROM "occurrences"',
+    'DELETE FROM "outbox"',
+    'DELETE FROM "events"',
+    'DELETE FROM "shows"',
+]
+
 
 @pytest.fixture(scope="session")
 def config() -> Config:
@@ -80,6 +124,26 @@ async def sapphire() -> AsyncGenerator[AsyncDockerContainer]:
         yield container
 
 
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def migrated(config: Config, sapphire: AsyncDockerContainer) -> None:
+    """Apply migrations to sapphire."""
+    await asyncio.to_thread(SapphireMigrator(config).migrate)
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="module")
+async def seeded(config: Config, migrated: None) -> AsyncGenerator[Prisma]:
+    """Fill sapphire with data."""
+    async with Prisma(datasource={"url": config.sapphire.sql.url}) as client:
+        for statement in SEED:
+            await client.execute_raw(statement)
+
+        try:
+            yield client
+        finally:
+            for statement in CLEANUP:
+                await client.execute_raw(statement)
+
+
 @pytest_asyncio.fixture(loop_scope="session", scope="session")
 async def client(
     app: Litestar, howlite: AsyncDockerContainer, sapphire: AsyncDockerContainer
@@ -0,0 +1,489 @@
+import io
+import json
+import re
+import tempfile
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import redirect_stdout, suppress
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from hashlib import md5
+from typing import IO, Any, LiteralString, TextIO, cast
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from prisma import Prisma
+
+from beaver.config.models import Config, SapphireRawConfig
+from beaver.services.conflicts.service import ConflictsService
+from beaver.services.data.howlite.service import HowliteService
+from beaver.services.entities.events import models as em
+from beaver.services.entities.events.service import (
+    EVENTS_BY_IDS_QUERY,
+    EVENTS_BY_SHOW_QUERY,
+    EventsService,
+)
+from beaver.services.entities.shows import models as sm
+from beaver.services.entities.shows.service import (
+    HEADLINE_OPTIONS,
+    SEARCH_QUERY,
+    SHOWS_PAGE_QUERY,
+    ShowsService,
+)
+from beaver.services.icalendar.service import ICalendarService
+from beaver.services.metrics.service import MetricsService
+from beaver.services.occurrences import models as ocm
+from beaver.services.occurrences.service import OccurrencesService
+from beaver.services.outbox import models as om
+from beaver.services.outbox.service import OutboxService
+from beaver.services.replicas.service import ReplicasService
+from beaver.services.timeline.service import TimelineService
+from beaver.utils.singleflight import SingleFlight
+
+# Scanning small tables sequentially is often faster than using an index
+MAX_SEQUENTIAL_ROWS = 1000
+
+
+def _seeded_id(value: str) -> str:
+    # Seed data uses hashes of numbered names as identifiers
+    return str(UUID(md5(value.encode()).hexdigest()))
+
+
+SHOW_ID = _seeded_id("show1")
+EVENT_IDS = [_seeded_id("event1"), _seeded_id("event2")]
+
+# Part of a title that shows are searched by
+SEARCH_TEXT = md5(b"title7").hexdigest()[:8]
+
+type Query = tuple[LiteralString, Sequence[Any]]
+
+# Hand-written queries of services with parameters they are run with
+RAW_QUERIES: Mapping[str, Query] = {
+    "events by ids": (EVENTS_BY_IDS_QUERY, [EVENT_IDS, None, 11, None]),
+    "events of show": (EVENTS_BY_SHOW_QUERY, [SHOW_ID, None, 11, None]),
+    "events of show page": (EVENTS_BY_SHOW_QUERY, [SHOW_ID, EVENT_IDS[0], 11, None]),
+    "shows page": (SHOWS_PAGE_QUERY, [None, 11, None]),
+    "shows page after": (SHOWS_PAGE_QUERY, [SHOW_ID, 11, None]),
+    "show search": (
+        SEARCH_QUERY,
+        [
+            SEARCH_TEXT,
+            f"{SEARCH_TEXT}:*",
+            True,
+            20,
+            HEADLINE_OPTIONS,
+            SEARCH_TEXT,
+            0,
+        ],
+    ),
+}
+
+
+@dataclass
+class _Services:
+    events: EventsService
+    generated: EventsService
+    occurrences: OccurrencesService
+    outbox: OutboxService
+    shows: ShowsService
+    sapphire: Prisma
+
+
+@dataclass
+class _Log:
+    client: Prisma
+    file: IO[bytes]
+
+    async def capture(self, call: Callable[[], Awaitable[object]]) -> list[str]:
+        """Run a call and return the SQL selects sent to sapphire during it."""
+        start = self.file.seek(0, io.SEEK_END)
+        await call()
+        self.file.seek(start)
+
+        return list(_queries(self.file.read().splitlines()))
+
+
+def _literal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+
+    if isinstance(value, int | float):
+        return repr(value)
+
+    if isinstance(value, list):
+        return _literal("{" + ",".join(f'"{item}"' for item in value) + "}")
+
+    # Untyped literals take the type of what they are compared with, like parameters
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _inline(query: str, params: Sequence[Any]) -> str:
+    return re.sub(
+        r"\$(\d+)\b", lambda match: _literal(params[int(match[1]) - 1]), query
+    )
+
+
+def _queries(lines: Sequence[bytes]) -> Iterator[str]:
+    for line in lines:
+        with suppress(ValueError):
+            fields = json.loads(line).get("fields", {})
+
+            if "query" not in fields:
+                continue
+
+            query: str = fields["query"]
+            params = json.loads(fields.get("params") or "[]")
+
+            if not query.lstrip().upper().startswith("SELECT"):
+                continue
+
+            yield _inline(query, params)
+
+
+def _walk(node: Mapping[str, Any]) -> Iterator[Mapping[str, Any]]:
+    yield node
+
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def _scanned(node: Mapping[str, Any]) -> int:
+    rows = node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)
+    return rows * node.get("Actual Loops", 1)
+
+
+async def _sequential_scans(
+    client: Prisma, query: LiteralString, parameters: Sequence[Any] = ()
+) -> list[str]:
+    rows = await client.query_raw(
+        "EXPLAIN (ANALYZE, FORMAT JSON) " + query, *parameters
+    )
+
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return [
+        f"{node['Relation Name']} ({_scanned(node)} rows)"
+        for node in _walk(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan" and _scanned(node) > MAX_SEQUENTIAL_ROWS
+    ]
+
+
+async def _events_of_show(services: _Services) -> None:
+    await services.generated.page(
+        em.PageRequest(
+            limit=10,
+            offset=None,
+            cursor=None,
+            where={"showId": SHOW_ID},
+            query=None,
+            include=None,
+            order=[{"id": "asc"}],
+            schedule=False,
+            count="exact",
+        )
+    )
+
+
+async def _events_by_ids(services: _Services) -> None:
+    await services.generated.list_metadata(
+        em.ListRequest(
+            limit=None,
+            offset=None,
+            cursor=None,
+            where={"id": {"in": EVENT_IDS}},
+            query=None,
+            include=None,
+            order=None,
+        )
+    )
+
+
+async def _events_after(services: _Services, request: em.ListRequest) -> None:
+    response = await services.events.list_metadata(request)
+    await services.events.list_metadata(replace(request, cursor=response.cursor))
+
+
+async def _events_ordered_by_type(services: _Services) -> None:
+    await _events_after(
+        services,
+        em.ListRequest(
+            limit=10,
+            offset=None,
+            cursor=None,
+            where=None,
+            query=None,
+            include=None,
+            order=[{"type": "asc"}, {"id": "asc"}],
+        ),
+    )
+
+
+async def _events_of_type(services: _Services) -> None:
+    await _events_after(
+        services,
+        em.ListRequest(
+            limit=10,
+            offset=None,
+            cursor=None,
+            where={"type": em.EventType.live},
+            query=None,
+            include=None,
+            order=[{"id": "asc"}],
+        ),
+    )
+
+
+async def _events_estimated(services: _Services) -> None:
+    # A full page after an offset can't be counted from, so the count is estimated
+    await services.generated.page(
+        em.PageRequest(
+            limit=10,
+            offset=10,
+            cursor=None,
+            where=None,
+            query=None,
+            include=None,
+            order=[{"type": "asc"}],
+            schedule=False,
+            count="estimated",
+        )
+    )
+
+
+async def _shows_ordered_by_title(services: _Services) -> None:
+    request = sm.ListRequest(
+        limit=10,
+        offset=None,
+        cursor=None,
+        where=None,
+        include=None,
+        order=[{"title": "asc"}],
+        schedule=False,
+    )
+    response = await services.shows.list(request)
+    await services.shows.list(replace(request, cursor=response.cursor))
+
+
+async def _shows_page(services: _Services) -> None:
+    # A full page after an offset can't be counted from, so the count is estimated
+    await services.shows.page(
+        sm.PageRequest(
+            limit=10,
+            offset=10,
+            cursor=None,
+            where=None,
+            include=None,
+            order=[{"title": "asc"}],
+            schedule=False,
+            count="estimated",
+        )
+    )
+
+
+async def _show_by_title(services: _Services) -> None:
+    await services.shows.get(
+        sm.GetRequest(
+            where={"title": "Show " + md5(b"title1").hexdigest()},
+            include=None,
+            schedule=False,
+        )
+    )
+
+
+async def _shows_containing(services: _Services) -> None:
+    for where in (
+        {"title": {"contains": SEARCH_TEXT, "mode": "insensitive"}},
+        {"description": {"contains": md5(b"description8").hexdigest()[:8]}},
+    ):
+        await services.shows.list(
+            sm.ListRequest(
+                limit=10,
+                offset=None,
+                cursor=None,
+                where=cast("sm.ShowWhereInput", where),
+                include=None,
+                order=None,
+                schedule=False,
+            )
+        )
+
+
+async def _show_search(services: _Services) -> None:
+    for where in (None, {"description": {"not": None}}):
+        await services.shows.search(
+            sm.SearchRequest(
+                text=SEARCH_TEXT,
+                limit=20,
+                where=cast("sm.ShowWhereInput | None", where),
+                include=None,
+                schedule=False,
+                highlight=True,
+            )
+        )
+
+
+async def _occurrences_in_range(services: _Services) -> None:
+    request = ocm.ListRequest(
+        start=datetime(2026, 1, 2, tzinfo=UTC),
+        end=datetime(2026, 1, 9, tzinfo=UTC),
+        where=None,
+        order=[("start", "asc"), ("event_id", "asc")],
+        after=None,
+        limit=11,
+    )
+    response = await services.occurrences.list(request)
+    last = response.occurrences[-1]
+    await services.occurrences.list(
+        replace(request, after={"start": last.start, "event_id": last.event_id})
+    )
+
+
+async def _pending_outbox_entries(services: _Services) -> None:
+    await services.outbox.pending(
+        om.PendingRequest(ids=[UUID(event_id) for event_id in EVENT_IDS])
+    )
+
+
+async def _outbox_entries(services: _Services) -> None:
+    # Draining also writes to howlite, so its filters are sent directly
+    await services.sapphire.outboxentry.find_many(
+        where={"attempts": {"lt": 10}, "nextAttemptAt": {"lte": datetime.now(UTC)}},
+        order={"id": "asc"},
+        take=100,
+    )
+    await services.sapphire.outboxentry.find_many(
+        where={"eventId": EVENT_IDS[0], "id": {"lte": 10000}, "attempts": {"lt": 10}}
+    )
+
+
+# Calls to services that send queries through the generated client
+CALLS: Mapping[str, Callable[[_Services], Awaitable[None]]] = {
+    "events of show": _events_of_show,
+    "events by ids": _events_by_ids,
+    "events ordered by type": _events_ordered_by_type,
+    "events of type": _events_of_type,
+    "events with estimated count": _events_estimated,
+    "shows ordered by title": _shows_ordered_by_title,
+    "shows with estimated count": _shows_page,
+    "show by title": _show_by_title,
+    "shows containing text": _shows_containing,
+    "show search": _show_search,
+    "occurrences in range": _occurrences_in_range,
+    "pending outbox entries": _pending_outbox_entries,
+    "outbox entries": _outbox_entries,
+}
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="module")
+async def log(config: Config, seeded: Prisma) -> AsyncGenerator[_Log]:
+    """Connect to sapphire with a client that logs queries it sends."""
+    with tempfile.TemporaryFile() as file:
+        client = Prisma(datasource={"url": config.sapphire.sql.url}, log_queries=True)
+
+        # The query engine writes logs to the standard output it was started with
+        with redirect_stdout(cast("TextIO", file)):
+            await client.connect()
+
+        try:
+            yield _Log(client=client, file=file)
+        finally:
+            await client.disconnect()
+
+
+@pytest.fixture(scope="module")
+def services(config: Config, log: _Log) -> _Services:
+    """Build services that send queries through the logging client."""
+    client = log.client
+    howlite = HowliteService(config=config.howlite)
+    outbox = OutboxService(
+        config=config.howlite.outbox, howlite=howlite, sapphire=client
+    )
+    conflicts = ConflictsService(
+        config=config.conflicts, howlite=howlite, outbox=outbox
+    )
+    occurrences = OccurrencesService(
+        config=config.sapphire.occurrences,
+        howlite=howlite,
+        outbox=outbox,
+        sapphire=client,
+    )
+    replicas = ReplicasService(
+        config=config.sapphire.replicas, sql=config.sapphire.sql, primary=client
+    )
+    timeline = TimelineService(config=config.timeline, howlite=howlite, outbox=outbox)
+
+    def _events(raw: SapphireRawConfig) -> EventsService:
+        return EventsService(
+            config=config.events,
+            conflicts=conflicts,
+            flights=SingleFlight(),
+            howlite=howlite,
+            icalendar=ICalendarService(),
+            metrics=MetricsService(sapphire=client),
+            occurrences=occurrences,
+            outbox=outbox,
+            raw=raw,
+            replicas=replicas,
+            sapphire=client,
+            timeline=timeline,
+        )
+
+    return _Services(
+        events=_events(config.sapphire.raw),
+        generated=_events(SapphireRawConfig(events_by_ids=False, events_by_show=False)),
+        occurrences=occurrences,
+        outbox=outbox,
+        shows=ShowsService(
+            config=config.sapphire.raw,
+            conflicts=conflicts,
+            flights=SingleFlight(),
+            howlite=howlite,
+            metrics=MetricsService(sapphire=client),
+            occurrences=occurrences,
+            outbox=outbox,
+            replicas=replicas,
+            sapphire=client,
+            timeline=timeline,
+        ),
+        sapphire=client,
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("query", RAW_QUERIES.values(), ids=RAW_QUERIES.keys())
+async def test_raw_queries_avoid_large_sequential_scans(
+    seeded: Prisma, query: Query
+) -> None:
+    """Test if hand-written queries don't scan large tables sequentially."""
+    scans = await _sequential_scans(seeded, *query)
+
+    assert not scans, f"Sequential scans: {', '.join(scans)}"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("call", CALLS.values(), ids=CALLS.keys())
+async def test_generated_queries_avoid_large_sequential_scans(
+    seeded: Prisma,
+    log: _Log,
+    services: _Services,
+    call: Callable[[_Services], Awaitable[None]],
+) -> None:
+    """Test if queries sent by services don't scan large tables sequentially."""
+    queries = await log.capture(lambda: call(services))
+    assert queries
+
+    for query in queries:
+        scans = await _sequential_scans(seeded, cast("LiteralString", query))
+        assert not scans, f"Sequential scans: {', '.join(scans)}\n{query}"
@@ -0,0 +1,131 @@
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+import pytest
+from prisma import Prisma
+
+from beaver.services.entities.events.service import (
+    EVENTS_BY_IDS_QUERY,
+    EVENTS_BY_SHOW_QUERY,
+)
+from beaver.services.entities.shows.service import SHOWS_PAGE_QUERY
+
+# Number of times each query is run to compare how long it takes
+ROUNDS = 100
+
+type Rows = Sequence[tuple[Any, ...]]
+
+type Query = Callable[[Prisma], Awaitable[Rows]]
+
+type Case = tuple[Query, Query]
+
+
+async def _events_by_ids(client: Prisma) -> Case:
+    # Identifiers are hashes, so ordering by type scatters them
+    events = await client.event.find_many(take=100, order=[{"type": "asc"}])
+    ids = [event.id for event in events]
+    cursor = sorted(ids)[10]
+
+    async def _raw(client: Prisma) -> Rows:
+        rows = await client.query_raw(EVENTS_BY_IDS_QUERY, ids, cursor, 20, None)
+        return [(row["id"], row["type"], row["show_id"]) for row in rows]
+
+    async def _generated(client: Prisma) -> Rows:
+        events = await client.event.find_many(
+            where={"AND": [{"id": {"in": ids}}, {"id": {"gt": cursor}}]},
+            take=20,
+            order=[{"id": "asc"}],
+        )
+        return [(event.id, event.type.value, event.showId) for event in events]
+
+    return _raw, _generated
+
+
+async def _events_by_show(client: Prisma) -> Case:
+    show_id = (await client.event.find_first_or_raise()).showId
+
+    async def _raw(client: Prisma) -> Rows:
+        rows = await client.query_raw(EVENTS_BY_SHOW_QUERY, show_id, None, 51, None)
+        return [(row["id"], row["type"], row["show_id"]) for row in rows]
+
+    async def _generated(client: Prisma) -> Rows:
+        events = await client.event.find_many(
+            where={"showId": show_id}, take=51, order=[{"id": "asc"}]
+        )
+        return [(event.id, event.type.value, event.showId) for event in events]
+
+    return _raw, _generated
+
+
+async def _shows_page(client: Prisma) -> Case:
+    shows = await client.show.find_many(take=100, order=[{"id": "asc"}])
+    cursor = shows[50].id
+
+    async def _raw(client: Prisma) -> Rows:
+        rows = await client.query_raw(SHOWS_PAGE_QUERY, cursor, 51, None)
+        return [(row["id"], row["title"], row["description"]) for row in rows]
+
+    async def _generated(client: Prisma) -> Rows:
+        shows = await client.show.find_many(
+            where={"id": {"gt": cursor}}, take=51, order=[{"id": "asc"}]
+        )
+        return [(show.id, show.title, show.description) for show in shows]
+
+    return _raw, _generated
+
+
+CASES: Mapping[str, Callable[[Prisma], Awaitable[Case]]] = {
+    "events by ids": _events_by_ids,
+    "events by show": _events_by_show,
+    "shows page": _shows_page,
+}
+
+
+async def _measure(client: Prisma, query: Query) -> float:
+    start = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        await query(client)
+
+    return (time.perf_counter() - start) / ROUNDS
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("case", CASES.values(), ids=CASES.keys())
+async def test_raw_matches_generated(
+    seeded: Prisma,
+    case: Callable[[Prisma], Awaitable[Case]],
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Test if hand-written queries return the same rows as the generated client."""
+    raw, generated = await case(seeded)
+
+    rows = await raw(seeded)
+    assert rows
+    assert rows == await generated(seeded)
+
+    # Timings are recorded in the report to compare both ways, but not asserted
+    record_property("raw", await _measure(seeded, raw))
+    record_property("generated", await _measure(seeded, generated))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_raw_counts_matching_rows(seeded: Prisma) -> None:
+    """Test if hand-written queries count all matching rows, not only the page."""
+    show_id = (await seeded.event.find_first_or_raise()).showId
+    cursor = (
+        await seeded.event.find_first_or_raise(
+            where={"showId": show_id}, order=[{"id": "asc"}]
+        )
+    ).id
+
+    rows = await seeded.query_raw(EVENTS_BY_SHOW_QUERY, show_id, cursor, 5, None)
+    assert rows
+    assert {row["count"] for row in rows} == {
+        await seeded.event.count(where={"showId": show_id})
+    }
+
+    rows = await seeded.query_raw(SHOWS_PAGE_QUERY, None, 5, 10)
+    assert rows
+    assert {row["count"] for row in rows} == {await seeded.show.count()}
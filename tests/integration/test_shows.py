@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+import pytest
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_404_NOT_FOUND
+from litestar.testing import AsyncTestClient
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("migrated")
+async def test_patch(client: AsyncTestClient) -> None:
+    """Test if PATCH /shows/{id} updates the show."""
+    response = await client.post("/shows", json={"title": "Show"})
+    assert response.status_code == HTTP_201_CREATED
+    show_id = response.json()["id"]
+
+    try:
+        response = await client.patch(
+            f"/shows/{show_id}", json={"description": "Description"}
+        )
+
+        status = response.status_code
+        assert status == HTTP_200_OK
+
+        show = response.json()
+        assert show["id"] == show_id
+        assert show["title"] == "Show"
+        assert show["description"] == "Description"
+    finally:
+        await client.delete(f"/shows/{show_id}")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("migrated")
+async def test_patch_id(client: AsyncTestClient) -> None:
+    """Test if PATCH /shows/{id} moves events of the show to its new ID."""
+    response = await client.post("/shows", json={"title": "Show"})
+    assert response.status_code == HTTP_201_CREATED
+    old_id = response.json()["id"]
+    new_id = str(uuid4())
+
+    response = await client.post(
+        "/events",
+        json={
+            "type": "live",
+            "showId": old_id,
+            "start": "2000-01-01T12:00:00",
+            "duration": "PT1H",
+            "timezone": "UTC",
+        },
+    )
+    assert response.status_code == HTTP_201_CREATED
+    event_id = response.json()["id"]
+
+    try:
+        response = await client.patch(
+            f"/shows/{old_id}", json={"id": new_id, "title": "Renamed"}
+        )
+
+        status = response.status_code
+        assert status == HTTP_200_OK
+
+        show = response.json()
+        assert show["id"] == new_id
+        assert show["title"] == "Renamed"
+
+        response = await client.get(f"/shows/{old_id}")
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+        response = await client.get(f"/events/{event_id}")
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["showId"] == new_id
+    finally:
+        await client.delete(f"/shows/{new_id}")
+        await client.delete(f"/shows/{old_id}")
@@ -0,0 +1,114 @@
+from datetime import UTC, datetime, timedelta
+
+from beaver.utils.intervals import IntervalIndex
+
+START = datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+
+def _at(minutes: int) -> datetime:
+    return START + timedelta(minutes=minutes)
+
+
+def _build(*intervals: tuple[str, int, int]) -> IntervalIndex[str, str]:
+    index: IntervalIndex[str, str] = IntervalIndex()
+
+    for key, start, end in intervals:
+        index.add(key, _at(start), _at(end), f"{key}:{start}")
+
+    return index
+
+
+def test_overlapping_intervals() -> None:
+    """Test if only intervals that overlap a range are found."""
+    index = _build(("a", 0, 10), ("b", 5, 15), ("c", 20, 30))
+
+    assert sorted(index.overlapping(_at(8), _at(12))) == ["a:0", "b:5"]
+
+
+def test_touching_intervals_do_not_overlap() -> None:
+    """Test if intervals ending or starting at the range bounds are not found."""
+    index = _build(("a", 0, 10), ("b", 20, 30))
+
+    assert list(index.overlapping(_at(10), _at(20))) == []
+
+
+def test_long_interval_overlaps_short_range() -> None:
+    """Test if an interval starting long before a range is still found."""
+    index = _build(("a", 0, 24 * 60), ("b", 30, 31))
+
+    assert sorted(index.overlapping(_at(600), _at(601))) == ["a:0"]
+
+
+def test_zero_length_interval() -> None:
+    """Test if an empty interval is found by ranges that contain its point."""
+    index = _build(("a", 10, 10))
+
+    assert list(index.overlapping(_at(5), _at(15))) == ["a:10"]
+    assert list(index.overlapping(_at(10), _at(15))) == ["a:10"]
+    assert list(index.overlapping(_at(5), _at(10))) == []
+
+
+def test_zero_length_range() -> None:
+    """Test if an empty range finds intervals around its point, except at their end."""
+    index = _build(("a", 0, 10), ("b", 10, 20))
+
+    assert list(index.overlapping(_at(5), _at(5))) == ["a:0"]
+    assert list(index.overlapping(_at(10), _at(10))) == ["b:10"]
+
+
+def test_zero_length_interval_and_range() -> None:
+    """Test if an empty range finds empty intervals only at the same instant."""
+    index = _build(("a", 10, 10), ("b", 11, 11))
+
+    assert list(index.overlapping(_at(10), _at(10))) == ["a:10"]
+    assert list(index.overlapping(_at(12), _at(12))) == []
+
+
+def test_equal_starts() -> None:
+    """Test if intervals with equal starts are all kept and found."""
+    index = _build(("a", 0, 10), ("b", 0, 10), ("c", 0, 1))
+
+    assert len(index) == 3  # noqa: PLR2004
+    assert sorted(index.overlapping(_at(0), _at(1))) == ["a:0", "b:0", "c:0"]
+    assert sorted(index.overlapping(_at(5), _at(6))) == ["a:0", "b:0"]
+
+
+def test_discard_with_equal_starts() -> None:
+    """Test if discarding a key keeps intervals of other keys with the same start."""
+    index = _build(("a", 0, 10), ("b", 0, 10), ("a", 20, 30))
+
+    index.discard("a")
+
+    assert len(index) == 1
+    assert list(index.overlapping(_at(0), _at(30))) == ["b:0"]
+
+
+def test_discard_zero_length_interval() -> None:
+    """Test if an empty interval can be discarded."""
+    index = _build(("a", 10, 10), ("b", 10, 10))
+
+    index.discard("a")
+
+    assert list(index.overlapping(_at(5), _at(15))) == ["b:10"]
+
+
+def test_discard_missing_key() -> None:
+    """Test if discarding a key without intervals does nothing."""
+    index = _build(("a", 0, 10))
+
+    index.discard("b")
+    index.discard("a")
+    index.discard("a")
+
+    assert len(index) == 0
+    assert list(index.overlapping(_at(0), _at(10))) == []
+
+
+def test_add_after_discard() -> None:
+    """Test if a key can be added again after it was discarded."""
+    index = _build(("a", 0, 10))
+
+    index.discard("a")
+    index.add("a", _at(20), _at(30), "a:20")
+
+    assert list(index.overlapping(_at(0), _at(30))) == ["a:20"]
@@ -0,0 +1,95 @@
+import pytest
+
+from beaver.utils.keyset import keysetwhere
+
+
+def test_single_field() -> None:
+    """Test if a single field continues after its value."""
+    where = keysetwhere([("id", "asc")], {"id": "b"})
+
+    assert where == {"OR": [{"AND": [{"id": {"gt": "b"}}]}]}
+
+
+def test_descending_field() -> None:
+    """Test if a descending field continues before its value."""
+    where = keysetwhere([("id", "desc")], {"id": "b"})
+
+    assert where == {"OR": [{"AND": [{"id": {"lt": "b"}}]}]}
+
+
+def test_leading_fields_are_equal() -> None:
+    """Test if later fields only apply when earlier fields are equal."""
+    where = keysetwhere([("title", "asc"), ("id", "asc")], {"title": "t", "id": "b"})
+
+    assert where == {
+        "OR": [
+            {"AND": [{"title": {"gt": "t"}}]},
+            {"AND": [{"title": "t"}, {"id": {"gt": "b"}}]},
+        ]
+    }
+
+
+def test_nullable_ascending_includes_nulls() -> None:
+    """Test if nulls come after values in ascending order."""
+    where = keysetwhere(
+        [("description", "asc"), ("id", "asc")],
+        {"description": "d", "id": "b"},
+        nullable={"description"},
+    )
+
+    assert where["OR"][0] == {
+        "AND": [{"OR": [{"description": {"gt": "d"}}, {"description": None}]}]
+    }
+
+
+def test_null_ascending_continues_among_nulls() -> None:
+    """Test if a null in ascending order only continues among other nulls."""
+    where = keysetwhere(
+        [("description", "asc"), ("id", "asc")],
+        {"description": None, "id": "b"},
+        nullable={"description"},
+    )
+
+    assert where == {"OR": [{"AND": [{"description": None}, {"id": {"gt": "b"}}]}]}
+
+
+def test_null_descending_continues_with_values() -> None:
+    """Test if a null in descending order continues with all values."""
+    where = keysetwhere(
+        [("description", "desc"), ("id", "asc")],
+        {"description": None, "id": "b"},
+        nullable={"description"},
+    )
+
+    assert where["OR"][0] == {"AND": [{"description": {"not": None}}]}
+
+
+def test_enum_lists_following_members() -> None:
+    """Test if enums continue with members declared after the value."""
+    members = ["live", "replay", "prerecorded"]
+
+    ascending = keysetwhere(
+        [("type", "asc"), ("id", "asc")],
+        {"type": "replay", "id": "b"},
+        enums={"type": members},
+    )
+    descending = keysetwhere(
+        [("type", "desc"), ("id", "asc")],
+        {"type": "replay", "id": "b"},
+        enums={"type": members},
+    )
+
+    assert ascending["OR"][0] == {"AND": [{"type": {"in": ["prerecorded"]}}]}
+    assert descending["OR"][0] == {"AND": [{"type": {"in": ["live"]}}]}
+
+
+def test_missing_value_raises() -> None:
+    """Test if a position without a value of a field in the order is rejected."""
+    with pytest.raises(KeyError):
+        keysetwhere([("title", "asc"), ("id", "asc")], {"id": "b"})
+
+
+def test_unknown_enum_member_raises() -> None:
+    """Test if a position with an unknown enum member is rejected."""
+    with pytest.raises(ValueError, match="unknown"):
+        keysetwhere([("type", "asc")], {"type": "unknown"}, enums={"type": ["live"]})
@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+
+from beaver.utils.ordering import Ordering
+
+
+@dataclass
+class _Item:
+    id: int
+    name: str | None
+
+
+FIELDS = {"id": lambda item: item.id, "name": lambda item: item.name}
+
+
+def _ids(items: list[_Item]) -> list[int]:
+    return [item.id for item in items]
+
+
+def test_ascending() -> None:
+    """Test if items are sorted in ascending order."""
+    ordering = Ordering([{"name": "asc"}], FIELDS)
+    items = [_Item(1, "b"), _Item(2, "c"), _Item(3, "a")]
+
+    assert _ids(ordering.sort(items)) == [3, 1, 2]
+
+
+def test_descending() -> None:
+    """Test if items are sorted in descending order."""
+    ordering = Ordering([{"name": "desc"}], FIELDS)
+    items = [_Item(1, "b"), _Item(2, "c"), _Item(3, "a")]
+
+    assert _ids(ordering.sort(items)) == [2, 1, 3]
+
+
+def test_later_fields_break_ties() -> None:
+    """Test if later fields only order items that are equal on earlier fields."""
+    ordering = Ordering([{"name": "asc"}, {"id": "desc"}], FIELDS)
+    items = [_Item(1, "a"), _Item(2, "b"), _Item(3, "a")]
+
+    assert _ids(ordering.sort(items)) == [3, 1, 2]
+
+
+def test_mixed_directions() -> None:
+    """Test if each field is sorted in its own direction."""
+    ordering = Ordering([{"name": "desc"}, {"id": "asc"}], FIELDS)
+    items = [_Item(3, "a"), _Item(2, "b"), _Item(1, "a")]
+
+    assert _ids(ordering.sort(items)) == [2, 1, 3]
+
+
+def test_nulls_last_in_ascending_order() -> None:
+    """Test if missing values come last in ascending order."""
+    ordering = Ordering([{"name": "asc"}], FIELDS)
+    items = [_Item(1, None), _Item(2, "b"), _Item(3, "a")]
+
+    assert _ids(ordering.sort(items)) == [3, 2, 1]
+
+
+def test_nulls_first_in_descending_order() -> None:
+    """Test if missing values come first in descending order."""
+    ordering = Ordering([{"name": "desc"}], FIELDS)
+    items = [_Item(1, "a"), _Item(2, None), _Item(3, "b")]
+
+    assert _ids(ordering.sort(items)) == [2, 3, 1]
+
+
+def test_descending_keys_compare_equal() -> None:
+    """Test if keys of equal items are equal, even in descending order."""
+    ordering = Ordering([{"name": "desc"}], FIELDS)
+
+    assert ordering.key(_Item(1, "a")) == ordering.key(_Item(2, "a"))
+    assert ordering.key(_Item(1, "b")) < ordering.key(_Item(2, "a"))
+    assert ordering.key(_Item(1, "a")) > ordering.key(_Item(2, "b"))
+
+
+def test_limit_keeps_first_items() -> None:
+    """Test if only the first items are kept when there is a limit."""
+    ordering = Ordering([{"id": "desc"}], FIELDS)
+    items = [_Item(index, None) for index in range(10)]
+
+    assert _ids(ordering.sort(items, 3)) == [9, 8, 7]
+
+
+def test_limit_larger_than_items() -> None:
+    """Test if all items are kept when the limit is larger than their number."""
+    ordering = Ordering([{"id": "asc"}], FIELDS)
+    items = [_Item(2, None), _Item(1, None)]
+
+    assert _ids(ordering.sort(items, 5)) == [1, 2]
@@ -0,0 +1,239 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, cast
+from uuid import UUID, uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from beaver.config.models import HowliteOutboxConfig
+from beaver.services.data.howlite import models as hm
+from beaver.services.icalendar.service import ICalendarService
+from beaver.services.outbox import models as m
+from beaver.services.outbox.service import OutboxService
+
+# Number of attempts after which writes are parked in tests
+ATTEMPTS = 3
+
+
+@dataclass
+class _Entry:
+    id: int
+    eventId: str  # noqa: N815
+    payload: str | None
+    attempts: int = 0
+
+
+@dataclass
+class _Table:
+    entries: list[_Entry]
+    finds: list[dict[str, Any]] = field(default_factory=list)
+    updates: list[dict[str, Any]] = field(default_factory=list)
+    deletes: list[dict[str, Any]] = field(default_factory=list)
+
+    async def find_many(self, **kwargs: Any) -> list[_Entry]:
+        self.finds.append(kwargs)
+        return self.entries
+
+    async def update_many(self, **kwargs: Any) -> int:
+        self.updates.append(kwargs)
+        return 0
+
+    async def delete_many(self, **kwargs: Any) -> int:
+        self.deletes.append(kwargs)
+        return 0
+
+
+@dataclass
+class _Sapphire:
+    outboxentry: _Table
+
+
+@dataclass
+class _Howlite:
+    failing: set[UUID] = field(default_factory=set)
+    puts: list[hm.Event] = field(default_factory=list)
+    deletes: list[UUID] = field(default_factory=list)
+
+    async def put_event(self, request: hm.PutEventRequest) -> hm.PutEventResponse:
+        if request.event.id in self.failing:
+            raise RuntimeError
+
+        self.puts.append(request.event)
+        return hm.PutEventResponse(etag=None)
+
+    async def find_event(self, request: hm.FindEventRequest) -> hm.FindEventResponse:
+        events = {event.id: event for event in self.puts}
+        return hm.FindEventResponse(event=events.get(request.id), etag=None)
+
+    async def delete_event(
+        self, request: hm.DeleteEventRequest
+    ) -> hm.DeleteEventResponse:
+        if request.id in self.failing:
+            raise RuntimeError
+
+        self.deletes.append(request.id)
+        return hm.DeleteEventResponse()
+
+
+def _build(
+    entries: list[_Entry], howlite: _Howlite | None = None
+) -> tuple[OutboxService, _Table, _Howlite]:
+    table = _Table(entries=entries)
+    howlite = howlite or _Howlite()
+    service = OutboxService(
+        config=HowliteOutboxConfig(attempts=ATTEMPTS, backoff=1.0),
+        howlite=cast("Any", howlite),
+        sapphire=cast("Any", _Sapphire(outboxentry=table)),
+    )
+    return service, table, howlite
+
+
+def _event(event_id: UUID, hour: int) -> hm.Event:
+    return hm.Event(
+        id=event_id,
+        start=datetime(2026, 1, 1, hour),
+        duration=timedelta(hours=1),
+        timezone=ZoneInfo("Europe/Warsaw"),
+    )
+
+
+def _payload(event_id: UUID, hour: int) -> str:
+    calendar = hm.Calendar(events=[_event(event_id, hour)])
+    return ICalendarService().parser.calendar_to_string(calendar)
+
+
+@pytest.mark.asyncio
+async def test_drain_applies_last_write_of_each_event() -> None:
+    """Test if only the last pending write of each event is applied."""
+    first, second = uuid4(), uuid4()
+    service, table, howlite = _build(
+        [
+            _Entry(id=1, eventId=str(first), payload=_payload(first, 10)),
+            _Entry(id=2, eventId=str(second), payload=_payload(second, 10)),
+            _Entry(id=3, eventId=str(first), payload=_payload(first, 12)),
+            _Entry(id=4, eventId=str(second), payload=None),
+        ]
+    )
+
+    response = await service.drain(m.DrainRequest(limit=10))
+
+    assert response == m.DrainResponse(applied=4, failed=0, parked=0)
+    assert [event.start.hour for event in howlite.puts] == [12]
+    assert howlite.deletes == [second]
+    assert table.updates == []
+    assert {
+        (delete["where"]["eventId"], delete["where"]["id"]["lte"])
+        for delete in table.deletes
+    } == {(str(first), 3), (str(second), 4)}
+
+
+@pytest.mark.asyncio
+async def test_drain_skips_backed_off_and_parked_entries() -> None:
+    """Test if draining only reads entries that are due and not parked."""
+    service, table, _ = _build([])
+
+    response = await service.drain(m.DrainRequest(limit=10))
+
+    assert response == m.DrainResponse(applied=0, failed=0, parked=0)
+    where = table.finds[0]["where"]
+    assert where["attempts"] == {"lt": ATTEMPTS}
+    assert "lte" in where["nextAttemptAt"]
+
+
+@pytest.mark.asyncio
+async def test_drain_backs_off_failed_writes() -> None:
+    """Test if a failed write is retried later without blocking other events."""
+    failing, other = uuid4(), uuid4()
+    service, table, howlite = _build(
+        [
+            _Entry(id=1, eventId=str(failing), payload=None),
+            _Entry(id=2, eventId=str(failing), payload=None),
+            _Entry(id=3, eventId=str(other), payload=None),
+        ],
+        _Howlite(failing={failing}),
+    )
+
+    before = datetime.now().astimezone()
+    response = await service.drain(m.DrainRequest(limit=10))
+
+    assert response == m.DrainResponse(applied=1, failed=2, parked=0)
+    assert howlite.deletes == [other]
+    [update] = table.updates
+    assert update["where"] == {
+        "eventId": str(failing),
+        "id": {"lte": 2},
+        "attempts": {"lt": ATTEMPTS},
+    }
+    assert update["data"]["attempts"] == 1
+    assert update["data"]["nextAttemptAt"] >= before + timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_drain_parks_writes_out_of_attempts() -> None:
+    """Test if a write that failed too many times is parked."""
+    failing = uuid4()
+    service, table, _ = _build(
+        [_Entry(id=1, eventId=str(failing), payload=None, attempts=ATTEMPTS - 1)],
+        _Howlite(failing={failing}),
+    )
+
+    response = await service.drain(m.DrainRequest(limit=10))
+
+    assert response == m.DrainResponse(applied=0, failed=0, parked=1)
+    assert table.updates[0]["data"]["attempts"] == ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_drain_parks_invalid_payloads() -> None:
+    """Test if a write that can't be read is parked instead of stopping draining."""
+    broken, other = uuid4(), uuid4()
+    service, table, howlite = _build(
+        [
+            _Entry(id=1, eventId=str(broken), payload="not a calendar"),
+            _Entry(id=2, eventId=str(other), payload=None),
+        ]
+    )
+
+    response = await service.drain(m.DrainRequest(limit=10))
+
+    assert response == m.DrainResponse(applied=1, failed=0, parked=1)
+    assert howlite.deletes == [other]
+    assert table.updates[0]["data"]["attempts"] == ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_current_prefers_pending_writes() -> None:
+    """Test if pending writes take precedence over events in howlite."""
+    pending, stored, missing = uuid4(), uuid4(), uuid4()
+    howlite = _Howlite()
+    howlite.puts.append(_event(pending, 10))
+    howlite.puts.append(_event(stored, 10))
+    table = _Table([_Entry(id=1, eventId=str(pending), payload=_payload(pending, 12))])
+    service = OutboxService(
+        config=HowliteOutboxConfig(enabled=True),
+        howlite=cast("Any", howlite),
+        sapphire=cast("Any", _Sapphire(outboxentry=table)),
+    )
+
+    response = await service.current(m.CurrentRequest(ids=[pending, stored, missing]))
+
+    current = {
+        event_id: event.start.hour if event else None
+        for event_id, event in response.events.items()
+    }
+    assert current == {pending: 12, stored: 10, missing: None}
+
+
+@pytest.mark.asyncio
+async def test_drain_parks_invalid_payloads_with_earlier_entries() -> None:
+    """Test if parking updates earlier entries regardless of their attempts."""
+    broken = uuid4()
+    service, table, _ = _build(
+        [_Entry(id=1, eventId=str(broken), payload="not a calendar")]
+    )
+
+    await service.drain(m.DrainRequest(limit=10))
+
+    [update] = table.updates
+    assert update["where"] == {"eventId": str(broken), "id": {"lte": 1}}
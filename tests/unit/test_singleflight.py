@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from beaver.utils.singleflight import SingleFlight, flightkey
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_coalesced() -> None:
+    """Test if concurrent calls with the same key run the function once."""
+    flights = SingleFlight[str, int]()
+    release = asyncio.Event()
+    calls = 0
+
+    async def _function() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    first = asyncio.create_task(flights.do("key", _function))
+    second = asyncio.create_task(flights.do("key", _function))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == 1
+    assert await second == 1
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced() -> None:
+    """Test if calls with different keys run separately."""
+    flights = SingleFlight[str, str]()
+
+    async def _function(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        flights.do("a", lambda: _function("a")),
+        flights.do("b", lambda: _function("b")),
+    )
+
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_finished_calls_are_not_reused() -> None:
+    """Test if a call after the previous one finished runs the function again."""
+    flights = SingleFlight[str, int]()
+    calls = 0
+
+    async def _function() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flights.do("key", _function) == 1
+    assert await flights.do("key", _function) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_clear_starts_calls_anew() -> None:
+    """Test if calls after clearing don't join calls that started before."""
+    flights = SingleFlight[str, str]()
+    release = asyncio.Event()
+
+    async def _old() -> str:
+        await release.wait()
+        return "old"
+
+    async def _new() -> str:
+        return "new"
+
+    first = asyncio.create_task(flights.do("key", _old))
+    await asyncio.sleep(0)
+
+    flights.clear()
+
+    assert await flights.do("key", _new) == "new"
+
+    release.set()
+    assert await first == "old"
+
+
+@pytest.mark.asyncio
+async def test_forget_starts_calls_anew() -> None:
+    """Test if calls after forgetting a key don't join calls that started before."""
+    flights = SingleFlight[str, str]()
+    release = asyncio.Event()
+
+    async def _old() -> str:
+        await release.wait()
+        return "old"
+
+    async def _new() -> str:
+        return "new"
+
+    first = asyncio.create_task(flights.do("key", _old))
+    await asyncio.sleep(0)
+
+    flights.forget("key")
+
+    assert await flights.do("key", _new) == "new"
+
+    release.set()
+    assert await first == "old"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others() -> None:
+    """Test if cancelling one caller leaves the shared call running."""
+    flights = SingleFlight[str, str]()
+    release = asyncio.Event()
+
+    async def _function() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flights.do("key", _function))
+    second = asyncio.create_task(flights.do("key", _function))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared() -> None:
+    """Test if an error of the shared call is raised to all callers."""
+    flights = SingleFlight[str, str]()
+
+    async def _function() -> str:
+        await asyncio.sleep(0)
+        raise ValueError
+
+    results = await asyncio.gather(
+        flights.do("key", _function),
+        flights.do("key", _function),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_flightkey_ignores_mapping_order() -> None:
+    """Test if keys don't depend on the order of keys in mappings."""
+    assert flightkey("op", {"a": 1, "b": 2}) == flightkey("op", {"b": 2, "a": 1})
+
+
+def test_flightkey_distinguishes_arguments() -> None:
+    """Test if keys differ for different arguments."""
+    assert flightkey("op", 1, None) != flightkey("op", None, 1)
+    assert flightkey("op", {"id": "a"}) != flightkey("op", {"id": "b"})
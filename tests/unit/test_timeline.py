@@ -0,0 +1,116 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from beaver.config.models import TimelineConfig
+from beaver.services.data.howlite import models as hm
+from beaver.services.timeline import models as m
+from beaver.services.timeline.service import TimelineService
+
+AT = datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+
+@dataclass
+class _Howlite:
+    events: list[hm.Event] = field(default_factory=list)
+
+    async def query_events(
+        self, request: hm.QueryEventsRequest
+    ) -> hm.QueryEventsResponse:
+        return hm.QueryEventsResponse(events=self.events)
+
+
+def _event(number: int, start: timedelta, duration: timedelta) -> hm.Event:
+    return hm.Event(
+        id=UUID(int=number),
+        start=(AT + start).replace(tzinfo=None),
+        duration=duration,
+        timezone=ZoneInfo("UTC"),
+    )
+
+
+def _service(*events: hm.Event) -> TimelineService:
+    return TimelineService(
+        config=TimelineConfig(future=timedelta(days=2)),
+        howlite=cast("Any", _Howlite(events=list(events))),
+        outbox=cast("Any", None),
+    )
+
+
+def _numbers(instances: list[m.Instance]) -> list[int]:
+    return [UUID(instance.event_id).int for instance in instances]
+
+
+async def _now(service: TimelineService, limit: int) -> m.NowResponse:
+    return await service.now(m.NowRequest(at=AT, next=limit))
+
+
+@pytest.mark.asyncio
+async def test_current_includes_ongoing_instances() -> None:
+    """Test if instances that started and have not ended yet are current."""
+    service = _service(
+        _event(1, -timedelta(minutes=30), timedelta(hours=1)),
+        _event(2, timedelta(0), timedelta(hours=1)),
+        _event(3, -timedelta(hours=1), timedelta(hours=1)),
+        _event(4, timedelta(minutes=1), timedelta(hours=1)),
+    )
+
+    response = await _now(service, 0)
+
+    assert sorted(_numbers(list(response.current))) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_current_includes_long_instances() -> None:
+    """Test if an instance that started long before is still current."""
+    service = _service(
+        _event(1, -timedelta(hours=20), timedelta(days=1)),
+        _event(2, -timedelta(minutes=10), timedelta(minutes=5)),
+    )
+
+    response = await _now(service, 0)
+
+    assert _numbers(list(response.current)) == [1]
+
+
+@pytest.mark.asyncio
+async def test_current_excludes_empty_instances() -> None:
+    """Test if an instance without duration is never current."""
+    service = _service(_event(1, timedelta(0), timedelta(0)))
+
+    response = await _now(service, 1)
+
+    assert list(response.current) == []
+    assert list(response.next) == []
+
+
+@pytest.mark.asyncio
+async def test_next_is_ordered_and_limited() -> None:
+    """Test if only the first instances starting later are next, by start."""
+    service = _service(
+        _event(1, timedelta(hours=3), timedelta(hours=1)),
+        _event(2, timedelta(hours=1), timedelta(hours=1)),
+        _event(3, timedelta(hours=2), timedelta(hours=1)),
+        _event(4, timedelta(0), timedelta(hours=1)),
+    )
+
+    response = await _now(service, 2)
+
+    assert _numbers(list(response.next)) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_next_breaks_ties_by_event() -> None:
+    """Test if instances starting at the same time are ordered by event."""
+    service = _service(
+        _event(2, timedelta(hours=1), timedelta(hours=1)),
+        _event(1, timedelta(hours=1), timedelta(hours=2)),
+    )
+
+    response = await _now(service, 5)
+
+    assert _numbers(list(response.next)) == [1, 2]
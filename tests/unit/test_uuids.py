@@ -0,0 +1,16 @@
+from uuid import uuid4
+
+from beaver.utils.uuids import isuuid
+
+
+def test_valid_uuid() -> None:
+    """Test if a string with a UUID is valid."""
+    assert isuuid(str(uuid4()))
+
+
+def test_invalid_values() -> None:
+    """Test if values that are not strings with a UUID are invalid."""
+    assert not isuuid("not a uuid")
+    assert not isuuid(None)
+    assert not isuuid(42)
+    assert not isuuid({"in": []})